@@ -0,0 +1,74 @@
+"""
+Compara a vazão de cada tipo numérico (float, Decimal, Fraction).
+
+Mede as operações da calculadora isoladas e as teclas processadas pelo
+controlador sem interface gráfica, para cada tipo numérico.
+
+Uso:
+    python benchmarks/bench_backends.py [--number 200000] [--precision 28]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.backends import BACKENDS, create_calculator
+from controller.headless import HeadlessController
+
+KEYSTROKES = "1 2 . 5 + 7 * 3 - 4 0 % = sqrt C 9 / 3 =".split()
+
+
+def best_rate(statement, number: int, repeat: int = 5) -> float:
+    """Melhor vazão (execuções por segundo) entre as repetições."""
+    return number / min(timeit.repeat(statement, number=number, repeat=repeat))
+
+
+def bench(backend: str, precision: int | None, number: int) -> dict:
+    """Vazão das operações e das teclas para um tipo numérico."""
+    calc = create_calculator(backend, precision)
+    a, b = calc.parse("12.5"), calc.parse("3")
+    results = {}
+    for name in ("add", "multiply", "divide", "percent"):
+        method = getattr(calc, name)
+
+        def run(method=method):
+            calc.current_value = a
+            method(b)
+        results[name] = best_rate(run, number)
+
+    def run_sqrt():
+        calc.current_value = a
+        calc.sqrt()
+    results["sqrt"] = best_rate(run_sqrt, number)
+
+    controller = HeadlessController(create_calculator(backend, precision))
+    process_input = controller.process_input
+
+    def run_keys():
+        for key in KEYSTROKES:
+            process_input(key)
+    results["teclas"] = best_rate(run_keys, max(1, number // len(KEYSTROKES))) * len(KEYSTROKES)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão de cada tipo numérico da calculadora.")
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--precision", type=int, default=28, help="Dígitos do tipo decimal")
+    args = parser.parse_args()
+
+    results = {backend: bench(backend, args.precision if backend == "decimal" else None, args.number)
+               for backend in BACKENDS}
+    columns = list(results["float"])
+    print(f"{'':<10}" + "".join(f"{name:>14}" for name in columns) + "   (operações ou teclas por segundo)")
+    for backend, rates in results.items():
+        print(f"{backend:<10}" + "".join(f"{rates[name]:>14,.0f}" for name in columns))
+    for backend, rates in results.items():
+        if backend != "float":
+            print(f"{backend}: teclas {results['float']['teclas'] / rates['teclas']:.1f}x mais lento que float")
+
+
+if __name__ == "__main__":
+    main()
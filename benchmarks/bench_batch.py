@@ -0,0 +1,95 @@
+"""
+Benchmark do modo vetorizado (BatchCalculator) contra o laço escalar da Calculator.
+
+Uso:
+    python benchmarks/bench_batch.py [--sizes 1000000 10000000] [--ops add multiply ...]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+import numpy as np
+from model.batch import BatchCalculator
+from model.calculator import Calculator
+
+OPERATIONS = ["add", "subtract", "multiply", "divide", "sqrt", "percent"]
+
+
+def scalar_loop(method: str, a: list, b: list) -> list:
+    """
+    Aplica a operação elemento a elemento com uma única Calculator escalar.
+
+    Args:
+        method: Nome do método da Calculator.
+        a: Valores atuais de cada elemento.
+        b: Operandos de cada elemento (ignorado para sqrt).
+
+    Returns:
+        list: Resultado de cada elemento.
+    """
+    calc = Calculator()
+    operation = getattr(calc, method)
+    results = [0.0] * len(a)
+    if method == "sqrt":
+        for i, x in enumerate(a):
+            calc.current_value = x
+            results[i] = operation()
+    else:
+        for i, (x, y) in enumerate(zip(a, b)):
+            calc.current_value = x
+            results[i] = operation(y)
+    return results
+
+
+def vectorized(method: str, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Aplica a operação a todos os elementos em uma única chamada vetorizada.
+
+    Args:
+        method: Nome do método da BatchCalculator.
+        a: Valores atuais.
+        b: Operandos (ignorado para sqrt).
+
+    Returns:
+        np.ndarray: Resultados de todos os elementos.
+    """
+    batch = BatchCalculator(a)
+    if method == "sqrt":
+        return batch.sqrt()
+    return getattr(batch, method)(b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara o modo vetorizado com o laço escalar.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6, 10**7])
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=OPERATIONS)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'op':<10}{'n':>12}{'escalar (s)':>14}{'vetor (s)':>12}{'speedup':>10}")
+    for n in args.sizes:
+        a = rng.uniform(0, 1000, n)  # Valores não negativos para permitir sqrt
+        b = rng.uniform(1, 1000, n)  # Divisores nunca são zero
+        a_list, b_list = a.tolist(), b.tolist()
+
+        for method in args.ops:
+            start = time.perf_counter()
+            expected = scalar_loop(method, a_list, b_list)
+            scalar_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = vectorized(method, a, b)
+            vector_time = time.perf_counter() - start
+
+            # Garante que os dois caminhos produzem exatamente os mesmos resultados
+            if not np.array_equal(result, expected):
+                raise AssertionError(f"Resultados divergentes para '{method}' com n={n}")
+
+            print(f"{method:<10}{n:>12}{scalar_time:>14.3f}{vector_time:>12.4f}{scalar_time / vector_time:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark de escalabilidade do modo em lote por arquivo (src/batch_eval.py).
+
+Gera um CSV de linhas (a, op, b) e mede o tempo de avaliação com 1, 2, 4, ...
+processos, até a quantidade de núcleos, comparando com o processamento serial.
+
+Uso:
+    python benchmarks/bench_batch_eval.py [--rows 2000000] [--chunk-size 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from batch_eval import evaluate_file
+
+
+def generate(path: str, rows: int, seed: int = 0) -> None:
+    """Gera um CSV com `rows` linhas aleatórias, incluindo algumas inválidas."""
+    rng = random.Random(seed)
+    operators = ['+', '-', '*', '/', '%', 'sqrt']
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("a,op,b\n")
+        for _ in range(rows):
+            operator = rng.choice(operators)
+            b = "" if operator == "sqrt" else f"{rng.uniform(0, 100):.4f}"
+            f.write(f"{rng.uniform(-1000, 1000):.4f},{operator},{b}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalabilidade do batch_eval com o número de processos.")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "in.csv")
+        target = os.path.join(tmp, "out.csv")
+        generate(source, args.rows)
+        print(f"Linhas: {args.rows}, núcleos: {os.cpu_count()}")
+
+        start = time.perf_counter()
+        evaluate_file(source, target, workers=0, chunk_size=args.chunk_size)
+        serial = time.perf_counter() - start
+        print(f"{'serial':>10}: {serial:7.2f} s  {args.rows / serial:12,.0f} linhas/s")
+
+        workers = 1
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            evaluate_file(source, target, workers=workers, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>4} proc.: {elapsed:7.2f} s  {args.rows / elapsed:12,.0f} linhas/s"
+                  f"  speedup {serial / elapsed:5.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
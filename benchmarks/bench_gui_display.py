@@ -0,0 +1,71 @@
+"""
+Mede a latência tecla-pintura e os redesenhos evitados pela coalescência do display.
+
+Simula rajadas de teclas (como colar um número longo ou executar uma macro de
+teclado) disparadas dentro do loop do Tk, com e sem coalescência.
+Requer um display gráfico (X11, Wayland, Windows ou macOS).
+
+Uso:
+    python benchmarks/bench_gui_display.py [--bursts 50] [--burst-size 40]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from controller.controller import Controller
+from view.gui import Gui
+
+KEYS = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '.', '+', '-', '*', '/', '=']
+
+
+def run(coalesce: bool, bursts: int, burst_size: int, seed: int) -> Gui:
+    """
+    Executa as rajadas de teclas em uma janela real e devolve a Gui com as estatísticas.
+
+    Args:
+        coalesce: Ativa ou desativa a coalescência do display.
+        bursts: Quantidade de rajadas.
+        burst_size: Teclas por rajada.
+        seed: Semente das teclas geradas.
+    """
+    rng = random.Random(seed)
+    controller = Controller(Calculator())
+    gui = Gui(controller, coalesce=coalesce)
+    controller.set_gui(gui)
+
+    def burst(remaining: int):
+        for _ in range(burst_size):
+            try:
+                controller.process_input(rng.choice(KEYS))
+            except ValueError:
+                pass  # Operador sobre mensagem de erro, ignorado como no Tk
+        if remaining > 1:
+            gui.window.after(5, burst, remaining - 1)
+        else:
+            gui.window.after(50, gui.window.quit)
+
+    gui.window.after(100, burst, bursts)
+    gui.start()
+    gui.window.destroy()
+    return gui
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara o display com e sem coalescência.")
+    parser.add_argument("--bursts", type=int, default=50)
+    parser.add_argument("--burst-size", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for coalesce in (False, True):
+        gui = run(coalesce, args.bursts, args.burst_size, args.seed)
+        label = "com coalescência" if coalesce else "sem coalescência"
+        print(f"{label:<18} {gui.display_stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
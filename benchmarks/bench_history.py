@@ -0,0 +1,85 @@
+"""
+Memória e velocidade do histórico de operações (src/model/history.py).
+
+Registra `--entries` operações e mostra:
+
+    - memória por milhão de entradas do HistoryTape (arrays tipados) e de uma
+      lista de tuplas (a, op, b, result, error) com os mesmos dados
+    - custo por registro, por desfazer e por refazer
+    - tempo de exportação para o formato colunar e para CSV
+
+Uso:
+    python benchmarks/bench_history.py [--entries 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.history import HistoryTape
+
+
+def peak_memory(function) -> int:
+    """Pico de memória alocada durante `function` (o resultado é descartado depois)."""
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória e velocidade do histórico de operações.")
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.entries
+    per_million = 1_000_000 / n / 2**20
+
+    def fill_tape():
+        tape = HistoryTape(capacity=n)
+        for i in range(n):
+            tape.record(i * 0.5, '+', 1.25, i * 0.5 + 1.25)
+        return tape
+
+    def fill_list():
+        return [(i * 0.5, '+', 1.25, i * 0.5 + 1.25, 0) for i in range(n)]
+
+    list_peak = peak_memory(fill_list)
+    tape_peak = peak_memory(fill_tape)
+    start = time.perf_counter()   # Tempo medido sem o tracemalloc, que deixa as alocações mais lentas
+    tape = fill_tape()
+    record_elapsed = time.perf_counter() - start
+    print(f"Entradas: {n:,}")
+    print(f"{'HistoryTape':<22} {tape.memory_bytes() * per_million:8.1f} MiB/milhão "
+          f"(pico {tape_peak * per_million:.1f})   registro {record_elapsed / n * 1e9:6.0f} ns")
+    print(f"{'lista de tuplas':<22} {list_peak * per_million:8.1f} MiB/milhão")
+
+    start = time.perf_counter()
+    while tape.undo() is not None:
+        pass
+    undo = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    while tape.redo() is not None:
+        pass
+    redo = (time.perf_counter() - start) / n
+    print(f"{'desfazer / refazer':<22} {undo * 1e9:8.0f} ns / {redo * 1e9:.0f} ns por operação")
+
+    tape.record(1.0, '*', 2.0, 2.0)   # Buffer cheio: dá a volta no buffer circular
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, export, name in (("exportação colunar", tape.to_columnar, "historico.calc"),
+                                    ("exportação CSV", tape.to_csv, "historico.csv")):
+            path = os.path.join(tmp, name)
+            start = time.perf_counter()
+            export(path)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<22} {elapsed * 1e3:8.1f} ms   ({os.path.getsize(path) / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
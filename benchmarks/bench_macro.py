@@ -0,0 +1,68 @@
+"""
+Compara três formas de aplicar a mesma sequência de teclas a muitos operandos.
+
+    - reprodução: digita o operando e a sequência em Controller.process_input
+    - macro escalar: a função compilada pela gravação, chamada por operando
+    - macro vetorizada: a mesma macro aplicada ao array inteiro (macro.apply)
+
+Uso:
+    python benchmarks/bench_macro.py [--operands 100000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from controller.headless import HeadlessController
+
+SEQUENCE = "* 1 . 0 7 - 3 0 % + 2 . 5 / 4 =".split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reprodução de teclas vs. macro compilada.")
+    parser.add_argument("--operands", type=int, default=100_000)
+    args = parser.parse_args()
+
+    operands = np.random.default_rng(0).uniform(1, 1000, args.operands).round(2)
+    texts = [str(value) for value in operands]
+
+    controller = HeadlessController(Calculator())
+    controller.start_recording()
+    for key in list(texts[0]) + SEQUENCE:
+        controller.process_input(key)
+    macro = controller.stop_recording()
+
+    start = time.perf_counter()
+    replayed = []
+    for text in texts:
+        controller.process_input('C')
+        for key in text:
+            controller.process_input(key)
+        for key in SEQUENCE:
+            controller.process_input(key)
+        replayed.append(controller._display_value())
+    replay = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar_results = [macro(value) for value in operands.tolist()]
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values, _ = macro.apply(operands)
+    vectorized = time.perf_counter() - start
+
+    assert scalar_results == replayed == values.tolist()
+    print(f"Operandos: {args.operands:,}  Sequência: {' '.join(SEQUENCE)}")
+    for label, elapsed in (("reprodução das teclas", replay), ("macro escalar", scalar),
+                           ("macro vetorizada", vectorized)):
+        print(f"{label:<24} {elapsed * 1e3:10.1f} ms  ({args.operands / elapsed:14,.0f} operandos/s, "
+              f"{replay / elapsed:7.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Mede o custo da instrumentação do controlador, ligada e desligada.
+
+Compara a vazão de teclas chamando diretamente o corpo de process_input
+(sem nenhum gancho de instrumentação), process_input com as métricas
+desligadas e process_input com as métricas ligadas.
+
+Uso:
+    python benchmarks/bench_metrics.py [--keystrokes 1000000]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from controller.headless import HeadlessController
+
+KEYSTROKES = "1 2 . 5 + 7 * 3 - 4 0 % = sqrt C 9 / 3 =".split()
+
+
+def rate(process, keystrokes: int, repeat: int = 5) -> float:
+    """Melhor vazão, em teclas por segundo, entre as repetições."""
+    rounds = max(1, keystrokes // len(KEYSTROKES))
+
+    def run():
+        for key in KEYSTROKES:
+            process(key)
+    return rounds * len(KEYSTROKES) / min(timeit.repeat(run, number=rounds, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo da instrumentação do controlador.")
+    parser.add_argument("--keystrokes", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    controller = HeadlessController(Calculator())
+    direct = rate(controller._handle_input, args.keystrokes)
+    disabled = rate(controller.process_input, args.keystrokes)
+    controller.enable_metrics()
+    enabled = rate(controller.process_input, args.keystrokes)
+
+    print(f"{'sem gancho (referência)':<26} {direct:12,.0f} teclas/s")
+    print(f"{'métricas desligadas':<26} {disabled:12,.0f} teclas/s  ({(direct / disabled - 1):+.1%} de custo)")
+    print(f"{'métricas ligadas':<26} {enabled:12,.0f} teclas/s  ({(direct / enabled - 1):+.1%} de custo)")
+    print(f"Custo por tecla: desligadas {1e9 / disabled - 1e9 / direct:.0f} ns, "
+          f"ligadas {1e9 / enabled - 1e9 / direct:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
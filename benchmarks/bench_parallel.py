@@ -0,0 +1,66 @@
+"""
+Benchmark de escalabilidade da avaliação paralela em memória compartilhada (src/model/parallel.py).
+
+Preenche um SharedBatch com `--rows` linhas de operadores variados e mede a
+avaliação com 1, 2, 4, ... processos, até a quantidade de núcleos, comparando
+com a avaliação no próprio processo. O pool é criado uma vez por quantidade de
+processos, fora da medição, e só o nome do bloco e os limites das fatias
+trafegam entre os processos.
+
+Uso:
+    python benchmarks/bench_parallel.py [--rows 20000000] [--max-workers 8]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.opcodes import OPERATORS
+from model.parallel import SharedBatch
+
+
+def timed(function, repeat: int = 3) -> float:
+    """Menor tempo de `function` entre as repetições."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalabilidade da avaliação em memória compartilhada.")
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with SharedBatch.create(args.rows) as batch:
+        batch.a[:] = rng.uniform(-1000, 1000, args.rows)
+        batch.b[:] = rng.uniform(0, 100, args.rows).round(1)   # Alguns divisores zero
+        batch.op[:] = rng.integers(0, len(OPERATORS), args.rows, dtype=np.uint8)
+        print(f"Linhas: {args.rows:,}, núcleos: {os.cpu_count()}, "
+              f"bloco compartilhado: {batch.memory.size / 2**20:,.0f} MiB")
+
+        serial = timed(lambda: batch.evaluate(workers=0))
+        print(f"{'no processo':>12}: {serial:7.3f} s  {args.rows / serial:14,.0f} linhas/s")
+
+        workers = 1
+        while workers <= args.max_workers:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                batch.evaluate(workers=workers, executor=pool)    # Aquece os processos
+                elapsed = timed(lambda: batch.evaluate(workers=workers, executor=pool))
+            print(f"{workers:>6} proc.: {elapsed:7.3f} s  {args.rows / elapsed:14,.0f} linhas/s"
+                  f"  speedup {serial / elapsed:5.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
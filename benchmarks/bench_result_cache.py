@@ -0,0 +1,89 @@
+"""
+Mede se o cache persistente de resultados (src/model/result_cache.py) compensa o custo de I/O.
+
+Avalia `--requests` expressões sorteadas (com repetição, distribuição de Zipf)
+de um conjunto de `--distinct` expressões:
+
+    - sem cache (ExpressionEngine direto)
+    - cache frio: primeira execução, arquivo vazio
+    - cache quente: nova execução (nova conexão) sobre o arquivo já preenchido
+    - `--processes` processos lendo o cache quente ao mesmo tempo
+
+Para cada caso, mostra o tempo por expressão, a taxa de acertos e a fração do
+tempo gasta no SQLite.
+
+Uso:
+    python benchmarks/bench_result_cache.py [--requests 50000] [--distinct 5000] [--processes 2]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.expression import ExpressionEngine
+from model.result_cache import ResultCache, expression_key
+
+
+def workload(requests: int, distinct: int, seed: int = 0) -> list[str]:
+    """Expressões com repetição: poucas muito frequentes, muitas raras (Zipf)."""
+    rng = random.Random(seed)
+    pool = [f"({rng.randint(1, 999)}.{rng.randint(0, 99)}+{rng.randint(1, 99)})*sqrt({rng.randint(1, 9999)})"
+            f"/{rng.randint(1, 50)}-{rng.randint(0, 100)}%" for _ in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(pool, weights, k=requests)
+
+
+def run(expressions: list[str], path: str | None) -> tuple[float, dict | None]:
+    """Avalia as expressões, com ou sem cache; retorna o tempo total e as estatísticas."""
+    engine = ExpressionEngine()
+    start = time.perf_counter()
+    if path is None:
+        for expression in expressions:
+            engine.evaluate(expression)
+        return time.perf_counter() - start, None
+    cache = ResultCache(path)
+    for expression in expressions:
+        cache.get_or_compute(expression_key(expression), lambda: engine.evaluate(expression))
+    cache.close()
+    return time.perf_counter() - start, cache.stats()
+
+
+def report(label: str, elapsed: float, count: int, stats: dict | None) -> None:
+    line = f"{label:<24} {elapsed / count * 1e6:8.2f} µs/expressão"
+    if stats is not None:
+        line += f"   acertos {stats['hit_rate']:6.1%}   SQLite {stats['io_seconds'] / elapsed:6.1%} do tempo"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo e benefício do cache persistente de resultados.")
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--distinct", type=int, default=5_000)
+    parser.add_argument("--processes", type=int, default=2)
+    args = parser.parse_args()
+
+    expressions = workload(args.requests, args.distinct)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        report("sem cache", *run(expressions, None)[:1], args.requests, None)
+        elapsed, stats = run(expressions, path)
+        report("cache frio", elapsed, args.requests, stats)
+        elapsed, stats = run(expressions, path)
+        report("cache quente", elapsed, args.requests, stats)
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(run, [expressions] * args.processes, [path] * args.processes))
+            elapsed = time.perf_counter() - start
+        hits = sum(stats["hits"] for _, stats in results)
+        print(f"{f'{args.processes} processos (quente)':<24} {elapsed / (args.requests * args.processes) * 1e6:8.2f} "
+              f"µs/expressão   acertos {hits / (args.requests * args.processes):6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark das operações científicas: modo vetorizado (model.batch.evaluate) contra o laço escalar.
+
+O laço escalar aplica a função pura de cada linha e trata os erros linha a
+linha (NaN e o código da exceção), como a avaliação colunar escalar. Cerca de
+1% das linhas cai fora do domínio, para que o custo dos erros entre na conta.
+
+Uso:
+    python benchmarks/bench_scientific.py [--sizes 1000000] [--ops ^ root log ...]
+"""
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+import numpy as np
+from model.batch import evaluate
+from model.exceptions import OPERATION_ERRORS
+from model.opcodes import OPERATORS, OPCODES, UNARY_OPERATORS
+from model.operations import DISPATCH
+
+SCIENTIFIC = list(OPERATORS[OPCODES['^']:])
+
+
+def operands(operator: str, n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Operandos típicos de cada operação, com ~1% de linhas fora do domínio."""
+    if operator == '!':
+        a = rng.integers(0, 60, n).astype(np.float64)              # Fatoriais inteiros (tabela)
+        a[::100] += 0.5                                             # e alguns fracionários (gama)
+    elif operator in ('sin', 'cos', 'tan'):
+        a = rng.uniform(-10, 10, n)
+    elif operator == 'exp':
+        a = rng.uniform(-50, 50, n)
+    else:
+        a = rng.uniform(0.001, 1000, n)
+    b = rng.integers(1, 6, n).astype(np.float64) if operator in ('^', 'root') else np.full(n, np.nan)
+    invalid = rng.random(n) < 0.01
+    if operator in ('log', 'ln', '!', 'root'):
+        a[invalid] = -np.floor(a[invalid]) - 2                      # Negativos (inteiros no fatorial)
+        if operator == 'root':
+            b[invalid] = 2                                          # Raiz par de negativo
+    elif operator == '^':
+        a[invalid], b[invalid] = -2.0, 0.5                          # Base negativa, expoente fracionário
+    elif operator == 'exp':
+        a[invalid] = 1000.0                                         # Estouro
+    return a, b
+
+
+def scalar_loop(operator: str, a: list, b: list) -> tuple[list, list]:
+    """Aplica a função pura linha a linha, com NaN e o código do erro nas linhas inválidas."""
+    operation = DISPATCH[operator]
+    results, errors = [0.0] * len(a), [0] * len(a)
+    unary = operator in UNARY_OPERATORS
+    for i, (x, y) in enumerate(zip(a, b)):
+        try:
+            results[i] = operation(x, None if unary else y)
+        except OPERATION_ERRORS as e:
+            results[i] = math.nan
+            errors[i] = e.code
+    return results, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara as operações científicas vetorizadas com o laço escalar.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6])
+    parser.add_argument("--ops", nargs="+", choices=SCIENTIFIC, default=SCIENTIFIC)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'op':<7}{'n':>10}{'escalar (Mop/s)':>17}{'vetor (Mop/s)':>15}{'speedup':>10}{'erros':>8}")
+    for n in args.sizes:
+        for operator in args.ops:
+            a, b = operands(operator, n, rng)
+            a_list, b_list = a.tolist(), b.tolist()
+
+            start = time.perf_counter()
+            expected, expected_errors = scalar_loop(operator, a_list, b_list)
+            scalar_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result, errors = evaluate(operator, a, b)
+            vector_time = time.perf_counter() - start
+
+            # Os dois caminhos devem marcar os mesmos erros e produzir os mesmos valores
+            # (a menos do último bit nas funções transcendentes)
+            if not np.array_equal(errors, expected_errors) or \
+                    not np.allclose(result, expected, rtol=1e-14, atol=0, equal_nan=True):
+                raise AssertionError(f"Resultados divergentes para '{operator}' com n={n}")
+
+            print(f"{operator:<7}{n:>10}{n / scalar_time / 1e6:>17.2f}{n / vector_time / 1e6:>15.1f}"
+                  f"{scalar_time / vector_time:>9.0f}x{np.count_nonzero(errors):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Compara a memória por sessão do SessionManager com um par Calculator + Controller por usuário.
+
+Uso:
+    python benchmarks/bench_sessions.py [--sessions 100000]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from controller.controller import Controller
+from controller.headless import HeadlessDisplay
+from controller.sessions import SessionManager
+
+# Teclas aplicadas a cada sessão, deixando um número em digitação e um operador pendente
+KEYS = "1 2 . 5 + 7".split()
+
+
+class DisplaySink(HeadlessDisplay):
+    """Display sem GUI que também responde a `display_var.get()`, como o Controller espera."""
+
+    @property
+    def display_var(self):
+        return self
+
+    def get(self) -> str:
+        return self.text
+
+
+def measure(build) -> tuple[int, object]:
+    """
+    Mede a memória alocada por `build()` com tracemalloc.
+
+    Returns:
+        tuple: Bytes alocados e o objeto construído (mantido vivo durante a medição).
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated, result
+
+
+def build_objects(n: int) -> list:
+    """Cria `n` pares Calculator + Controller, cada um com seu display sem GUI."""
+    controllers = []
+    for _ in range(n):
+        controller = Controller(Calculator())
+        controller.set_gui(DisplaySink())
+        for key in KEYS:
+            controller.process_input(key)
+        controllers.append(controller)
+    return controllers
+
+
+def build_sessions(n: int) -> tuple[SessionManager, list]:
+    """Cria `n` sessões em um único SessionManager."""
+    manager = SessionManager()
+    sessions = [manager.open() for _ in range(n)]
+    for session in sessions:
+        for key in KEYS:
+            manager.process_input(session, key)
+    return manager, sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por sessão: objetos vs. SessionManager.")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.sessions
+
+    objects_bytes, _ = measure(lambda: build_objects(n))
+    sessions_bytes, (manager, sessions) = measure(lambda: build_sessions(n))
+    # A lista de identificadores pertence ao chamador, não ao gerenciador
+    sessions_bytes -= sys.getsizeof(sessions) + sum(sys.getsizeof(s) for s in sessions)
+
+    print(f"Sessões: {n}")
+    print(f"Calculator + Controller: {objects_bytes / n:8.1f} bytes/sessão")
+    print(f"SessionManager:          {sessions_bytes / n:8.1f} bytes/sessão")
+
+    start = time.perf_counter()
+    for session in sessions:
+        for key in ("*", "3", "="):
+            manager.process_input(session, key)
+    elapsed = time.perf_counter() - start
+    print(f"Vazão do SessionManager: {3 * n / elapsed:,.0f} teclas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark do núcleo sem estado (src/model/operations.py) em um pool de threads.
+
+Cada thread aplica `--ops` operações a uma única Calculator compartilhada de
+três formas:
+
+    - trava: métodos com estado (current_value) protegidos por um Lock, o que
+      era necessário para compartilhar a instância antes do núcleo sem estado
+    - apply: `calculator.apply(op, a, b)`, sem estado e sem trava
+    - tabela: a função buscada uma vez na tabela de despacho por opcode
+
+Com o GIL, as threads não rodam Python em paralelo e o ganho vem só da
+ausência da trava; em um CPython free-threaded (3.13t ou superior) as
+variantes sem trava escalam com o número de núcleos.
+
+Uso:
+    python benchmarks/bench_threads.py [--ops 200000] [--max-threads 8]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from model.opcodes import OPCODES
+from model.operations import OPERATIONS
+
+OPERATORS = ('+', '-', '*', '/')
+
+
+def locked(calc: Calculator, lock: threading.Lock, ops: int) -> float:
+    """Operações pelos métodos com estado, com a instância protegida por uma trava."""
+    methods = (calc.add, calc.subtract, calc.multiply, calc.divide)
+    total = 0.0
+    for i in range(ops):
+        with lock:
+            calc.current_value = float(i)
+            total += methods[i & 3](1.5)
+    return total
+
+
+def stateless(calc: Calculator, lock: threading.Lock, ops: int) -> float:
+    """Operações por `Calculator.apply`, sem estado e sem trava."""
+    apply = calc.apply
+    total = 0.0
+    for i in range(ops):
+        total += apply(OPERATORS[i & 3], float(i), 1.5)
+    return total
+
+
+def table(calc: Calculator, lock: threading.Lock, ops: int) -> float:
+    """Operações pela tabela de despacho por opcode, sem estado e sem trava."""
+    operations = [OPERATIONS[OPCODES[operator]] for operator in OPERATORS]
+    total = 0.0
+    for i in range(ops):
+        total += operations[i & 3](float(i), 1.5)
+    return total
+
+
+def run(function, threads: int, ops: int) -> float:
+    """Operações por segundo com `threads` threads dividindo a mesma Calculator."""
+    calc, lock = Calculator(), threading.Lock()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        totals = list(pool.map(function, [calc] * threads, [lock] * threads, [ops] * threads))
+        elapsed = time.perf_counter() - start
+    assert len(set(totals)) == 1, "resultados diferentes entre as threads"
+    return threads * ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Núcleo sem estado em um pool de threads.")
+    parser.add_argument("--ops", type=int, default=200_000, help="Operações por thread")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"Python {sys.version.split()[0]}, GIL {'ligado' if gil else 'desligado'}, núcleos: {os.cpu_count()}")
+    print(f"{'threads':>8} {'trava':>14} {'apply':>14} {'tabela':>14}  (operações/s)")
+    threads = 1
+    while threads <= max(args.max_threads, 1):
+        rates = [run(function, threads, args.ops) for function in (locked, stateless, table)]
+        print(f"{threads:>8} " + " ".join(f"{rate:14,.0f}" for rate in rates))
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
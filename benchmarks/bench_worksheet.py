@@ -0,0 +1,91 @@
+"""
+Benchmark da planilha incremental (src/model/worksheet.py) com ~100 mil células.
+
+A planilha tem `--products` produtos; cada um tem um preço (valor fixo) e uma
+cadeia de `--steps` células de reajuste a partir de `preço * câmbio`, e uma
+célula final soma os últimos passos de todos os produtos. Mede:
+
+    - construção e cálculo inicial da planilha inteira
+    - edição de um preço (recalcula só a cadeia do produto e a soma)
+    - edição com o mesmo valor (nada a recalcular)
+    - edição do câmbio (afeta todas as células: equivale ao recálculo completo)
+
+Uso:
+    python benchmarks/bench_worksheet.py [--products 1000] [--steps 99]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.worksheet import Worksheet
+
+
+def build(products: int, steps: int) -> Worksheet:
+    """Monta a planilha descrita no cabeçalho."""
+    sheet = Worksheet()
+    sheet.set_value("cambio", 5.0)
+    for i in range(products):
+        sheet.set_value(f"p{i}", 10.0 + i)
+        sheet.set_formula(f"c{i}_0", "*", f"p{i}", "cambio")
+        for k in range(1, steps):
+            sheet.set_formula(f"c{i}_{k}", "*", f"c{i}_{k - 1}", 1.001)
+    sheet.set_formula("total", "+", *(f"c{i}_{steps - 1}" for i in range(products)))
+    return sheet
+
+
+def timed(function, repeat: int = 5) -> tuple[float, int]:
+    """Mediana do tempo de `function` e o valor retornado pela última execução."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recálculo incremental da planilha.")
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=99)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sheet = build(args.products, args.steps)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    initial = sheet.recalculate()
+    full = time.perf_counter() - start
+    print(f"Células: {len(sheet):,}")
+    print(f"{'construção':<28} {built * 1e3:10.1f} ms")
+    print(f"{'cálculo inicial':<28} {full * 1e3:10.1f} ms  ({initial:,} células)")
+
+    prices = iter(range(1, 1_000_000))
+
+    def edit_price():
+        sheet.set_value("p0", float(next(prices)))
+        return sheet.recalculate()
+
+    def edit_same():
+        sheet.set_value("p1", 11.0)
+        return sheet.recalculate()
+
+    rates = iter(range(6, 1_000_000))
+
+    def edit_rate():
+        sheet.set_value("cambio", float(next(rates)))
+        return sheet.recalculate()
+
+    for label, function in (("edição de um preço", edit_price),
+                            ("edição sem mudança", edit_same),
+                            ("edição do câmbio (tudo)", edit_rate)):
+        elapsed, recomputed = timed(function)
+        print(f"{label:<28} {elapsed * 1e3:10.3f} ms  ({recomputed:,} células, "
+              f"{elapsed / full:.2%} do cálculo completo)")
+
+
+if __name__ == "__main__":
+    main()
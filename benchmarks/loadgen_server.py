@@ -0,0 +1,128 @@
+"""
+Gerador de carga para o serviço TCP da calculadora (src/server.py).
+
+Abre várias conexões em localhost, envia requisições em pipeline e mede a
+latência de cada uma (do envio até a resposta) e a vazão total.
+Sem --port, inicia o servidor no próprio processo em uma porta livre.
+
+Uso:
+    python benchmarks/loadgen_server.py [--connections 16] [--requests 20000] [--pipeline 32]
+    python benchmarks/loadgen_server.py --port 8765   # contra um servidor já em execução
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from server import CalculatorService
+
+
+def make_requests(count: int, seed: int) -> list[bytes]:
+    """
+    Gera uma mistura de operações únicas, teclas e expressões.
+
+    Args:
+        count: Quantidade de requisições.
+        seed: Semente para reprodutibilidade.
+    """
+    rng = random.Random(seed)
+    requests = []
+    for i in range(count):
+        a, b = rng.randint(1, 999), rng.randint(1, 99)
+        kind = i % 3
+        if kind == 0:
+            request = {"op": rng.choice("+-*/"), "a": a, "b": b}
+        elif kind == 1:
+            request = {"keys": f"{' '.join(str(a))} {rng.choice('+-*/')} {' '.join(str(b))} ="}
+        else:
+            request = {"expr": f"{a}*({b}+{a})/sqrt({b})"}
+        requests.append(json.dumps(request).encode() + b"\n")
+    return requests
+
+
+async def run_connection(host: str, port: int, requests: list[bytes], pipeline: int, latencies: list) -> None:
+    """
+    Envia as requisições em uma conexão, mantendo até `pipeline` sem resposta.
+
+    Args:
+        host: Endereço do servidor.
+        port: Porta do servidor.
+        requests: Linhas a serem enviadas.
+        pipeline: Requisições em voo, no máximo.
+        latencies: Lista onde as latências (segundos) são acumuladas.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    window = asyncio.Semaphore(pipeline)
+    sent = deque()
+
+    async def send():
+        for line in requests:
+            await window.acquire()
+            sent.append(time.perf_counter())
+            writer.write(line)
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in requests:
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent.popleft())
+        window.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Retorna o percentil de uma lista já ordenada."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def main_async(args) -> None:
+    server = None
+    port = args.port
+    if port is None:
+        service = CalculatorService()
+        server = await asyncio.start_server(
+            lambda r, w: service.handle_connection(r, w, args.pipeline), args.host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    per_connection = args.requests // args.connections
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_connection(args.host, port, make_requests(per_connection, seed), args.pipeline, latencies)
+        for seed in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    latencies.sort()
+    print(f"Conexões: {args.connections}, pipeline: {args.pipeline}, requisições: {len(latencies)}")
+    print(f"Vazão: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"Latência p50: {percentile(latencies, 0.50) * 1000:.3f} ms")
+    print(f"Latência p99: {percentile(latencies, 0.99) * 1000:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerador de carga para o serviço TCP da calculadora.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Porta de um servidor já em execução")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20000, help="Total de requisições")
+    parser.add_argument("--pipeline", type=int, default=32, help="Requisições em voo por conexão")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Teste de carga em malha fechada: muitos usuários simulados digitando em controladores no mesmo processo.
+
+Cada usuário tem seu próprio HeadlessController, com um display que descarta
+o texto, e digita uma sequência realista de teclas dos botões da GUI
+(Gui._create_widgets): números inteiros e decimais, operadores sorteados
+conforme `--mix`, `%`, `sqrt`, `=` e `C`. Uma fração `--error-rate` das contas
+termina em erro (divisão por zero ou raiz de número negativo), seguida de `C`.
+
+Malha fechada: cada usuário só agenda a próxima tecla depois que a anterior
+foi processada, com um tempo de reflexão exponencial cuja média mantém a
+taxa total em `--rate` teclas/s (0 = sem pausa, saturação). A latência de
+uma tecla vai do instante agendado até o fim do processamento; inclui,
+portanto, a espera atrás das teclas de outros usuários quando o processo
+não dá conta da taxa (e os atrasos do escalonador do sistema operacional).
+O "processamento" é só a chamada a `process_input`; a capacidade estimada
+divide o número de usuários pela fração do tempo gasta nela.
+
+Tudo é determinado pela semente: as sequências de teclas e os tempos de
+reflexão de cada usuário vêm de um gerador próprio, e a assinatura final
+(dos textos dos displays) é igual entre execuções com os mesmos parâmetros.
+
+Uso:
+    python benchmarks/loadtest.py [--users 1000] [--keys 200] [--rate 20000] [--seed 0]
+    python benchmarks/loadtest.py --mix "+:4,-:3,*:2,/:2,%:1,sqrt:1" --error-rate 0.05
+"""
+import argparse
+import gc
+import hashlib
+import heapq
+import math
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from controller.headless import HeadlessController, KEYS
+
+# Teclas dos botões da GUI, separadas por papel
+DIGITS = tuple(key for key in KEYS if key.isdigit())
+OPERATORS = tuple(key for key in KEYS if key in ('+', '-', '*', '/', '%', 'sqrt'))
+BINARY = ('+', '-', '*', '/')
+
+DEFAULT_MIX = "+:4,-:3,*:2,/:2,%:1,sqrt:1"
+
+
+class NullDisplay:
+    """Display que descarta o texto: o controlador formata o valor, mas nada é desenhado."""
+
+    def update_display(self, text: str) -> None:
+        pass
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """
+    Converte "+:4,-:3,sqrt:1" em pesos por operador.
+
+    Raises:
+        ValueError: Se um operador não for um botão da GUI, um peso não for um número
+                    finito não negativo ou nenhum operador binário tiver peso positivo.
+    """
+    mix = {}
+    for item in text.split(","):
+        operator, _, weight = item.strip().rpartition(":")
+        if operator not in OPERATORS:
+            raise ValueError(f"Operador desconhecido no mix: {operator!r}")
+        try:
+            mix[operator] = float(weight)
+        except ValueError:
+            raise ValueError(f"Peso inválido no mix: {item!r}") from None
+        if not 0 <= mix[operator] < math.inf:   # Também recusa nan
+            raise ValueError(f"Peso negativo ou não finito no mix: {item!r}")
+    if not any(mix.get(operator, 0) > 0 for operator in BINARY):
+        raise ValueError("O mix precisa de ao menos um operador binário (+, -, *, /).")
+    return mix
+
+
+def number_keys(rng: random.Random, low: int = 1, high: int = 9999) -> list[str]:
+    """Teclas de um número positivo, às vezes com até duas casas decimais."""
+    keys = list(str(rng.randint(low, high)))
+    if rng.random() < 0.3:
+        keys.append('.')
+        keys.extend(rng.choice(DIGITS) for _ in range(rng.randint(1, 2)))
+    return keys
+
+
+def keystrokes(rng: random.Random, mix: dict[str, float], error_rate: float, errors: list):
+    """
+    Gera indefinidamente as teclas de um usuário, uma conta por vez.
+
+    Uma conta normal é um número seguido de um a três operadores do mix
+    (`sqrt` e `%` aplicados ao número recém-digitado) e termina em `=`; às
+    vezes o usuário continua a partir do resultado ou limpa com `C`. Com
+    probabilidade `error_rate`, a conta é uma divisão por zero ou a raiz de um
+    resultado negativo, seguida de `C` (um operador sobre a mensagem de erro
+    seria rejeitado, como na GUI).
+
+    Args:
+        rng: Gerador do usuário (determina toda a sequência).
+        mix: Pesos por operador (ver `parse_mix`).
+        error_rate: Fração das contas que terminam em erro.
+        errors: Lista de um elemento onde as contas com erro são contadas.
+    """
+    binary = [operator for operator in BINARY if mix.get(operator, 0) > 0]
+    binary_weights = [mix[operator] for operator in binary]
+    unary = [operator for operator in ('%', 'sqrt') if mix.get(operator, 0) > 0]
+    unary_chance = sum(mix.get(operator, 0) for operator in unary) / sum(mix.values())
+    continuing = False   # O display mostra um resultado válido que a próxima conta pode reaproveitar
+    while True:
+        if rng.random() < error_rate:
+            continuing = False
+            errors[0] += 1
+            if rng.random() < 0.5:
+                yield from number_keys(rng)
+                yield from ('/', '0', '=', 'C')
+            else:
+                a = rng.randint(1, 999)
+                yield from str(a)
+                yield '-'
+                yield from str(a + rng.randint(1, 999))
+                yield from ('=', 'sqrt', 'C')
+            continue
+
+        if not continuing:
+            yield from number_keys(rng)
+        for _ in range(rng.randint(1, 3)):
+            yield rng.choices(binary, binary_weights)[0]
+            yield from number_keys(rng, high=999)
+            if unary and rng.random() < unary_chance:
+                yield rng.choice(unary)
+        yield '='
+        draw = rng.random()
+        continuing = draw < 0.25
+        if draw > 0.8:
+            yield 'C'
+
+
+def build_users(count: int) -> list[HeadlessController]:
+    """Cria um controlador (com sua calculadora e display descartável) por usuário."""
+    return [HeadlessController(Calculator(), NullDisplay()) for _ in range(count)]
+
+
+def session_bytes(count: int) -> float:
+    """Memória alocada por sessão (Calculator + HeadlessController + display), medida com tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    users = build_users(count)
+    for controller in users:
+        for key in "1 2 . 5 + 7".split():   # Estado típico: operador pendente e número em digitação
+            controller.process_input(key)
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - sys.getsizeof(users)
+    tracemalloc.stop()
+    return allocated / count
+
+
+def wait_until(deadline: float) -> None:
+    """Dorme até perto de `deadline` e espera o restante ativamente, para não atrasar a tecla."""
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def run(users: int, keys: int, rate: float, mix: dict[str, float], error_rate: float, seed: int) -> dict:
+    """
+    Executa o teste de carga e retorna as medições.
+
+    Args:
+        users: Quantidade de usuários (controladores) simultâneos.
+        keys: Teclas digitadas por usuário.
+        rate: Taxa total alvo, em teclas/s (0 = sem tempo de reflexão).
+        mix: Pesos por operador.
+        error_rate: Fração das contas que terminam em erro.
+        seed: Semente de toda a execução.
+    """
+    controllers = build_users(users)
+    rngs = [random.Random(f"{seed}-{user}") for user in range(users)]
+    errors = [0]
+    streams = [keystrokes(rng, mix, error_rate, errors) for rng in rngs]
+    mean_think = users / rate if rate > 0 else 0.0
+
+    def think(user: int) -> float:
+        return rngs[user].expovariate(1 / mean_think) if mean_think else 0.0
+
+    total = users * keys
+    latency = array('d', bytes(8 * total))   # Do instante agendado ao fim do processamento
+    service = array('d', bytes(8 * total))   # Só o processamento da tecla
+    remaining = [keys] * users
+    start = time.perf_counter()
+    # Os usuários começam espalhados ao longo de um tempo de reflexão
+    queue = [(start + think(user), user) for user in range(users)]
+    heapq.heapify(queue)
+    steady = None   # (teclas, instante) quando o primeiro usuário termina
+    for i in range(total):
+        scheduled, user = queue[0]
+        if scheduled > time.perf_counter():
+            wait_until(scheduled)
+        key = next(streams[user])
+        begin = time.perf_counter()
+        controllers[user].process_input(key)
+        done = time.perf_counter()
+        latency[i] = done - scheduled
+        service[i] = done - begin
+        remaining[user] -= 1
+        if remaining[user]:
+            heapq.heapreplace(queue, (done + think(user), user))
+        else:
+            heapq.heappop(queue)
+            if steady is None:
+                steady = (i + 1, done)
+    elapsed = time.perf_counter() - start
+
+    if steady is None:   # Nenhum usuário terminou (sem teclas): usa a média da execução toda
+        steady_rate = total / elapsed if elapsed > 0 else 0.0
+    else:
+        steady_rate = steady[0] / (steady[1] - start)
+    signature = hashlib.sha256("\n".join(c.display_text for c in controllers).encode()).hexdigest()[:16]
+    return {"elapsed": elapsed, "keys": total, "steady_rate": steady_rate, "errors": errors[0], "latency": sorted(latency),
+            "busy": sum(service), "service": sorted(service), "signature": signature}
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Retorna o percentil de uma sequência já ordenada."""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga em malha fechada dos controladores.")
+    parser.add_argument("--users", type=int, default=1000, help="Usuários simultâneos")
+    parser.add_argument("--keys", type=int, default=200, help="Teclas por usuário")
+    parser.add_argument("--rate", type=float, default=20_000, help="Taxa total alvo em teclas/s (0 = saturação)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Pesos dos operadores, ex.: " + DEFAULT_MIX)
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Fração das contas que terminam em erro")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.users <= 0 or args.keys <= 0:
+        parser.error("--users e --keys devem ser maiores que zero")
+    if not 0 <= args.rate < math.inf:
+        parser.error("--rate deve ser um número finito maior ou igual a zero")
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(f"--mix inválido: {e}")
+    result = run(args.users, args.keys, args.rate, mix, args.error_rate, args.seed)
+    elapsed, latency, service = result["elapsed"], result["latency"], result["service"]
+    utilization = result["busy"] / elapsed
+
+    print(f"Usuários: {args.users}, teclas: {result['keys']:,}, semente: {args.seed}, "
+          f"contas com erro: {result['errors']:,}")
+    print(f"Taxa alvo: {args.rate:,.0f} teclas/s" if args.rate else "Taxa alvo: saturação (sem reflexão)")
+    # No fim da execução restam poucos usuários; a vazão com todos ativos é a que se compara com a taxa alvo
+    print(f"Vazão: {result['steady_rate']:,.0f} teclas/s com todos os usuários ativos, "
+          f"{result['keys'] / elapsed:,.0f} na execução inteira   utilização: {utilization:.1%}")
+    for name, values in (("Latência", latency), ("Processamento", service)):
+        print(f"{name + ':':<15}" + "  ".join(
+            f"p{label} {percentile(values, fraction) * 1e6:8.1f} µs"
+            for label, fraction in (("50", 0.50), ("99", 0.99), ("99.9", 0.999))) +
+            f"  máx {values[-1] * 1e6:8.1f} µs")
+    if args.rate:
+        # Com o mesmo ritmo por usuário, o processo satura quando a utilização chega a 100%
+        print(f"Capacidade estimada: ~{args.users / utilization:,.0f} usuários neste ritmo "
+              f"({args.rate / args.users:.1f} teclas/s por usuário)")
+    print(f"Memória por sessão: {session_bytes(min(args.users, 10_000)):,.0f} bytes")
+    print(f"Assinatura: {result['signature']}")
+
+
+if __name__ == "__main__":
+    main()
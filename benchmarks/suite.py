@@ -0,0 +1,250 @@
+"""
+Suíte de benchmarks dos caminhos críticos: modelo, controlador e inicialização.
+
+Mede:
+    - vazão de cada método da Calculator
+    - vazão de teclas em Controller.process_input com um display simulado
+    - custo do caminho de erro (DivisionByZeroError) no modelo e no controlador
+    - tempo de importação a frio e de inicialização de src/main.py, sem abrir janela
+    - tempo de uma chamada completa da CLI sem interface gráfica (src/cli.py)
+
+Os resultados são salvos em JSON e comparados com uma linha de base; a saída
+tem código 1 se alguma métrica piorar mais do que o limite configurado.
+
+Uso:
+    python benchmarks/suite.py --save-baseline            # Grava benchmarks/baseline.json
+    python benchmarks/suite.py --output resultados.json   # Compara com a linha de base
+    python benchmarks/suite.py --threshold 0.05 --quick
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT / 'src'))  # Permite importar os módulos de 'src'
+
+from model.calculator import Calculator
+from model.exceptions import DivisionByZeroError
+from controller.controller import Controller
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Sequência de teclas típica: números decimais, operadores encadeados, porcentagem e raiz
+KEYSTROKES = "1 2 . 5 + 7 * 3 - 4 0 % = sqrt C 9 / 3 =".split()
+
+
+class MockGui:
+    """
+    Display simulado que guarda o texto, como o StringVar do Tk (ver tests/test_controller.py).
+    """
+    def __init__(self):
+        self.text = "0"
+        self.display_var = self
+
+    def get(self):
+        return self.text
+
+    def update_display(self, text):
+        self.text = text
+
+
+def best_rate(statement, number: int, repeat: int) -> float:
+    """
+    Executa `statement` e retorna a melhor vazão (execuções por segundo) entre as repetições.
+    """
+    times = timeit.repeat(statement, number=number, repeat=repeat)
+    return number / min(times)
+
+
+def bench_calculator(number: int, repeat: int) -> dict:
+    """Vazão de cada método da Calculator, em operações por segundo."""
+    calc = Calculator()
+    results = {}
+    for name in ("add", "subtract", "multiply", "divide", "percent"):
+        method = getattr(calc, name)
+
+        def run(method=method):
+            calc.current_value = 12.5
+            method(3.0)
+        results[f"calculator.{name}"] = best_rate(run, number, repeat)
+
+    def run_sqrt():
+        calc.current_value = 12.5
+        calc.sqrt()
+    results["calculator.sqrt"] = best_rate(run_sqrt, number, repeat)
+    results["calculator.clear"] = best_rate(calc.clear, number, repeat)
+    return results
+
+
+def bench_controller(number: int, repeat: int) -> dict:
+    """Vazão de teclas em Controller.process_input, em teclas por segundo."""
+    controller = Controller(Calculator())
+    controller.set_gui(MockGui())
+    process_input = controller.process_input
+
+    def run():
+        for key in KEYSTROKES:
+            process_input(key)
+    rounds = max(1, number // len(KEYSTROKES))
+    return {"controller.keystrokes": best_rate(run, rounds, repeat) * len(KEYSTROKES)}
+
+
+def bench_errors(number: int, repeat: int) -> dict:
+    """Custo do caminho de erro de divisão por zero, em operações por segundo."""
+    calc = Calculator()
+
+    def run_model():
+        try:
+            calc.divide(0)
+        except DivisionByZeroError:
+            pass
+
+    controller = Controller(Calculator())
+    gui = MockGui()
+    controller.set_gui(gui)
+
+    def run_controller():
+        gui.text = "8"
+        controller._process_operator("/")
+        gui.text = "0"
+        controller.process_input("=")
+
+    return {
+        "errors.model_divide_by_zero": best_rate(run_model, number, repeat),
+        "errors.controller_divide_by_zero": best_rate(run_controller, max(1, number // 4), repeat),
+    }
+
+
+def bench_startup(repeat: int) -> dict:
+    """
+    Importação a frio e inicialização de src/main.py em processos novos, sem abrir janela,
+    e uma chamada completa de src/cli.py.
+
+    A inicialização importa o módulo principal e cria o modelo e o controlador;
+    a janela Tk não é criada.
+    """
+    startup = ("import sys; sys.path.insert(0, 'src'); import main; "
+               "from model.calculator import Calculator; from controller.controller import Controller; "
+               "Controller(Calculator())")
+    wall = []
+    imports = []
+    cli = []
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        subprocess.run([sys.executable, "src/cli.py", "keys", "1 2 + 3 ="],
+                       cwd=ROOT, capture_output=True, check=True)
+        cli.append(timeit.default_timer() - start)
+
+        start = timeit.default_timer()
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", startup],
+                                   cwd=ROOT, capture_output=True, text=True, check=True)
+        wall.append(timeit.default_timer() - start)
+        # Soma o tempo cumulativo dos módulos de nível superior (coluna "cumulative", em µs)
+        cumulative = 0
+        for line in completed.stderr.splitlines():
+            match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$", line)
+            if match and not match.group(2).startswith(" "):
+                cumulative += int(match.group(1))
+        imports.append(cumulative / 1e6)
+    return {
+        "startup.main_seconds": statistics.median(wall),
+        "startup.import_seconds": statistics.median(imports),
+        "startup.cli_seconds": statistics.median(cli),
+    }
+
+
+# Métricas em segundos são melhores quando menores; as demais (vazão), quando maiores
+def lower_is_better(metric: str) -> bool:
+    return metric.endswith("_seconds")
+
+
+def run_suite(quick: bool) -> dict:
+    """
+    Executa todos os benchmarks.
+
+    Args:
+        quick: Usa menos iterações (útil em CI).
+
+    Returns:
+        dict: Métricas e informações do ambiente.
+    """
+    number, repeat = (20_000, 3) if quick else (200_000, 5)
+    metrics = {}
+    metrics.update(bench_calculator(number, repeat))
+    metrics.update(bench_controller(number, repeat))
+    metrics.update(bench_errors(number, repeat))
+    metrics.update(bench_startup(3 if quick else 7))
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "metrics": metrics,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compara as métricas com a linha de base.
+
+    Args:
+        results: Resultados atuais.
+        baseline: Resultados da linha de base.
+        threshold: Piora relativa máxima tolerada (0.10 = 10%).
+
+    Returns:
+        list[str]: Descrição das métricas que pioraram além do limite.
+    """
+    regressions = []
+    for metric, value in results["metrics"].items():
+        reference = baseline["metrics"].get(metric)
+        if not reference:
+            continue
+        change = (value - reference) / reference
+        if lower_is_better(metric):
+            change = -change
+        status = "REGRESSÃO" if change < -threshold else "ok"
+        print(f"{metric:<36} {reference:>14.6g} -> {value:>14.6g}  {change:+7.1%}  {status}")
+        if change < -threshold:
+            regressions.append(f"{metric}: {change:+.1%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks da calculadora.")
+    parser.add_argument("--output", help="Arquivo JSON onde salvar os resultados")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Linha de base para comparação")
+    parser.add_argument("--save-baseline", action="store_true", help="Grava os resultados como linha de base")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Piora relativa tolerada (padrão: 0.10)")
+    parser.add_argument("--quick", action="store_true", help="Menos iterações")
+    args = parser.parse_args()
+
+    results = run_suite(args.quick)
+    for metric, value in results["metrics"].items():
+        print(f"{metric:<36} {value:>14.6g}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Linha de base gravada em {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"Sem linha de base em {args.baseline}; use --save-baseline para criá-la.")
+        return
+    print(f"\nComparação com {args.baseline} (limite {args.threshold:.0%}):")
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("\nRegressões de desempenho:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import csv
+import io
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator
+from model.calculator import Calculator
+from model.exceptions import OPERATION_ERRORS
+from model.opcodes import UNARY_OPERATORS
+
+# Cabeçalho do CSV de saída: a linha de entrada seguida do resultado e do erro (se houver)
+OUTPUT_HEADER = "a,op,b,result,error\n"
+
+
+def read_chunks(stream, chunk_size: int, quoted: bool = False) -> Iterator[list[str]]:
+    """
+    Lê o arquivo em blocos de linhas, sem carregá-lo inteiro na memória.
+
+    Com `quoted`, os blocos terminam sempre no fim de um registro CSV: um campo
+    entre aspas pode conter quebras de linha, e o bloco é estendido até que as
+    aspas se fechem (a quantidade de aspas lidas volta a ser par, já que as
+    aspas escapadas vêm em dupla).
+
+    Args:
+        stream: Arquivo de texto aberto.
+        chunk_size: Quantidade de linhas por bloco.
+        quoted: Se os blocos devem respeitar os campos CSV entre aspas.
+
+    Yields:
+        list[str]: Linhas de cada bloco, na ordem do arquivo.
+    """
+    while chunk := list(islice(stream, chunk_size)):
+        if quoted:
+            open_quote = sum(line.count('"') for line in chunk) % 2
+            while open_quote and (line := next(stream, "")):
+                chunk.append(line)
+                open_quote ^= line.count('"') % 2
+        yield chunk
+
+
+def _operand(value) -> float:
+    """
+    Converte um operando da linha em float.
+
+    Raises:
+        ValueError: Se o valor não for um número finito (ex.: "nan", "inf", 1e999 ou 10**400).
+    """
+    try:
+        result = float(value)
+    except OverflowError:
+        raise ValueError(f"Operando fora do intervalo do float: {value!r}") from None
+    if not math.isfinite(result):
+        raise ValueError(f"Operando não finito: {value!r}")
+    return result
+
+
+def _reject_constant(name: str):
+    """Rejeita NaN e Infinity, que não são JSON padrão (json.loads os aceitaria)."""
+    raise ValueError(f"Valor não permitido em JSON: {name}")
+
+
+def _evaluate_row(calc: Calculator, operations: dict, a: float, operator: str, b: float | None) -> float:
+    """Aplica uma linha (a, op, b) com os métodos da Calculator."""
+    calc.current_value = a
+    if operator in UNARY_OPERATORS:
+        return operations[operator]()
+    return operations[operator](b)
+
+
+def evaluate_chunk(task: tuple[str, list[str], str | None]) -> str:
+    """
+    Avalia um bloco de linhas e devolve as linhas de saída já formatadas.
+
+    Executado nos processos do pool: o parsing das linhas, que domina o custo,
+    também é feito no processo de trabalho. Linhas inválidas não interrompem
+    o bloco; o nome do erro vai para a coluna `error`. Operandos não finitos
+    (nan, inf) são linhas inválidas, e resultados infinitos vão para o JSONL
+    como texto ("inf"), para que a saída continue sendo JSON padrão. Com um cache de
+    resultados, cada processo abre o mesmo arquivo e grava os resultados novos
+    em lote ao final do bloco.
+
+    Args:
+        task: Formato de entrada ("csv" ou "jsonl"), as linhas do bloco e o caminho
+              do cache de resultados (ou None).
+
+    Returns:
+        str: Linhas de saída no formato do arquivo de entrada.
+    """
+    fmt, lines, cache_path = task
+    calc = Calculator()
+    operations = {
+        '+': calc.add,
+        '-': calc.subtract,
+        '*': calc.multiply,
+        '/': calc.divide,
+        '%': calc.percent,
+        '^': calc.power,
+        'root': calc.root,
+        'sqrt': calc.sqrt,
+        'log': calc.log,
+        'ln': calc.ln,
+        'exp': calc.exp,
+        'sin': calc.sin,
+        'cos': calc.cos,
+        'tan': calc.tan,
+        '!': calc.factorial,
+    }
+    cache = None
+    if cache_path is not None:
+        from model.result_cache import ResultCache, operation_key
+        cache = ResultCache(cache_path, calc)
+
+    def evaluate(a: float, operator: str, b: float | None) -> float:
+        if cache is None:
+            return _evaluate_row(calc, operations, a, operator, b)
+        return cache.get_or_compute(operation_key(operator, a, b),
+                                    lambda: _evaluate_row(calc, operations, a, operator, b))
+
+    output = []
+
+    if fmt == "csv":
+        # O writer recoloca as aspas dos campos que as exigem (vírgulas, aspas, quebras de linha)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for row in csv.reader(lines):
+            if not row:
+                continue
+            a, operator, b = (row + ["", ""])[:3]
+            try:
+                result = evaluate(_operand(a), operator.strip(), _operand(b) if b.strip() else None)
+                error = ""
+            except (*OPERATION_ERRORS, KeyError, TypeError, ValueError) as e:
+                result, error = "", type(e).__name__
+            writer.writerow((a, operator, b, result, error))
+        output.append(buffer.getvalue())
+    else:
+        for line in lines:
+            if not line.strip():
+                continue
+            row = None
+            try:
+                row = json.loads(line, parse_float=_operand, parse_constant=_reject_constant)
+                b = row.get("b")
+                result = evaluate(_operand(row["a"]), row["op"], None if b is None else _operand(b))
+                row["result"] = result if math.isfinite(result) else repr(result)
+            except (*OPERATION_ERRORS, KeyError, TypeError, ValueError, AttributeError) as e:
+                if not isinstance(row, dict):
+                    row = {"line": line.strip()}
+                row["error"] = type(e).__name__
+            output.append(json.dumps(row, allow_nan=False) + "\n")
+    if cache is not None:
+        cache.close()
+    return "".join(output)
+
+
+def evaluate_file(input_path: str, output_path: str, workers: int | None = None,
+                  chunk_size: int = 50_000, cache_path: str | None = None) -> int:
+    """
+    Avalia um arquivo CSV ou JSONL de linhas (a, op, b) em paralelo.
+
+    Os blocos são distribuídos a um ProcessPoolExecutor e escritos na ordem de
+    entrada. No máximo `2 * workers` blocos ficam em andamento ao mesmo tempo,
+    o que mantém a memória limitada independentemente do tamanho do arquivo.
+
+    Args:
+        input_path: Arquivo de entrada (.csv com colunas a,op,b ou .jsonl com objetos {"a", "op", "b"}).
+        output_path: Arquivo de saída, no mesmo formato, com o resultado de cada linha.
+        workers: Quantidade de processos. 0 avalia no próprio processo. Padrão: os.cpu_count().
+        chunk_size: Linhas por bloco enviado a cada processo.
+        cache_path: Arquivo SQLite do cache persistente de resultados (ver model/result_cache.py),
+                    compartilhado pelos processos e entre execuções. Padrão: sem cache.
+
+    Returns:
+        int: Quantidade de blocos processados.
+    """
+    fmt = "jsonl" if input_path.endswith((".jsonl", ".ndjson")) else "csv"
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    chunks = 0
+
+    with open(input_path, encoding="utf-8", newline="") as source, \
+            open(output_path, "w", encoding="utf-8", newline="") as target:
+        if fmt == "csv":
+            target.write(OUTPUT_HEADER)
+            first = next(read_chunks(source, 1, quoted=True), None)
+            # Reaproveita o primeiro registro se ele não for um cabeçalho
+            if first and not first[0].lower().startswith("a,"):
+                target.write(evaluate_chunk((fmt, first, cache_path)))
+
+        tasks = ((fmt, lines, cache_path) for lines in read_chunks(source, chunk_size, quoted=fmt == "csv"))
+
+        if workers == 0:
+            for task in tasks:
+                target.write(evaluate_chunk(task))
+                chunks += 1
+            return chunks
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.submit(evaluate_chunk, task))
+                # Limita os blocos em andamento, escrevendo sempre o mais antigo (ordem de entrada)
+                if len(pending) >= 2 * workers:
+                    target.write(pending.popleft().result())
+                    chunks += 1
+            while pending:
+                target.write(pending.popleft().result())
+                chunks += 1
+    return chunks
+
+
+def main(argv: list[str] | None = None):
+    """
+    Modo em lote pela linha de comando, sem interface gráfica.
+
+    Uso:
+        python src/batch_eval.py entrada.csv saida.csv [--workers 8] [--chunk-size 50000] [--cache resultados.db]
+    """
+    parser = argparse.ArgumentParser(description="Avalia arquivos CSV/JSONL de linhas (a, op, b).")
+    parser.add_argument("input", help="Arquivo de entrada (.csv ou .jsonl)")
+    parser.add_argument("output", help="Arquivo de saída")
+    parser.add_argument("--workers", type=int, default=None, help="Processos (0 = sem pool)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Linhas por bloco")
+    parser.add_argument("--cache", default=None, help="Arquivo SQLite do cache persistente de resultados")
+    args = parser.parse_args(argv)
+    evaluate_file(args.input, args.output, args.workers, args.chunk_size, args.cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import sys
+sys.path.append('src')  # Adiciona o diretório 'src' ao path para permitir importações locais
+
+USAGE = """Calculadora sem interface gráfica.
+
+Uso:
+    python src/cli.py expr "12*(3+4)/sqrt(16)"     Avalia uma expressão
+    python src/cli.py keys "1 2 + 3 ="             Executa uma sequência de teclas
+    python src/cli.py keys --backend decimal "0 . 1 + 0 . 2 ="
+                                                   ... com outro tipo numérico (float, decimal, fraction)
+    python src/cli.py replay teclas.txt            Reproduz um arquivo de teclas
+    python src/cli.py stats valores.txt            Estatísticas de um fluxo de números (memória constante)
+    python src/cli.py batch entrada.csv saida.csv  Avalia um arquivo em lote (ver src/batch_eval.py)
+    python src/cli.py columnar evaluate lote.calc  Converte/avalia arquivos colunares
+    python src/cli.py serve --port 8765            Inicia o serviço de rede (ver src/server.py)
+"""
+
+
+def _expr(args: list[str]) -> int:
+    from model.expression import ExpressionEngine
+    from model.exceptions import OPERATION_ERRORS, InvalidExpressionError
+
+    try:
+        print(ExpressionEngine().evaluate(" ".join(args)))
+    except (*OPERATION_ERRORS, InvalidExpressionError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _keys(args: list[str]) -> int:
+    import argparse
+    from model.backends import BACKENDS, create_calculator
+    from controller.headless import HeadlessController, unknown_keys
+
+    parser = argparse.ArgumentParser(prog="cli.py keys")
+    parser.add_argument("--backend", choices=list(BACKENDS), default="float")
+    parser.add_argument("--precision", type=int, default=None, help="Dígitos significativos (decimal)")
+    parser.add_argument("keys", nargs="+")
+    options = parser.parse_args(args)
+
+    keys = " ".join(options.keys).split()
+    unknown = unknown_keys(keys)
+    if unknown:
+        print(f"Teclas desconhecidas: {' '.join(unknown)} (separe as teclas por espaços, ex.: \"1 2 +\")",
+              file=sys.stderr)
+        return 1
+    controller = HeadlessController(create_calculator(options.backend, options.precision))
+    for key in keys:
+        try:
+            controller.process_input(key)
+        except ValueError:
+            pass  # Operador sobre mensagem de erro: ignorado, como em replay() e na GUI
+    print(controller.display_text)
+    return 0
+
+
+def _replay(args: list[str]) -> int:
+    from controller.replay import main
+    main(args)
+    return 0
+
+
+def _stats(args: list[str]) -> int:
+    from model.accumulators import StreamingStats
+
+    stats = StreamingStats()
+    try:
+        stream = open(args[0], encoding="utf-8") if args and args[0] != "-" else sys.stdin
+    except OSError as e:
+        print(f"Não foi possível abrir {args[0]!r}: {e.strerror}", file=sys.stderr)
+        return 1
+    try:
+        for number, line in enumerate(stream, 1):
+            for token in line.replace(",", " ").split():
+                try:
+                    stats.add(float(token))
+                except ValueError:   # Texto que não é número, ou NaN
+                    print(f"Valor inválido na linha {number}: {token!r}", file=sys.stderr)
+                    return 1
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    for name, value in stats.summary().items():
+        print(f"{name}: {value}")
+    return 0
+
+
+def _batch(args: list[str]) -> int:
+    from batch_eval import main
+    main(args)
+    return 0
+
+
+def _columnar(args: list[str]) -> int:
+    from model.columnar import main
+    main(args)
+    return 0
+
+
+def _serve(args: list[str]) -> int:
+    from server import main
+    main(args)
+    return 0
+
+
+# Cada comando importa apenas os módulos de que precisa; nenhum deles carrega o tkinter
+COMMANDS = {
+    "expr": _expr,
+    "keys": _keys,
+    "replay": _replay,
+    "stats": _stats,
+    "batch": _batch,
+    "columnar": _columnar,
+    "serve": _serve,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Ponto de entrada da calculadora sem interface gráfica (CLI, lote e serviço).
+
+    Ao contrário de src/main.py, não importa a camada de visualização, então
+    não depende de um display nem paga o custo de importação do tkinter.
+
+    Args:
+        argv: Argumentos da linha de comando (padrão: sys.argv[1:]).
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        return 2
+    return COMMANDS[args[0]](args[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+
+class BackgroundTask:
+    """
+    Tarefa executada em uma thread do pool, com cancelamento cooperativo e progresso.
+
+    A função da tarefa recebe esta instância como primeiro argumento e deve
+    chamar `report` para informar o progresso e `check_cancelled` (ou consultar
+    `cancelled`) periodicamente para interromper o trabalho quando cancelada.
+    """
+
+    def __init__(self, on_done=None, on_error=None, on_progress=None, on_cancel=None):
+        """
+        Args:
+            on_done: Chamada com o resultado, na thread da interface.
+            on_error: Chamada com a exceção levantada pela tarefa, na thread da interface.
+            on_progress: Chamada com a fração concluída (0 a 1), na thread da interface.
+            on_cancel: Chamada sem argumentos quando a tarefa termina cancelada.
+        """
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.future = None
+        self.progress = 0.0                  # Fração concluída, escrita pela thread de trabalho
+        self._reported = -1.0                # Última fração repassada a on_progress
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Indica se o cancelamento foi pedido."""
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        """Indica se a função da tarefa terminou (com resultado, erro ou cancelamento)."""
+        return self.future is not None and self.future.done()
+
+    def cancel(self) -> None:
+        """
+        Pede o cancelamento da tarefa.
+
+        Se ainda não começou, ela nem chega a executar; se está em execução,
+        termina na próxima verificação de `check_cancelled`.
+        """
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self) -> None:
+        """
+        Interrompe a tarefa se o cancelamento foi pedido.
+
+        Raises:
+            CancelledError: Se a tarefa foi cancelada.
+        """
+        if self._cancelled.is_set():
+            raise CancelledError()
+
+    def report(self, done: int, total: int) -> None:
+        """
+        Informa o progresso da tarefa (chamado pela thread de trabalho).
+
+        Args:
+            done: Unidades de trabalho concluídas.
+            total: Total de unidades de trabalho.
+        """
+        self.progress = done / total if total else 1.0
+
+
+class BackgroundRunner:
+    """
+    Executa tarefas pesadas em um pool de threads sem bloquear o loop do Tk.
+
+    Nenhum callback é chamado da thread de trabalho: enquanto há tarefas
+    ativas, a thread da interface consulta o estado delas a cada
+    `poll_interval_ms`, agendando a consulta com `schedule` (ex.: `Tk.after`),
+    e só então chama os callbacks de progresso, resultado e erro.
+    """
+
+    def __init__(self, schedule, max_workers: int = 2, poll_interval_ms: int = 50):
+        """
+        Args:
+            schedule: Função `schedule(delay_ms, callback)` que executa `callback` na thread
+                      da interface após o intervalo (ex.: `window.after`).
+            max_workers: Quantidade de threads do pool.
+            poll_interval_ms: Intervalo entre as consultas às tarefas ativas.
+        """
+        self.schedule = schedule
+        self.poll_interval_ms = poll_interval_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="calculator")
+        self._active: list[BackgroundTask] = []
+        self._polling = False
+
+    @property
+    def active(self) -> list[BackgroundTask]:
+        """Tarefas ainda não finalizadas na thread da interface."""
+        return list(self._active)
+
+    def submit(self, function, *args, on_done=None, on_error=None, on_progress=None, on_cancel=None) -> BackgroundTask:
+        """
+        Executa `function(task, *args)` em uma thread do pool.
+
+        Args:
+            function: Função a executar; recebe a tarefa como primeiro argumento.
+            *args: Demais argumentos da função.
+            on_done, on_error, on_progress, on_cancel: Callbacks (ver BackgroundTask).
+
+        Returns:
+            BackgroundTask: A tarefa, que pode ser cancelada.
+        """
+        task = BackgroundTask(on_done, on_error, on_progress, on_cancel)
+        task.future = self._executor.submit(function, task, *args)
+        self._active.append(task)
+        if not self._polling:
+            self._polling = True
+            self.schedule(self.poll_interval_ms, self._poll)
+        return task
+
+    def cancel_all(self) -> None:
+        """Pede o cancelamento de todas as tarefas ativas."""
+        for task in self._active:
+            task.cancel()
+
+    def shutdown(self) -> None:
+        """Cancela as tarefas ativas e encerra o pool, aguardando as threads."""
+        self.cancel_all()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _poll(self) -> None:
+        """Repassa progresso e resultados das tarefas ativas (na thread da interface)."""
+        finished = [task for task in self._active if task.done]
+        self._active = [task for task in self._active if task not in finished]
+        for task in self._active:
+            if task.on_progress is not None and task.progress != task._reported:
+                task._reported = task.progress
+                task.on_progress(task.progress)
+        # Os callbacks finais já veem a lista de ativas sem as tarefas concluídas
+        for task in finished:
+            self._finish(task)
+        if self._active:
+            self.schedule(self.poll_interval_ms, self._poll)
+        else:
+            self._polling = False
+
+    @staticmethod
+    def _finish(task: BackgroundTask) -> None:
+        """Chama o callback final da tarefa concluída."""
+        future = task.future
+        if future.cancelled() or task.cancelled or isinstance(future.exception(), CancelledError):
+            if task.on_cancel is not None:
+                task.on_cancel()
+        elif future.exception() is not None:
+            if task.on_error is not None:
+                task.on_error(future.exception())
+        elif task.on_done is not None:
+            task.on_done(future.result())
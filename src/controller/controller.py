@@ -1,6 +1,21 @@
+import math
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
 from model.calculator import Calculator
-from view.gui import Gui
-from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError
+from model.exceptions import OPERATION_ERRORS
+from model.opcodes import NUMBER_KEYS, OPERATORS, UNARY_OPERATORS
+from controller.metrics import Metrics, token_label
+from controller.macro import Macro
+
+if TYPE_CHECKING:   # Só para as anotações: importar a view aqui carregaria o tkinter
+    from model.accumulators import StreamingStats
+    from model.history import HistoryTape
+    from view.gui import Gui
+
+# Teclas de operador, em conjuntos para que cada tecla custe uma única busca
+_OPERATOR_KEYS = frozenset(OPERATORS)
+_UNARY_KEYS = frozenset(UNARY_OPERATORS)
+
 
 class Controller:
     """
@@ -20,15 +35,268 @@ class Controller:
         self.first_number: float | None = None        # Armazena o primeiro número de uma operação
         self.pending_operator: str | None = None      # Armazena o operador pendente
         self.new_number_started: bool = False         # Indica se o usuário começou a digitar um novo número
+        self.metrics: Metrics | None = None           # Instrumentação opcional (desligada por padrão)
+        self._background = None                       # Pool de tarefas pesadas, criado no primeiro uso
+        self._recording: list[str] | None = None      # Teclas da macro em gravação, se houver
+        self.last_error: Exception | None = None      # Último erro de cálculo exibido no display
+        self.history: "HistoryTape | None" = None      # Histórico de operações (desligado por padrão)
+        self.stats: "StreamingStats | None" = None     # Estatísticas dos resultados (desligadas por padrão)
+        # Conversões e operações do tipo numérico da calculadora, resolvidas uma vez por sessão
+        self._parse = calculator.parse
+        self._format = calculator.format
+        self._dispatch = calculator.dispatch
 
-    def set_gui(self, gui: Gui) -> None:
+    def set_gui(self, gui: "Gui") -> None:
         """
         Conecta a interface gráfica (GUI) ao controlador após sua criação.
 
+        A classe Gui só é importada na verificação de tipos (TYPE_CHECKING):
+        importá-la em tempo de execução carregaria o tkinter em todo uso sem
+        interface gráfica.
+
+        Args:
+            gui: Instância da classe Gui (ou qualquer objeto com `display_var` e `update_display`).
+        """
+        self.gui: "Gui" = gui
+
+    def enable_metrics(self, metrics: Metrics | None = None) -> Metrics:
+        """
+        Liga a contagem de chamadas, latências e erros de `process_input` e `_execute_operation`.
+
+        Args:
+            metrics: Instância a ser usada (permite compartilhar entre controladores).
+                     Se omitida, cria uma nova.
+
+        Returns:
+            Metrics: As métricas em uso.
+        """
+        self.metrics = metrics if metrics is not None else Metrics()
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """
+        Desliga a instrumentação; as métricas já coletadas não são apagadas.
+        """
+        self.metrics = None
+
+    def enable_stats(self, relative_accuracy: float = 0.01) -> "StreamingStats":
+        """
+        Liga as estatísticas dos resultados, ao lado do valor atual da calculadora.
+
+        Cada resultado de operação exibido é adicionado aos acumuladores de
+        memória constante (soma, média, variância, mínimo, máximo e quantis), e
+        limpar a calculadora (C) também os limpa. Resultados NaN são ignorados;
+        os dos tipos exatos entram convertidos em float.
+
+        Args:
+            relative_accuracy: Erro relativo máximo dos quantis.
+
+        Returns:
+            StreamingStats: Os acumuladores em uso (`summary()` dá as estatísticas).
+        """
+        from model.accumulators import StreamingStats
+        self.stats = StreamingStats(relative_accuracy)
+        return self.stats
+
+    def disable_stats(self) -> None:
+        """
+        Desliga as estatísticas dos resultados; as já acumuladas não são apagadas.
+        """
+        self.stats = None
+
+    def enable_history(self, capacity: int = 1_000_000) -> "HistoryTape":
+        """
+        Liga o histórico de operações, com desfazer e refazer.
+
+        Cada operação executada (inclusive as que terminam em erro) é registrada;
+        limpar a calculadora não apaga o histórico.
+
+        Args:
+            capacity: Quantidade máxima de operações guardadas; acima dela, as mais antigas são descartadas.
+
+        Returns:
+            HistoryTape: O histórico em uso.
+
+        Raises:
+            ValueError: Se a calculadora não usar float: o histórico guarda float64 e
+                        desfazer ou refazer perderia a precisão dos tipos exatos.
+        """
+        if self.calculator.backend != "float":
+            raise ValueError(f"O histórico só pode ser ligado com o tipo numérico float "
+                             f"(a calculadora usa {self.calculator.backend!r}).")
+        from model.history import HistoryTape
+        self.history = HistoryTape(capacity)
+        return self.history
+
+    def undo(self) -> bool:
+        """
+        Desfaz a última operação do histórico, exibindo o primeiro operando dela.
+
+        Returns:
+            bool: Falso se o histórico estiver desligado ou não houver o que desfazer.
+        """
+        entry = self.history.undo() if self.history is not None else None
+        if entry is None:
+            return False
+        self._restore(entry[0])
+        return True
+
+    def redo(self) -> bool:
+        """
+        Refaz a última operação desfeita, exibindo o resultado (ou a mensagem de erro) dela.
+
+        Returns:
+            bool: Falso se o histórico estiver desligado ou não houver o que refazer.
+        """
+        entry = self.history.redo() if self.history is not None else None
+        if entry is None:
+            return False
+        a, operator, b = entry[:3]
+        try:
+            # Recalcula com as funções puras, sem registrar de novo
+            result = self._dispatch[operator](a, None if operator in _UNARY_KEYS else b)
+        except OPERATION_ERRORS as e:
+            self.last_error = e
+            self._show_message(str(e))
+            self._restore_state(self.calculator.zero)
+            return True
+        self._restore(result)
+        return True
+
+    def _restore(self, value: float) -> None:
+        """Exibe um valor do histórico como resultado, sem operação pendente."""
+        self._restore_state(value)
+        self._show_value(value)
+
+    def _restore_state(self, value: float) -> None:
+        """Coloca a calculadora no estado de um resultado recém-exibido."""
+        self.calculator.current_value = value
+        self.first_number = None
+        self.pending_operator = None
+        self.new_number_started = True
+
+    def start_recording(self) -> None:
+        """
+        Começa a gravar as teclas processadas como uma macro.
+
+        O primeiro número digitado na gravação passa a ser o operando da macro.
+
+        Raises:
+            ValueError: Se a calculadora não usar float: a macro compilada calcula
+                        em float e daria resultados diferentes das teclas digitadas.
+        """
+        if self.calculator.backend != "float":
+            raise ValueError(f"Macros só podem ser gravadas com o tipo numérico float "
+                             f"(a calculadora usa {self.calculator.backend!r}).")
+        self._recording = []
+
+    def stop_recording(self) -> Macro:
+        """
+        Encerra a gravação e compila as teclas gravadas.
+
+        Returns:
+            Macro: Função única equivalente à sequência gravada, aplicável a um
+                   número ou a um array de números.
+
+        Raises:
+            RuntimeError: Se nenhuma gravação estiver em andamento.
+        """
+        if self._recording is None:
+            raise RuntimeError("Nenhuma macro está sendo gravada.")
+        keys, self._recording = self._recording, None
+        return Macro(keys)
+
+    def run_in_background(self, function, *args, on_done=None):
+        """
+        Executa um trabalho pesado fora da thread da interface.
+
+        `function(task, *args)` roda em uma thread do pool; progresso e resultado
+        voltam para a thread da interface pelo `schedule` da GUI (Tk.after), que
+        mostra o indicador de progresso enquanto houver tarefas. As teclas
+        continuam sendo processadas de forma síncrona em `process_input`.
+
         Args:
-            gui: Instância da classe Gui.
+            function: Trabalho a executar; recebe a tarefa (BackgroundTask) como primeiro argumento.
+            *args: Demais argumentos do trabalho.
+            on_done: Chamada com o resultado, na thread da interface.
+
+        Returns:
+            BackgroundTask: A tarefa, que pode ser cancelada.
         """
-        self.gui: Gui = gui
+        if self._background is None:
+            # Importado sob demanda: o pool de threads não faz parte do caminho de inicialização
+            from controller.background import BackgroundRunner
+            self._background = BackgroundRunner(self.gui.schedule)
+
+        def finish(callback, *result):
+            if not self._background.active:
+                self.gui.show_progress(None)
+            if callback is not None:
+                callback(*result)
+
+        task = self._background.submit(
+            function, *args,
+            on_done=lambda result: finish(on_done, result),
+            on_error=lambda error: finish(self._show_message, str(error)),
+            on_progress=self.gui.show_progress,
+            on_cancel=lambda: finish(None),
+        )
+        self.gui.show_progress(0.0)
+        return task
+
+    def cancel_background(self) -> None:
+        """
+        Cancela todas as tarefas em segundo plano em andamento.
+        """
+        if self._background is not None:
+            self._background.cancel_all()
+
+    def close(self) -> None:
+        """
+        Encerra o controlador ao fechar a janela.
+
+        Cancela as tarefas em segundo plano e aguarda as threads do pool, que
+        não são daemon: sem isso, o interpretador só terminaria depois da tarefa.
+        """
+        if self._background is not None:
+            self.cancel_background()
+            self._background.shutdown()
+            self._background = None
+
+    def replay_in_background(self, tokens: list[str]):
+        """
+        Reproduz uma sequência longa de teclas (ex.: macro) sem congelar a interface.
+
+        A reprodução parte de uma calculadora zerada, em uma thread do pool;
+        ao terminar, o resultado final é exibido e passa a ser o estado deste controlador.
+
+        Args:
+            tokens: Teclas a serem processadas.
+
+        Returns:
+            BackgroundTask: A tarefa, que pode ser cancelada.
+        """
+        import copy
+        from controller.replay import replay_task
+        calculator = copy.copy(self.calculator)  # Mesmo tipo numérico, sem compartilhar o estado
+        calculator.clear()
+        return self.run_in_background(replay_task, list(tokens), calculator, on_done=self._adopt)
+
+    def _adopt(self, other: "Controller") -> None:
+        """
+        Assume o estado final de outro controlador (ex.: da reprodução em segundo plano).
+
+        Args:
+            other: Controlador sem display com o estado a copiar.
+        """
+        self.calculator.current_value = other.calculator.current_value
+        self.first_number = other.first_number
+        self.pending_operator = other.pending_operator
+        self.new_number_started = True
+        try:
+            self._show_value(other._display_value())
+        except ValueError:
+            self._show_message(other.display_text)
 
     def process_input(self, value: str) -> None:
         """
@@ -37,21 +305,48 @@ class Controller:
         Dependendo do valor, chama os métodos internos para processar números,
         operadores, igual ou limpar a calculadora.
 
+        Args:
+            value: Valor do botão clicado pelo usuário.
+        """
+        if self._recording is not None:
+            self._recording.append(value)
+        metrics = self.metrics
+        if metrics is None:
+            self._handle_input(value)
+            return
+
+        label = token_label(value)
+        start = perf_counter_ns()
+        try:
+            self._handle_input(value)
+        except ValueError as e:
+            metrics.record_error("input", label, e)
+            raise
+        finally:
+            metrics.observe("input", label, perf_counter_ns() - start)
+
+    def _handle_input(self, value: str) -> None:
+        """
+        Despacha a tecla para o método interno correspondente (corpo de `process_input`).
+
         Args:
             value: Valor do botão clicado pelo usuário.
         """
         try:
-            if value.isdigit() or value == '.':
+            if value in NUMBER_KEYS:
                 self._process_number(value)
-            elif value in ['+', '-', '*', '/', 'sqrt', '%']:
+            elif value in _OPERATOR_KEYS:
                 self._process_operator(value)
             elif value == "=":
                 self._process_equals()
             elif value == "C":
                 self._process_clear()
-        except (DivisionByZeroError, NegativeNumberSqrtError) as e:
+        except OPERATION_ERRORS as e:
+            self.last_error = e
+            if self.metrics is not None:
+                self.metrics.record_error("input", token_label(value), e)
             # Exibe mensagem de erro no display e reseta a calculadora
-            self.gui.update_display(str(e))
+            self._show_message(str(e))
             self.calculator.clear()
             self.first_number = None
             self.pending_operator = None
@@ -86,35 +381,33 @@ class Controller:
         """
         Processa um operador ou operação especial.
 
-        Operadores suportados: +, -, *, /  
-        Operações especiais: sqrt (raiz quadrada), % (porcentagem)
+        Operadores suportados: +, -, *, /, ^ (potência), root (raiz de índice y)
+        Operações especiais: % (porcentagem) e as de um operando (UNARY_OPERATORS):
+        sqrt, log, ln, exp, sin, cos, tan e ! (fatorial)
 
         Args:
             operator: Operador clicado pelo usuário.
         """
-        display_value = float(self.gui.display_var.get())
+        display_value = self._display_value()
         
-        # Operação de raiz quadrada: aplica ao valor atual e atualiza display
-        if operator == 'sqrt':
-            self.calculator.current_value = display_value
-            self.calculator.sqrt()
-            self.gui.update_display(str(self.calculator.current_value))
+        # Operação de um operando (raiz quadrada, log, seno...): aplica ao valor atual e atualiza display
+        if operator in _UNARY_KEYS:
+            self._execute_operation(display_value, operator, None)
             self.new_number_started = True
             return
         
         # Operação de porcentagem
         elif operator == '%':
-            self.calculator.current_value = display_value
-
             if self.pending_operator in ['+', '-']:
                 # Percentual relativo ao primeiro número da operação
                 base = self.first_number if self.first_number is not None else display_value
-                self.calculator.percent(base)
+                self._execute_operation(display_value, '%', base)
             elif self.pending_operator in ['*', '/']:
-                # Percentual como fração (divide por 100)
-                self.calculator.current_value /= 100
-
-            self.gui.update_display(str(self.calculator.current_value))
+                # Percentual como fração (divide por 100), medido como "%" nas métricas
+                self._execute_operation(display_value, '/', 100, label='%')
+            else:
+                self.calculator.current_value = display_value
+                self._show_value(display_value)
             self.new_number_started = True
             return
 
@@ -139,7 +432,7 @@ class Controller:
         if self.pending_operator is None:
             return
             
-        second_number = float(self.gui.display_var.get())
+        second_number = self._display_value()
         self._execute_operation(self.first_number, self.pending_operator, second_number)
         
         # Resetando estados após operação
@@ -154,31 +447,112 @@ class Controller:
         Atualiza o display para "0".
         """
         self.calculator.clear()
+        if self.stats is not None:
+            self.stats.clear()
         self.first_number = None
         self.pending_operator = None
         self.new_number_started = False
-        self.gui.update_display("0")
+        self._show_message("0")
 
-    def _execute_operation(self, a: float, operator: str, b: float) -> None:
+    def _execute_operation(self, a: float, operator: str, b: float | None, label: str | None = None) -> None:
         """
         Executa a operação selecionada na instância Calculator e atualiza o display.
 
+        Todas as operações (binárias, de um operando e porcentagem) passam por
+        aqui, então as métricas de operação cobrem todos os operadores.
+
+        Args:
+            a: Primeiro número da operação.
+            operator: Operador a ser aplicado.
+            b: Segundo número da operação (None para os operadores de um operando).
+            label: Rótulo da operação nas métricas (padrão: o próprio operador).
+        """
+        metrics = self.metrics
+        if metrics is None:
+            self._apply_operation(a, operator, b)
+            return
+
+        label = label or operator
+        start = perf_counter_ns()
+        try:
+            self._apply_operation(a, operator, b)
+        except OPERATION_ERRORS as e:
+            metrics.record_error("operation", label, e)
+            raise
+        finally:
+            metrics.observe("operation", label, perf_counter_ns() - start)
+
+    def _apply_operation(self, a: float, operator: str, b: float | None) -> None:
+        """
+        Aplica o operador e exibe o resultado (corpo de `_execute_operation`).
+
+        O resultado vem da tabela de funções puras da calculadora; o valor
+        atual só é atualizado depois, com o resultado pronto.
+
         Args:
             a: Primeiro número da operação.
             operator: Operador a ser aplicado.
             b: Segundo número da operação.
         """
-        if operator == '+':
-            self.calculator.current_value = a
-            self.calculator.add(b)
-        elif operator == '-':
-            self.calculator.current_value = a
-            self.calculator.subtract(b)
-        elif operator == '*':
-            self.calculator.current_value = a
-            self.calculator.multiply(b)
-        elif operator == '/':
-            self.calculator.current_value = a
-            self.calculator.divide(b)
-        
-        self.gui.update_display(str(self.calculator.current_value))
+        result = self._compute(operator, a, b)
+        self.calculator.current_value = result
+        if self.stats is not None:
+            self._observe(result)
+        self._show_value(result)
+
+    def _observe(self, result: float) -> None:
+        """Adiciona um resultado às estatísticas (em float; NaN é ignorado)."""
+        try:
+            value = float(result)
+        except OverflowError:   # Fração grande demais para o float
+            value = math.inf if result > 0 else -math.inf
+        if value == value:
+            self.stats.add(value)
+
+    def _compute(self, operator: str, a: float, b: float | None) -> float:
+        """
+        Calcula uma operação com as funções puras da calculadora, registrando-a no histórico.
+
+        Raises:
+            OPERATION_ERRORS: Erros da operação (também registrados).
+        """
+        history = self.history
+        if history is None:
+            return self._dispatch[operator](a, b)
+        try:
+            result = self._dispatch[operator](a, b)
+        except OPERATION_ERRORS as e:
+            history.record(a, operator, b, 0.0, e.code)
+            raise
+        history.record(a, operator, b, result)
+        return result
+
+    def _display_value(self) -> float:
+        """
+        Retorna o número exibido no display.
+
+        Returns:
+            float: Valor do display convertido para o tipo numérico da calculadora.
+
+        Raises:
+            ValueError: Se o display não contiver um número (ex.: mensagem de erro).
+        """
+        return self._parse(self.gui.display_var.get())
+
+    def _show_value(self, value: float) -> None:
+        """
+        Exibe um resultado numérico no display.
+
+        Args:
+            value: Valor a ser exibido.
+        """
+        self.gui.update_display(self._format(value))
+
+    def _show_message(self, text: str) -> None:
+        """
+        Exibe um texto fixo no display (mensagem de erro ou "0" após limpar).
+
+        Args:
+            text: Texto a ser exibido.
+        """
+        self.gui.update_display(text)
@@ -0,0 +1,194 @@
+from model.calculator import Calculator
+from controller.controller import Controller
+
+# Mesmo conjunto de teclas emitido pelos botões de Gui._create_widgets
+KEYS = (
+    '7', '8', '9', '/',
+    '4', '5', '6', '*',
+    '1', '2', '3', '-',
+    'C', '0', '.', '+',
+    '%', 'sqrt', '^', 'root',
+    'log', 'ln', 'exp', '!',
+    'sin', 'cos', 'tan', '='
+)
+_KEY_SET = frozenset(KEYS)
+
+
+def unknown_keys(keys) -> list[str]:
+    """
+    Retorna as teclas que não correspondem a nenhum botão da GUI.
+
+    Entradas externas (linha de comando, serviço de rede) devem ser conferidas
+    antes de chegar ao controlador: tokens como "12" ou dígitos não ASCII
+    ("٣") não são teclas e seriam ignorados.
+
+    Args:
+        keys: Sequência de teclas.
+
+    Returns:
+        list[str]: As teclas desconhecidas, na ordem em que aparecem.
+    """
+    return [key for key in keys if key not in _KEY_SET]
+
+
+class HeadlessDisplay:
+    """
+    Display sem interface gráfica, compatível com o método `update_display` da Gui.
+
+    Apenas guarda o último texto recebido e conta as atualizações,
+    permitindo usar o controlador sem Tk.
+    """
+
+    def __init__(self):
+        self.text = "0"       # Último texto exibido
+        self.updates = 0      # Quantidade de atualizações recebidas
+
+    def update_display(self, text: str) -> None:
+        """
+        Registra o novo texto do display.
+
+        Args:
+            text: Texto a ser exibido.
+        """
+        self.text = text
+        self.updates += 1
+
+
+class HeadlessController(Controller):
+    """
+    Controlador que mantém o estado do display internamente, sem depender do Tk.
+
+    O número digitado é acumulado como mantissa inteira e quantidade de casas
+    decimais, e o resultado exibido é guardado como número. Assim, nenhuma tecla
+    relê e converte o texto do display, e o resultado é idêntico ao da GUI
+    (a divisão inteira `mantissa / 10 ** casas` é arredondada corretamente,
+    assim como `float(texto)`).
+
+    O display é opcional: sem ele, o texto só é formatado quando `display_text`
+    é consultado.
+    """
+
+    def __init__(self, calculator: Calculator, gui=None) -> None:
+        """
+        Inicializa o controlador sem interface gráfica.
+
+        Args:
+            calculator: Instância da classe Calculator.
+            gui: Objeto opcional com o método `update_display` (ex.: HeadlessDisplay).
+        """
+        super().__init__(calculator)
+        self.gui = gui
+        # Conversão do número digitado: None mantém o caminho float embutido abaixo
+        self._from_digits = None if calculator.backend == "float" else calculator.from_digits
+        self._reset_entry()
+
+    def _reset_entry(self) -> None:
+        """Volta ao estado inicial do display: "0" como número em digitação."""
+        self._entry = "0"            # Texto do número em digitação
+        self._mantissa = 0           # Dígitos do número em digitação, como inteiro
+        self._scale = -1             # Casas decimais digitadas (-1 enquanto não há ponto)
+        self._has_digits = True      # Falso quando o número digitado é apenas "."
+        self._typing = True          # Indica se o display mostra o número em digitação
+        self._value = self.calculator.zero  # Resultado exibido (None para mensagens de texto)
+
+    @property
+    def display_text(self) -> str:
+        """
+        Retorna o texto que a GUI estaria exibindo.
+        """
+        if self._typing:
+            return self._entry
+        if self._value is None:
+            return self._message
+        return self._format(self._value)
+
+    def _process_number(self, number: str) -> None:
+        """
+        Acumula o dígito ou ponto digitado no estado numérico interno.
+
+        Segue as mesmas regras da GUI: um novo número substitui o display,
+        zeros à esquerda são descartados e só um ponto decimal é aceito.
+
+        Args:
+            number: Dígito ou ponto digitado pelo usuário.
+        """
+        if self.new_number_started:
+            self.new_number_started = False
+            self._entry = ""
+            self._mantissa = 0
+            self._scale = -1
+            self._has_digits = False
+            self._typing = True
+        elif self._entry in ("0", "0.0"):
+            self._entry = ""
+            self._mantissa = 0
+            self._scale = -1
+            self._has_digits = False
+        elif number == '.' and self._scale >= 0:
+            return
+
+        self._entry += number
+        if number == '.':
+            self._scale = 0
+        else:
+            self._mantissa = self._mantissa * 10 + ord(number) - 48
+            self._has_digits = True
+            if self._scale >= 0:
+                self._scale += 1
+
+        if self.gui is not None:
+            self.gui.update_display(self._entry)
+
+    def _display_value(self) -> float:
+        """
+        Retorna o número exibido sem reler o texto do display.
+
+        Returns:
+            float: Valor do display.
+
+        Raises:
+            ValueError: Se o display não contiver um número, como na GUI
+                        (mensagem de erro ou apenas ".").
+        """
+        if not self._typing:
+            if self._value is None:
+                raise ValueError(f"O display não contém um número: {self._message!r}")
+            return self._value
+        if not self._has_digits:
+            raise ValueError(f"O display não contém um número: {self._entry!r}")
+        if self._from_digits is not None:
+            return self._from_digits(self._mantissa, self._scale)
+        if self._scale <= 0:
+            return float(self._mantissa)
+        try:
+            return self._mantissa / 10 ** self._scale
+        except OverflowError:
+            return float(self._entry)
+
+    def _show_value(self, value: float) -> None:
+        """
+        Guarda o resultado como número e repassa ao display, se houver.
+
+        Args:
+            value: Valor a ser exibido.
+        """
+        self._typing = False
+        self._value = value
+        if self.gui is not None:
+            self.gui.update_display(self._format(value))
+
+    def _show_message(self, text: str) -> None:
+        """
+        Guarda um texto fixo exibido no display.
+
+        Args:
+            text: Mensagem de erro ou "0" após limpar.
+        """
+        if text == "0":
+            self._reset_entry()
+        else:
+            self._typing = False
+            self._value = None
+            self._message = text
+        if self.gui is not None:
+            self.gui.update_display(text)
@@ -0,0 +1,372 @@
+import math
+from itertools import takewhile
+from model import operations
+from model.calculator import Calculator
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError, OPERATION_ERRORS
+from model.opcodes import NUMBER_KEYS, OPERATORS, UNARY_OPERATORS
+
+# Mensagens iguais às da Calculator, para que o erro da macro seja o mesmo do controlador
+DIVISION_MESSAGE = "Não é possível dividir por zero."
+SQRT_MESSAGE = "Não é possível calcular a raiz quadrada de um número negativo."
+
+_BINARY = {'+': '+', '-': '-', '*': '*', '/': '/'}
+
+
+def _scientific_array(np, kind: str, a, b, errors):
+    """
+    Avalia uma operação científica na macro vetorizada com `model.batch.evaluate`.
+
+    Cada linha recebe o código do erro desta operação, se ainda não tiver outro.
+    """
+    from model.batch import evaluate
+    if b is not None:
+        a, b = np.broadcast_arrays(a, b)
+    result, codes = evaluate(kind, np.array(a, dtype=np.float64), b)
+    np.copyto(errors, codes, where=(codes != 0) & (errors == 0))
+    return result
+
+
+class _Node:
+    """
+    Nó da expressão simbólica produzida pela execução da macro.
+
+    `kind` é "x" (o operando), "const", um operador binário ('+', '-', '*', '/')
+    ou "sqrt"; nas operações científicas, o próprio operador ('^', 'log'...).
+    `args` são os nós filhos ou o valor da constante.
+    """
+    __slots__ = ("kind", "args")
+
+    def __init__(self, kind: str, *args):
+        self.kind = kind
+        self.args = args
+
+
+class Macro:
+    """
+    Sequência de teclas gravada no controlador, compilada em uma função única.
+
+    A gravação é executada simbolicamente com as mesmas regras do Controller
+    (operadores encadeados, `%` relativo ao primeiro número após + e -, e como
+    fração após * e /), produzindo uma expressão do operando `x`. O primeiro
+    número digitado na gravação (ou, se a gravação começa com um operador, o
+    valor exibido) é o operando; os demais números são constantes.
+
+    A expressão é compilada uma vez em duas funções: uma escalar, que levanta
+    as mesmas exceções da Calculator, e uma vetorizada (NumPy), que marca as
+    linhas inválidas com NaN e o código do erro, como `model.batch.evaluate`.
+
+    Um erro no meio da sequência não encerra o controlador: ele exibe a
+    mensagem, recomeça e segue com as teclas seguintes (ex.: "x / 0 = C 5 +
+    1 ="). Quando há teclas que podem recomeçar a conta depois de uma
+    operação, os operandos que falham na expressão compilada são reproduzidos
+    tecla a tecla em um controlador, e a macro devolve o que ele exibiria.
+
+    A macro calcula em float, o tipo numérico da Calculator; por isso só é
+    gravada em controladores com esse tipo (ver Controller.start_recording).
+
+    Uso:
+        controller.start_recording()
+        for key in "1 0 0 * 1 . 0 7 - 3 =".split():
+            controller.process_input(key)
+        macro = controller.stop_recording()
+        macro(250.0)               # Mesmo resultado de digitar "2 5 0 * 1 . 0 7 - 3 ="
+        values, errors = macro.apply(array)
+    """
+
+    def __init__(self, keys: list[str]):
+        """
+        Compila a sequência de teclas.
+
+        Args:
+            keys: Teclas gravadas, como emitidas pelos botões da GUI.
+
+        Raises:
+            ValueError: Se a sequência operar sobre um número inválido (ex.: apenas ".")
+                        ou anexar dígitos ao operando depois de outra tecla.
+        """
+        self.keys = list(keys)
+        self.result = _execute(self.keys)
+        # Teclas do operando (reproduzidas como o valor exibido) e se a conta pode recomeçar após um erro
+        self._operand_keys = sum(1 for _ in takewhile(NUMBER_KEYS.__contains__, self.keys))
+        first_operation = next((i for i, key in enumerate(self.keys) if key in OPERATORS or key == '='), None)
+        self._recovers = first_operation is not None and any(
+            key in NUMBER_KEYS or key == 'C' for key in self.keys[first_operation + 1:])
+        self.source = _emit_scalar(self.result)
+        self.array_source = _emit_array(self.result)
+        namespace = {
+            "math": math,
+            "DivisionByZeroError": DivisionByZeroError,
+            "NegativeNumberSqrtError": NegativeNumberSqrtError,
+            "scientific": operations.DISPATCH,
+            "scientific_array": _scientific_array,
+        }
+        exec(compile(self.source, "<macro>", "exec"), namespace)
+        exec(compile(self.array_source, "<macro-array>", "exec"), namespace)
+        self._scalar = namespace["macro"]
+        self._array = namespace["macro_array"]
+
+    def __call__(self, x: float) -> float:
+        """
+        Aplica a macro a um operando.
+
+        Args:
+            x: Operando (o número digitado no início da gravação).
+
+        Returns:
+            float: O valor que o controlador exibiria ao final da sequência.
+
+        Raises:
+            DivisionByZeroError: Se houver divisão por zero.
+            NegativeNumberSqrtError: Se houver raiz quadrada de número negativo.
+            DomainError, ResultOverflowError: Erros das operações científicas.
+        """
+        try:
+            return self._scalar(x)
+        except OPERATION_ERRORS:
+            if not self._recovers:
+                raise
+            return self._replay(x)
+
+    def _replay(self, x: float) -> float:
+        """
+        Reproduz as teclas em um controlador sem display, com `x` como o valor exibido.
+
+        Usado quando um passo falha e a sequência continua depois do erro.
+
+        Raises:
+            A exceção do erro exibido no final, se o display terminar em uma mensagem.
+        """
+        from controller.headless import HeadlessController   # Sob demanda: headless importa o controlador
+        controller = HeadlessController(Calculator())
+        controller._show_value(x)
+        controller.new_number_started = True
+        for key in self.keys[self._operand_keys:]:
+            try:
+                controller.process_input(key)
+            except ValueError:
+                pass  # Operador sobre a mensagem de erro: ignorado, como na GUI
+        try:
+            return float(controller._display_value())
+        except ValueError:
+            if controller.last_error is None or controller.display_text != str(controller.last_error):
+                raise
+            raise controller.last_error from None
+
+    def apply(self, values, out=None, errors=None):
+        """
+        Aplica a macro a um array de operandos, sem exceções.
+
+        Args:
+            values: Operandos (array ou sequência de números).
+            out: Array float64 opcional para os resultados.
+            errors: Array uint8 opcional para os códigos de erro.
+
+        Returns:
+            tuple: (resultados, códigos de erro). Linhas inválidas recebem NaN e o
+                   código do erro (`<Exceção>.code`, como em `model.batch.evaluate`).
+        """
+        import numpy as np
+        x = np.asarray(values, dtype=np.float64)
+        if out is None:
+            out = np.empty_like(x)
+        if errors is None:
+            errors = np.zeros(x.shape, dtype=np.uint8)
+        else:
+            errors[...] = 0
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            out[...] = self._array(np, x, errors)
+        out[errors != 0] = np.nan
+        if self._recovers:
+            # Linhas em que a conta recomeça depois do erro: o resultado é o do controlador
+            for index in zip(*np.nonzero(errors)):
+                try:
+                    out[index] = self(float(x[index]))
+                    errors[index] = 0
+                except OPERATION_ERRORS as e:
+                    errors[index] = e.code
+        return out, errors
+
+
+def _execute(keys: list[str]):
+    """
+    Executa as teclas simbolicamente com as regras do Controller.
+
+    Returns:
+        tuple: (expressão do valor exibido ao final da sequência, operações na
+               ordem em que o controlador as executaria). As operações que não
+               chegam ao resultado ainda precisam ser verificadas, pois um erro
+               no meio da sequência interrompe o controlador.
+    """
+    x = _Node("x")
+    evaluated = []           # Operações executadas, na ordem do controlador
+
+    def operation(kind, *args):
+        node = _Node(kind, *args)
+        evaluated.append(node)
+        return node
+
+    display = x              # Nó exibido (None enquanto um número está sendo digitado)
+    entry = ""               # Texto do número em digitação
+    entry_is_x = False       # O número em digitação é o operando
+    first_number = None
+    pending_operator = None
+    new_number_started = True
+    started = False          # Alguma tecla de operação já foi processada
+
+    def display_value():
+        if display is not None:
+            return display
+        if entry_is_x:
+            return x
+        try:
+            return _Node("const", float(entry))
+        except ValueError:
+            raise ValueError(f"A macro opera sobre um número inválido: {entry!r}") from None
+
+    for key in keys:
+        if key in NUMBER_KEYS:
+            if new_number_started:
+                entry, display = key, None
+                entry_is_x = not started
+                new_number_started = False
+                continue
+            if entry_is_x and started:
+                # Ex.: "5 = 2": o "2" seria anexado ao texto do operando ("52")
+                raise ValueError("A macro anexa dígitos ao operando; isso não é uma operação sobre ele.")
+            if entry in ("0", "0.0"):
+                entry = ""
+            if key == '.' and '.' in entry:
+                continue
+            entry += key
+            continue
+
+        if key in OPERATORS:
+            value = display_value()
+            started = True
+            if key in UNARY_OPERATORS:
+                display = operation(key, value)
+                new_number_started = True
+            elif key == '%':
+                if pending_operator in ('+', '-'):
+                    base = first_number if first_number is not None else value
+                    display = operation("/", operation("*", base, value), _Node("const", 100.0))
+                elif pending_operator in ('*', '/'):
+                    display = operation("/", value, _Node("const", 100.0))
+                else:
+                    display = value
+                new_number_started = True
+            else:
+                if first_number is None:
+                    first_number = value
+                else:
+                    first_number = operation(pending_operator, first_number, value)
+                    display = first_number
+                pending_operator = key
+                new_number_started = True
+                if display is None:
+                    display = value
+        elif key == '=':
+            started = True
+            if pending_operator is None:
+                continue
+            display = operation(pending_operator, first_number, display_value())
+            first_number = None
+            pending_operator = None
+            new_number_started = True
+        elif key == 'C':
+            started = True
+            entry, display, entry_is_x = "0", None, False  # O display mostra "0", como em digitação
+            first_number = None
+            pending_operator = None
+            new_number_started = False
+
+    return display_value(), evaluated
+
+
+def _schedule(roots: list[_Node]) -> list[_Node]:
+    """Ordena os nós das expressões de forma que cada um venha depois dos filhos (sem repetições)."""
+    order, seen = [], set()
+    stack = [(root, False) for root in reversed(roots)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in seen:
+            continue
+        if expanded or node.kind in ("x", "const"):
+            seen.add(id(node))
+            order.append(node)
+            continue
+        stack.append((node, True))
+        for child in reversed(node.args):
+            stack.append((child, False))
+    return order
+
+
+def _literal(value: float) -> str:
+    """Código Python de uma constante (inclusive inf, digitada com dígitos demais)."""
+    return repr(value) if math.isfinite(value) else f"float({repr(value)!r})"
+
+
+def _emit_scalar(result: tuple) -> str:
+    """Gera o código da função escalar, com as verificações de erro da Calculator."""
+    root, evaluated = result
+    names = {}
+    lines = ["def macro(x):"]
+    for node in _schedule(evaluated + [root]):
+        if node.kind == "x":
+            names[id(node)] = "x"
+            continue
+        if node.kind == "const":
+            names[id(node)] = _literal(node.args[0])
+            continue
+        name = f"v{len(names)}"
+        args = [names[id(child)] for child in node.args]
+        if node.kind == "sqrt":
+            lines.append(f"    if {args[0]} < 0: raise NegativeNumberSqrtError({SQRT_MESSAGE!r})")
+            lines.append(f"    {name} = math.sqrt({args[0]})")
+        elif node.kind not in _BINARY:
+            # Operações científicas: a própria função pura, que levanta os erros da Calculator
+            lines.append(f"    {name} = scientific[{node.kind!r}]({args[0]}, {args[1] if len(args) > 1 else None})")
+        else:
+            divisor = node.args[1]
+            if node.kind == '/' and not (divisor.kind == "const" and divisor.args[0] != 0):
+                lines.append(f"    if {args[1]} == 0: raise DivisionByZeroError({DIVISION_MESSAGE!r})")
+            lines.append(f"    {name} = {args[0]} {_BINARY[node.kind]} {args[1]}")
+        names[id(node)] = name
+    lines.append(f"    return float({names[id(root)]})")
+    return "\n".join(lines) + "\n"
+
+
+def _emit_array(result: tuple) -> str:
+    """
+    Gera o código da função vetorizada.
+
+    Os erros seguem a ordem de execução: cada linha recebe o código do
+    primeiro erro que a Calculator levantaria para ela.
+    """
+    root, evaluated = result
+    names = {}
+    lines = ["def macro_array(np, x, errors):"]
+    for node in _schedule(evaluated + [root]):
+        if node.kind == "x":
+            names[id(node)] = "x"
+            continue
+        if node.kind == "const":
+            # Escalar NumPy: operações só entre constantes seguem as regras de erro do NumPy
+            names[id(node)] = f"np.float64({_literal(node.args[0])})"
+            continue
+        name = f"v{len(names)}"
+        args = [names[id(child)] for child in node.args]
+        if node.kind == "sqrt":
+            lines.append(f"    errors[({args[0]} < 0) & (errors == 0)] = {NegativeNumberSqrtError.code}")
+            lines.append(f"    {name} = np.sqrt({args[0]})")
+        elif node.kind not in _BINARY:
+            lines.append(f"    {name} = scientific_array(np, {node.kind!r}, {args[0]}, "
+                         f"{args[1] if len(args) > 1 else None}, errors)")
+        else:
+            divisor = node.args[1]
+            if node.kind == '/' and not (divisor.kind == "const" and divisor.args[0] != 0):
+                lines.append(f"    errors[({args[1]} == 0) & (errors == 0)] = {DivisionByZeroError.code}")
+            lines.append(f"    {name} = {args[0]} {_BINARY[node.kind]} {args[1]}")
+        names[id(node)] = name
+    lines.append(f"    return {names[id(root)]}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,192 @@
+import threading
+import time
+from bisect import bisect_left
+from model.opcodes import NUMBER_KEYS, OPERATORS
+
+# Teclas que são rótulos de si mesmas nas métricas: operadores, "=" e "C"
+_KEY_LABELS = frozenset(OPERATORS + ('=', 'C'))
+
+# Limites superiores dos intervalos dos histogramas de latência, em nanossegundos
+LATENCY_BOUNDS_NS = (
+    250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000,
+    100_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000,
+)
+
+
+def token_label(value: str) -> str:
+    """
+    Classifica uma tecla para as métricas, limitando a cardinalidade dos rótulos.
+
+    Dígitos e ponto viram "number"; operadores, "=" e "C" mantêm o próprio símbolo.
+    """
+    if value in NUMBER_KEYS:
+        return "number"
+    if value in _KEY_LABELS:
+        return value
+    return "other"
+
+
+class Metrics:
+    """
+    Contadores e histogramas de latência do controlador.
+
+    Para cada escopo ("input" para `process_input`, "operation" para
+    `_execute_operation`) e rótulo (tipo de tecla ou operador), guarda a
+    quantidade de chamadas, um histograma de latência e os erros por tipo
+    de exceção. Registrar uma amostra custa uma busca binária e dois
+    incrementos, o que permite manter a instrumentação ligada em produção.
+    """
+
+    def __init__(self):
+        # (escopo, rótulo) -> contagens por intervalo (+Inf no fim) seguidas da soma em ns
+        self._histograms: dict[tuple[str, str], list[int]] = {}
+        # escopo -> rótulo -> histograma (mesmas listas, indexadas sem criar tuplas a cada amostra)
+        self._by_scope: dict[str, dict[str, list[int]]] = {"input": {}, "operation": {}}
+        # (escopo, rótulo, exceção) -> quantidade
+        self._errors: dict[tuple[str, str, str], int] = {}
+
+    def observe(self, scope: str, label: str, elapsed_ns: int) -> None:
+        """
+        Registra uma chamada e sua latência.
+
+        Args:
+            scope: "input" ou "operation".
+            label: Tipo de tecla ou operador.
+            elapsed_ns: Duração da chamada, em nanossegundos.
+        """
+        histogram = self._by_scope[scope].get(label)
+        if histogram is None:
+            histogram = self._histograms[(scope, label)] = [0] * (len(LATENCY_BOUNDS_NS) + 2)
+            self._by_scope[scope][label] = histogram
+        histogram[bisect_left(LATENCY_BOUNDS_NS, elapsed_ns)] += 1
+        histogram[-1] += elapsed_ns
+
+    def record_error(self, scope: str, label: str, error: BaseException) -> None:
+        """
+        Conta um erro pelo tipo da exceção.
+
+        Args:
+            scope: "input" ou "operation".
+            label: Tipo de tecla ou operador.
+            error: Exceção levantada.
+        """
+        key = (scope, label, type(error).__name__)
+        self._errors[key] = self._errors.get(key, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Zera todos os contadores e histogramas.
+        """
+        self._histograms.clear()
+        for histograms in self._by_scope.values():
+            histograms.clear()
+        self._errors.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Retorna uma cópia das métricas em estruturas simples (serializáveis em JSON).
+
+        Returns:
+            dict: Para cada escopo e rótulo, chamadas, soma e histograma (intervalos em ns)
+                  e os erros por tipo de exceção.
+        """
+        result = {"timestamp": time.time(), "bounds_ns": list(LATENCY_BOUNDS_NS), "input": {}, "operation": {}}
+        for (scope, label), histogram in list(self._histograms.items()):
+            result[scope][label] = {
+                "calls": sum(histogram[:-1]),
+                "latency_sum_ns": histogram[-1],
+                "latency_buckets": histogram[:-1],
+                "errors": {},
+            }
+        for (scope, label, error), count in list(self._errors.items()):
+            entry = result[scope].setdefault(label, {"calls": 0, "latency_sum_ns": 0, "latency_buckets": [], "errors": {}})
+            entry["errors"][error] = count
+        return result
+
+    def to_json(self) -> str:
+        """
+        Exporta as métricas em JSON.
+        """
+        import json  # Carregado sob demanda, fora do caminho de inicialização do controlador
+        return json.dumps(self.snapshot())
+
+    def to_prometheus(self) -> str:
+        """
+        Exporta as métricas no formato de texto do Prometheus.
+
+        Returns:
+            str: Histogramas `calculator_<escopo>_latency_seconds` e contadores
+                 `calculator_<escopo>_errors_total`.
+        """
+        label_names = {"input": "token", "operation": "operator"}
+        lines = []
+        for scope in ("input", "operation"):
+            name = f"calculator_{scope}_latency_seconds"
+            lines.append(f"# HELP {name} Latência de {'process_input' if scope == 'input' else '_execute_operation'}.")
+            lines.append(f"# TYPE {name} histogram")
+            for (hist_scope, label), histogram in sorted(self._histograms.items()):
+                if hist_scope != scope:
+                    continue
+                tag = f'{label_names[scope]}="{_escape(label)}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BOUNDS_NS, histogram):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{tag},le="{bound / 1e9:g}"}} {cumulative}')
+                cumulative += histogram[len(LATENCY_BOUNDS_NS)]
+                lines.append(f'{name}_bucket{{{tag},le="+Inf"}} {cumulative}')
+                lines.append(f'{name}_sum{{{tag}}} {histogram[-1] / 1e9:.9f}')
+                lines.append(f'{name}_count{{{tag}}} {cumulative}')
+
+            name = f"calculator_{scope}_errors_total"
+            lines.append(f"# HELP {name} Erros por tipo de exceção.")
+            lines.append(f"# TYPE {name} counter")
+            for (error_scope, label, error), count in sorted(self._errors.items()):
+                if error_scope == scope:
+                    lines.append(f'{name}{{{label_names[scope]}="{_escape(label)}",exception="{error}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label: str) -> str:
+    """Escapa um valor de rótulo do Prometheus."""
+    return label.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class PeriodicExporter:
+    """
+    Exporta periodicamente as métricas em uma thread em segundo plano.
+
+    Uso:
+        exporter = PeriodicExporter(metrics, 60, lambda text: open("metrics.prom", "w").write(text))
+        exporter.start()
+        ...
+        exporter.stop()
+    """
+
+    def __init__(self, metrics: Metrics, interval: float, write, fmt: str = "prometheus"):
+        """
+        Args:
+            metrics: Métricas a exportar.
+            interval: Intervalo entre exportações, em segundos.
+            write: Função que recebe o texto exportado.
+            fmt: "prometheus" ou "json".
+        """
+        self.metrics = metrics
+        self.interval = interval
+        self.write = write
+        self.export = metrics.to_json if fmt == "json" else metrics.to_prometheus
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """Inicia as exportações periódicas."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe as exportações, fazendo uma última exportação."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write(self.export())
+        self.write(self.export())
@@ -0,0 +1,137 @@
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+from model.calculator import Calculator
+from controller.headless import HeadlessController
+
+
+@dataclass
+class ReplayReport:
+    """
+    Resultado da reprodução de uma sequência de teclas.
+
+    Attributes:
+        display: Texto final do display.
+        current_value: Valor final da calculadora.
+        keystrokes: Quantidade de teclas processadas.
+        ignored: Teclas rejeitadas pelo controlador (ex.: operador com mensagem de erro no display).
+        elapsed: Tempo total de processamento, em segundos.
+    """
+    display: str
+    current_value: float
+    keystrokes: int
+    ignored: int
+    elapsed: float
+
+    @property
+    def keystrokes_per_second(self) -> float:
+        """Vazão da reprodução, em teclas por segundo."""
+        return self.keystrokes / self.elapsed if self.elapsed else float('inf')
+
+
+def read_tokens(path: str) -> Iterator[str]:
+    """
+    Lê as teclas de um arquivo, separadas por espaços ou quebras de linha.
+
+    O arquivo é lido linha a linha, sem carregá-lo inteiro na memória.
+
+    Args:
+        path: Caminho do arquivo ("-" para a entrada padrão).
+
+    Yields:
+        str: Cada tecla, como emitida pelos botões da GUI.
+    """
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in stream:
+            yield from line.split()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def replay(tokens: Iterable[str], controller: HeadlessController | None = None) -> ReplayReport:
+    """
+    Reproduz uma sequência de teclas na máquina de estados do controlador.
+
+    Os erros que a GUI apenas registraria no console (ValueError ao operar
+    sobre uma mensagem de erro) são contados e ignorados, como no Tk.
+
+    Args:
+        tokens: Teclas a serem processadas (lista, gerador ou `read_tokens`).
+        controller: Controlador a ser usado. Se omitido, cria um sem display.
+
+    Returns:
+        ReplayReport: Valores finais e vazão da reprodução.
+    """
+    if controller is None:
+        controller = HeadlessController(Calculator())
+    process_input = controller.process_input
+    keystrokes = 0
+    ignored = 0
+
+    start = time.perf_counter()
+    for token in tokens:
+        keystrokes += 1
+        try:
+            process_input(token)
+        except ValueError:
+            ignored += 1
+    elapsed = time.perf_counter() - start
+
+    return ReplayReport(
+        display=controller.display_text,
+        current_value=controller.calculator.current_value,
+        keystrokes=keystrokes,
+        ignored=ignored,
+        elapsed=elapsed,
+    )
+
+
+def replay_task(task, tokens: list[str], calculator: Calculator, chunk_size: int = 10_000) -> HeadlessController:
+    """
+    Reproduz teclas em uma thread de trabalho (ver controller/background.py).
+
+    Processa as teclas em blocos, informando o progresso e verificando o
+    cancelamento entre os blocos. Usa um controlador próprio, sem display,
+    então pode rodar fora da thread da interface.
+
+    Args:
+        task: BackgroundTask que executa a reprodução.
+        tokens: Teclas a serem processadas.
+        calculator: Calculadora do controlador sem display (não compartilhada com a interface).
+        chunk_size: Teclas processadas entre as verificações de cancelamento.
+
+    Returns:
+        HeadlessController: Controlador no estado final da reprodução.
+
+    Raises:
+        CancelledError: Se a tarefa for cancelada.
+    """
+    controller = HeadlessController(calculator)
+    total = len(tokens)
+    for start in range(0, total, chunk_size):
+        task.check_cancelled()
+        replay(tokens[start:start + chunk_size], controller)
+        task.report(min(start + chunk_size, total), total)
+    return controller
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Reproduz um arquivo de teclas e exibe o resultado e a vazão.
+
+    Uso:
+        PYTHONPATH=src python -m controller.replay teclas.txt
+    """
+    args = sys.argv[1:] if argv is None else argv
+    report = replay(read_tokens(args[0] if args else "-"))
+    print(f"Display: {report.display}")
+    print(f"Valor atual: {report.current_value}")
+    print(f"Teclas: {report.keystrokes} ({report.ignored} ignoradas)")
+    print(f"Vazão: {report.keystrokes_per_second:,.0f} teclas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+import time
+from array import array
+from model.calculator import Calculator
+from controller.headless import HeadlessController
+
+# Operadores pendentes possíveis, indexados pelo código guardado em `pending_operator`
+_OPERATORS = (None, '+', '-', '*', '/', '^', 'root')
+_OPERATOR_CODES = {operator: code for code, operator in enumerate(_OPERATORS)}
+
+# Bits do array de flags de cada sessão
+_NEW_NUMBER = 1     # new_number_started
+_HAS_FIRST = 2      # first_number não é None
+_TYPING = 4         # o display mostra o número em digitação
+_HAS_DIGITS = 8     # o número em digitação tem ao menos um dígito
+_HAS_VALUE = 16     # o display mostra um número (e não uma mensagem)
+
+# Bits usados para o índice da sessão dentro do identificador (o restante é a geração)
+_SLOT_BITS = 32
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+
+
+class SessionManager:
+    """
+    Gerenciador de muitas sessões de calculadora em um único processo.
+
+    Em vez de um par Calculator + Controller por usuário, o estado de cada
+    sessão (`current_value`, `first_number`, `pending_operator`,
+    `new_number_started` e o número em digitação) é guardado em arrays
+    tipados, indexados pela posição da sessão. Um único HeadlessController
+    sem display é carregado com o estado da sessão a cada tecla, de modo
+    que a máquina de estados é exatamente a mesma do controlador.
+
+    Os identificadores de sessão combinam a posição e uma geração; quando uma
+    sessão é encerrada ou expira, sua posição é reutilizada e identificadores
+    antigos deixam de ser aceitos.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o gerenciador sem sessões.
+        """
+        self._controller = HeadlessController(Calculator())  # Controlador compartilhado por todas as sessões
+
+        self._current_value = array('d')
+        self._first_number = array('d')
+        self._pending_operator = array('B')
+        self._flags = array('B')
+        self._value = array('d')          # Número exibido, quando não está em digitação
+        self._scale = array('i')          # Casas decimais do número em digitação
+        self._last_seen = array('d')      # Instante (time.monotonic) do último uso
+        self._generation = array('I')     # Incrementada a cada reutilização da posição
+        self._mantissa = []               # Dígitos em digitação, como inteiro
+        self._text = []                   # Texto em digitação ou mensagem exibida
+
+        self._free = []                   # Posições livres para reutilização
+        self._active = 0
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de sessões ativas.
+        """
+        return self._active
+
+    def __contains__(self, session: int) -> bool:
+        """
+        Indica se a sessão ainda está aberta (não foi encerrada nem expirou).
+        """
+        try:
+            self._slot(session)
+        except KeyError:
+            return False
+        return True
+
+    def open(self) -> int:
+        """
+        Cria uma nova sessão no estado inicial da calculadora.
+
+        Returns:
+            int: Identificador da sessão.
+        """
+        now = time.monotonic()
+        if self._free:
+            slot = self._free.pop()
+            generation = self._generation[slot]
+        else:
+            slot = len(self._flags)
+            generation = 0
+            self._current_value.append(0.0)
+            self._first_number.append(0.0)
+            self._pending_operator.append(0)
+            self._flags.append(0)
+            self._value.append(0.0)
+            self._scale.append(-1)
+            self._last_seen.append(now)
+            self._generation.append(generation)
+            self._mantissa.append(0)
+            self._text.append("0")
+
+        self._controller._process_clear()
+        self._store(slot)
+        self._last_seen[slot] = now
+        self._active += 1
+        return (generation << _SLOT_BITS) | slot
+
+    def close(self, session: int) -> None:
+        """
+        Encerra uma sessão e libera sua posição.
+
+        Args:
+            session: Identificador retornado por `open`.
+
+        Raises:
+            KeyError: Se a sessão não existir ou já tiver expirado.
+        """
+        self._release(self._slot(session))
+
+    def process_input(self, session: int, value: str) -> None:
+        """
+        Processa uma tecla na sessão informada.
+
+        Args:
+            session: Identificador retornado por `open`.
+            value: Tecla, como emitida pelos botões da GUI.
+
+        Raises:
+            KeyError: Se a sessão não existir ou já tiver expirado.
+            ValueError: Se um operador for aplicado a um display sem número,
+                        como na GUI. O estado da sessão não é alterado.
+        """
+        slot = self._slot(session)
+        self._load(slot)
+        self._last_seen[slot] = time.monotonic()
+        self._controller.process_input(value)
+        self._store(slot)
+
+    def display_text(self, session: int) -> str:
+        """
+        Retorna o texto que a GUI da sessão estaria exibindo.
+
+        Args:
+            session: Identificador retornado por `open`.
+        """
+        self._load(self._slot(session))
+        return self._controller.display_text
+
+    def current_value(self, session: int) -> float:
+        """
+        Retorna o `current_value` da calculadora da sessão.
+
+        Args:
+            session: Identificador retornado por `open`.
+        """
+        return self._current_value[self._slot(session)]
+
+    def evict_idle(self, max_idle: float, now: float | None = None) -> int:
+        """
+        Encerra as sessões sem uso há mais de `max_idle` segundos.
+
+        Args:
+            max_idle: Tempo máximo de inatividade, em segundos.
+            now: Instante de referência (time.monotonic). Padrão: agora.
+
+        Returns:
+            int: Quantidade de sessões encerradas.
+        """
+        deadline = (time.monotonic() if now is None else now) - max_idle
+        evicted = 0
+        for slot, last_seen in enumerate(self._last_seen):
+            # Posições livres têm last_seen negativo
+            if 0 <= last_seen < deadline:
+                self._release(slot)
+                evicted += 1
+        return evicted
+
+    def _slot(self, session: int) -> int:
+        """Converte o identificador em posição, validando a geração."""
+        slot = session & _SLOT_MASK
+        if (slot >= len(self._flags) or self._generation[slot] != session >> _SLOT_BITS
+                or self._last_seen[slot] < 0):
+            raise KeyError(f"Sessão inexistente ou expirada: {session}")
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Libera a posição, invalidando os identificadores que apontam para ela."""
+        self._generation[slot] = (self._generation[slot] + 1) & 0xFFFFFFFF
+        self._last_seen[slot] = -1.0  # Marca a posição como livre
+        self._mantissa[slot] = 0
+        self._text[slot] = "0"
+        self._free.append(slot)
+        self._active -= 1
+
+    def _load(self, slot: int) -> None:
+        """Carrega o estado da sessão no controlador compartilhado."""
+        c = self._controller
+        flags = self._flags[slot]
+        c.calculator.current_value = self._current_value[slot]
+        c.first_number = self._first_number[slot] if flags & _HAS_FIRST else None
+        c.pending_operator = _OPERATORS[self._pending_operator[slot]]
+        c.new_number_started = bool(flags & _NEW_NUMBER)
+        c._typing = bool(flags & _TYPING)
+        c._has_digits = bool(flags & _HAS_DIGITS)
+        c._scale = self._scale[slot]
+        c._mantissa = self._mantissa[slot]
+        c._value = self._value[slot] if flags & _HAS_VALUE else None
+        # O texto em digitação e a mensagem de erro nunca são exibidos ao mesmo tempo
+        c._entry = c._message = self._text[slot]
+
+    def _store(self, slot: int) -> None:
+        """Salva o estado do controlador compartilhado na posição da sessão."""
+        c = self._controller
+        flags = 0
+        if c.new_number_started:
+            flags |= _NEW_NUMBER
+        if c.first_number is not None:
+            flags |= _HAS_FIRST
+            self._first_number[slot] = c.first_number
+        if c._typing:
+            flags |= _TYPING
+            self._text[slot] = c._entry
+        if c._has_digits:
+            flags |= _HAS_DIGITS
+        if c._value is not None:
+            flags |= _HAS_VALUE
+            self._value[slot] = c._value
+        elif not c._typing:
+            self._text[slot] = c._message
+        self._flags[slot] = flags
+        self._current_value[slot] = c.calculator.current_value
+        self._pending_operator[slot] = _OPERATOR_CODES[c.pending_operator]
+        self._scale[slot] = c._scale
+        self._mantissa[slot] = c._mantissa
@@ -2,7 +2,6 @@ import sys
 sys.path.append('src')  # Adiciona o diretório 'src' ao path para permitir importações locais
 
 from model.calculator import Calculator
-from view.gui import Gui
 from controller.controller import Controller
 
 def main():
@@ -16,6 +15,9 @@ def main():
         4. Conecta a GUI ao controlador.
         5. Inicia o loop principal da interface gráfica.
     """
+    # A view é importada só aqui: importar este módulo não carrega o tkinter
+    from view.gui import Gui
+
     # Cria a instância do modelo da calculadora
     calculator = Calculator()
 
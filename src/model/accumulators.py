@@ -0,0 +1,390 @@
+import math
+
+
+class KahanSum:
+    """
+    Soma compensada (Kahan-Neumaier) de um fluxo de valores, com memória constante.
+
+    Guarda, além da soma, o erro de arredondamento acumulado, então somar
+    milhões de valores de magnitudes diferentes não perde os menores.
+
+    Uso:
+        total = KahanSum()
+        for value in valores:
+            total.add(value)
+        total.value
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def add(self, value: float) -> float:
+        """
+        Adiciona um valor à soma.
+
+        Args:
+            value: Valor a ser somado.
+
+        Returns:
+            float: A soma atual.
+        """
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+        return self.value
+
+    def merge(self, other: "KahanSum") -> "KahanSum":
+        """
+        Incorpora a soma de outro acumulador (ex.: de outra thread ou processo).
+
+        Returns:
+            KahanSum: Este acumulador.
+        """
+        self.add(other._sum)
+        self._compensation += other._compensation
+        return self
+
+    def clear(self) -> None:
+        """Zera a soma."""
+        self._sum = 0.0
+        self._compensation = 0.0    # Erro de arredondamento acumulado
+
+    @property
+    def value(self) -> float:
+        """Soma atual, com a compensação aplicada (infinita se algum valor for infinito)."""
+        if math.isinf(self._sum):
+            return self._sum    # A compensação de inf - inf é NaN e não se aplica
+        return self._sum + self._compensation
+
+    def __str__(self):
+        return str(self.value)
+
+
+class RunningStats:
+    """
+    Quantidade, média, variância, mínimo e máximo de um fluxo, pelo algoritmo de Welford.
+
+    Atualiza a média e a soma dos quadrados dos desvios a cada valor, sem
+    guardar os valores e sem o cancelamento catastrófico de `E[x²] - E[x]²`.
+    Dois acumuladores podem ser combinados (Chan et al.).
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def add(self, value: float) -> float:
+        """
+        Adiciona um valor às estatísticas.
+
+        Args:
+            value: Valor observado.
+
+        Returns:
+            float: A média atual.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        return self.mean
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Incorpora as estatísticas de outro acumulador (ex.: de outra thread ou processo).
+
+        Returns:
+            RunningStats: Este acumulador.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def clear(self) -> None:
+        """Descarta todos os valores observados."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0              # Soma dos quadrados dos desvios em relação à média
+        self.min = math.inf
+        self.max = -math.inf
+
+    def variance(self, sample: bool = False) -> float:
+        """
+        Variância dos valores observados.
+
+        Args:
+            sample: Se verdadeiro, usa o denominador n - 1 (variância amostral).
+
+        Returns:
+            float: A variância, ou NaN se não houver valores suficientes.
+        """
+        denominator = self.count - 1 if sample else self.count
+        return self._m2 / denominator if denominator > 0 else math.nan
+
+    def stddev(self, sample: bool = False) -> float:
+        """Desvio padrão (raiz da variância)."""
+        return math.sqrt(self.variance(sample))
+
+
+class QuantileSketch:
+    """
+    Resumo mergeável para quantis com erro relativo garantido (no estilo do DDSketch).
+
+    Cada valor é contado em um intervalo logarítmico `(γ^(i-1), γ^i]`, com
+    `γ = (1 + α) / (1 - α)`; o quantil devolvido tem erro relativo de no
+    máximo `α`. A memória depende da faixa de magnitudes, não da quantidade de
+    valores, e fica limitada a `max_buckets` intervalos por sinal (acima disso,
+    os intervalos de menor magnitude são unidos). Dois resumos com o mesmo `α`
+    são combinados somando as contagens. Os infinitos são contados à parte,
+    nos extremos; NaN não tem posição entre os quantis e é rejeitado.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        Args:
+            relative_accuracy: Erro relativo máximo dos quantis (α), entre 0 e 1.
+            max_buckets: Quantidade máxima de intervalos para cada sinal.
+
+        Raises:
+            ValueError: Se a precisão estiver fora do intervalo (0, 1).
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("A precisão relativa deve estar entre 0 e 1.")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.clear()
+
+    def add(self, value: float) -> None:
+        """
+        Conta um valor no resumo.
+
+        Args:
+            value: Valor observado.
+
+        Raises:
+            ValueError: Se o valor for NaN.
+        """
+        if value > 0:
+            if value == math.inf:
+                self._infinities[1] += 1
+            else:
+                self._add_to(self._positive, value)
+        elif value < 0:
+            if value == -math.inf:
+                self._infinities[0] += 1
+            else:
+                self._add_to(self._negative, -value)
+        elif value == 0:
+            self._zeros += 1
+        else:
+            raise ValueError("NaN não pode ser contado no resumo de quantis.")
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Incorpora as contagens de outro resumo (ex.: de outra thread ou processo).
+
+        Returns:
+            QuantileSketch: Este resumo.
+
+        Raises:
+            ValueError: Se os resumos tiverem precisões diferentes.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Só é possível combinar resumos com a mesma precisão relativa.")
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+            self._collapse(mine)
+        self._zeros += other._zeros
+        self._infinities = [mine + theirs for mine, theirs in zip(self._infinities, other._infinities)]
+        self.count += other.count
+        return self
+
+    def clear(self) -> None:
+        """Descarta todos os valores contados."""
+        self.count = 0
+        self._zeros = 0
+        self._infinities = [0, 0]              # Quantidade de -inf e de +inf
+        self._positive: dict[int, int] = {}    # Índice do intervalo -> quantidade (valores > 0)
+        self._negative: dict[int, int] = {}    # Idem, para o módulo dos valores < 0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima o quantil `q` dos valores contados.
+
+        Args:
+            q: Quantil desejado, entre 0 e 1 (0.5 = mediana, 0.99 = p99).
+
+        Returns:
+            float: O quantil estimado, ou NaN se nenhum valor foi contado.
+
+        Raises:
+            ValueError: Se `q` estiver fora de [0, 1].
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("O quantil deve estar entre 0 e 1.")
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self._infinities[0]
+        if seen > rank:
+            return -math.inf
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._bucket_value(index)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._bucket_value(index)
+        return math.inf if self._infinities[1] else self._bucket_value(max(self._positive))
+
+    def _add_to(self, buckets: dict[int, int], magnitude: float) -> None:
+        """Conta uma magnitude positiva no intervalo correspondente."""
+        index = math.ceil(math.log(magnitude) / self._log_gamma)
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def _collapse(self, buckets: dict[int, int]) -> None:
+        """Une os intervalos de menor magnitude até respeitar `max_buckets`."""
+        if len(buckets) <= self.max_buckets:
+            return
+        indexes = sorted(buckets)
+        excess = indexes[:len(indexes) - self.max_buckets + 1]
+        buckets[excess[-1]] = sum(buckets.pop(index) for index in excess)
+
+    def _bucket_value(self, index: int) -> float:
+        """Valor representativo do intervalo: erro relativo de no máximo α para qualquer valor dele."""
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+
+class StreamingStats:
+    """
+    Estatísticas de um fluxo de valores com memória constante.
+
+    Combina a soma compensada, as estatísticas de Welford e o resumo de
+    quantis, com o mesmo ciclo da Calculator: `add` para cada valor e
+    `clear` para recomeçar. Acumuladores preenchidos em threads ou processos
+    diferentes são combinados com `merge` (as instâncias podem ser serializadas
+    com pickle).
+
+    Uso:
+        stats = StreamingStats()
+        for value in valores:
+            stats.add(value)
+        stats.summary()  # {"count": ..., "sum": ..., "mean": ..., "p50": ..., ...}
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Args:
+            relative_accuracy: Erro relativo máximo dos quantis.
+        """
+        self.total = KahanSum()
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        """
+        Adiciona um valor a todos os acumuladores.
+
+        Args:
+            value: Valor observado (infinitos são aceitos).
+
+        Raises:
+            ValueError: Se o valor for NaN; nenhum acumulador é alterado.
+        """
+        self.sketch.add(value)    # Primeiro, pois rejeita NaN
+        self.total.add(value)
+        self.stats.add(value)
+
+    def merge(self, other: "StreamingStats") -> "StreamingStats":
+        """
+        Incorpora outro acumulador.
+
+        Returns:
+            StreamingStats: Este acumulador.
+        """
+        self.total.merge(other.total)
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def clear(self) -> None:
+        """Descarta todos os valores observados."""
+        self.total.clear()
+        self.stats.clear()
+        self.sketch.clear()
+
+    @property
+    def count(self) -> int:
+        return self.stats.count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima o quantil `q`, limitado ao mínimo e ao máximo exatos.
+
+        Os quantis 0 e 1 são o mínimo e o máximo exatos.
+        """
+        if self.count == 0:
+            return math.nan
+        if q == 0:
+            return self.stats.min
+        if q == 1:
+            return self.stats.max
+        return min(max(self.sketch.quantile(q), self.stats.min), self.stats.max)
+
+    def summary(self, quantiles: tuple[float, ...] = (0.5, 0.9, 0.99)) -> dict:
+        """
+        Retorna as estatísticas atuais.
+
+        Args:
+            quantiles: Quantis a incluir (chaves "p50", "p90", ...).
+
+        Returns:
+            dict: count, sum, mean, variance, stddev, min, max e os quantis pedidos.
+        """
+        empty = self.count == 0
+        total = self.total.value
+        if empty:
+            mean = math.nan
+        elif math.isinf(total):
+            mean = total          # Welford daria NaN depois de um infinito seguido de valores finitos
+        else:
+            mean = self.stats.mean
+        summary = {
+            "count": self.count,
+            "sum": total,
+            "mean": mean,
+            "variance": self.stats.variance(),
+            "stddev": self.stats.stddev(),
+            "min": math.nan if empty else self.stats.min,
+            "max": math.nan if empty else self.stats.max,
+        }
+        for q in quantiles:
+            summary[f"p{q * 100:g}"] = self.quantile(q)
+        return summary
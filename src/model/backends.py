@@ -0,0 +1,271 @@
+import math
+from decimal import Context, Decimal, DecimalException, InvalidOperation, Overflow, ROUND_HALF_EVEN
+from fractions import Fraction
+from . import operations
+from .calculator import Calculator
+from .exceptions import DivisionByZeroError, DomainError, NegativeNumberSqrtError, ResultOverflowError
+from .opcodes import OPERATORS, OPCODES
+from .operations import OVERFLOW_MESSAGE
+
+# Operações científicas, calculadas em float nos tipos numéricos que não as têm
+SCIENTIFIC_OPERATORS = OPERATORS[OPCODES['^']:]
+
+# Tamanho máximo (em bits por fator) de uma potência exata de frações; acima dele, a potência
+# é calculada em float. Mantém o resultado bem abaixo do limite de dígitos da conversão de int em texto.
+MAX_EXACT_POWER_BITS = 4096
+
+# Tamanho máximo (em bits) do numerador e do denominador de um resultado em frações. Operações
+# encadeadas (ex.: elevar ao quadrado repetidamente) crescem sem limite; acima dele, o resultado
+# é tratado como estouro, antes de passar do limite de dígitos da conversão de int em texto.
+MAX_FRACTION_BITS = 3 * MAX_EXACT_POWER_BITS
+
+
+def _to_float(value) -> float:
+    """
+    Converte um operando em float.
+
+    Raises:
+        ResultOverflowError: Se o valor estiver fora do intervalo do float.
+    """
+    try:
+        result = float(value)
+    except OverflowError:
+        raise ResultOverflowError(OVERFLOW_MESSAGE) from None
+    if math.isinf(result):   # Decimal grande demais vira infinito, sem exceção
+        raise ResultOverflowError(OVERFLOW_MESSAGE)
+    return result
+
+
+def _through_float(function, convert):
+    """
+    Adapta uma operação de float para outro tipo numérico.
+
+    Os operandos são convertidos em float e o resultado volta pelo texto
+    (`repr`), para que 0.1 continue sendo 0.1 e não a expansão binária do float.
+    Operandos fora do intervalo do float levantam ResultOverflowError.
+    """
+    def operation(a, b=None):
+        return convert(repr(function(_to_float(a), None if b is None else _to_float(b))))
+    return operation
+
+
+def _scientific_dispatch(convert) -> dict:
+    """Monta a tabela das operações científicas calculadas em float, com o resultado convertido por `convert`."""
+    return {operator: _through_float(operations.DISPATCH[operator], convert) for operator in SCIENTIFIC_OPERATORS}
+
+
+def _decimal_checked(function):
+    """
+    Adapta uma operação decimal para as exceções da calculadora.
+
+    O contexto sinaliza resultados fora do expoente máximo com `decimal.Overflow`
+    e operações indefinidas (ex.: infinito - infinito) com `InvalidOperation`;
+    elas viram ResultOverflowError e DomainError, como no caminho float.
+    """
+    def operation(a, b=None):
+        try:
+            return function(a, b)
+        except Overflow:
+            raise ResultOverflowError(OVERFLOW_MESSAGE) from None
+        except InvalidOperation:
+            raise DomainError("Operação indefinida para os valores informados.") from None
+    return operation
+
+
+def _fraction_checked(function):
+    """
+    Adapta uma operação de frações para recusar resultados grandes demais.
+
+    Numerador ou denominador acima de MAX_FRACTION_BITS levantam
+    ResultOverflowError, em vez de crescer até esgotar a memória ou falhar
+    ao ser exibido.
+    """
+    def operation(a, b=None):
+        result = function(a, b)
+        if max(abs(result.numerator).bit_length(), result.denominator.bit_length()) > MAX_FRACTION_BITS:
+            raise ResultOverflowError(OVERFLOW_MESSAGE)
+        return result
+    return operation
+
+
+def _decimal_dispatch(context: Context) -> dict:
+    """
+    Monta a tabela de operações de um contexto decimal.
+
+    As funções arredondam com a precisão do contexto, sem tocar no contexto
+    global da thread, e têm a mesma assinatura `f(a, b)` de `model/operations.py`.
+    """
+    def divide(a: Decimal, b: Decimal) -> Decimal:
+        if b == 0:
+            raise DivisionByZeroError("Não é possível dividir por zero.")
+        return context.divide(a, b)
+
+    def sqrt(a: Decimal, b=None) -> Decimal:
+        if a < 0:
+            raise NegativeNumberSqrtError("Não é possível calcular a raiz quadrada de um número negativo.")
+        return context.sqrt(a)
+
+    def percent(a: Decimal, base: Decimal) -> Decimal:
+        return context.divide(context.multiply(base, a), 100)
+
+    table = {'+': context.add, '-': context.subtract, '*': context.multiply,
+             '/': divide, 'sqrt': sqrt, '%': percent,
+             **_scientific_dispatch(context.create_decimal)}
+    return {operator: _decimal_checked(function) for operator, function in table.items()}
+
+
+def _fraction_sqrt(a: Fraction, b=None) -> Fraction:
+    """Raiz quadrada exata para quadrados perfeitos; nos demais casos, aproximada pela raiz em float."""
+    if a < 0:
+        raise NegativeNumberSqrtError("Não é possível calcular a raiz quadrada de um número negativo.")
+    numerator, denominator = math.isqrt(a.numerator), math.isqrt(a.denominator)
+    if numerator * numerator == a.numerator and denominator * denominator == a.denominator:
+        return Fraction(numerator, denominator)
+    return Fraction(math.sqrt(a))
+
+
+def _fraction_power(a: Fraction, b: Fraction) -> Fraction:
+    """
+    Potência exata para expoentes inteiros de resultado pequeno; nos demais casos, calculada em float.
+
+    O tamanho do resultado exato é estimado antes do cálculo, para que um
+    expoente enorme (2 ^ 1000000000) não esgote o tempo e a memória: acima de
+    MAX_EXACT_POWER_BITS, a potência em float dá um valor aproximado ou
+    ResultOverflowError.
+    """
+    if b.denominator == 1 and not (a == 0 and b < 0):
+        bits = max(abs(a.numerator).bit_length(), a.denominator.bit_length()) - 1
+        if bits * abs(b.numerator) <= MAX_EXACT_POWER_BITS:
+            return a ** b.numerator
+    return _FRACTION_SCIENTIFIC['^'](a, b)
+
+
+_FRACTION_SCIENTIFIC = _scientific_dispatch(Fraction)
+
+
+class DecimalCalculator(Calculator):
+    """
+    Calculadora com aritmética decimal (`decimal.Decimal`) e precisão configurável.
+
+    Evita os erros de representação binária do float (0.1 + 0.2 == 0.3). Cada
+    instância tem seu próprio contexto decimal, então sessões com precisões
+    diferentes podem coexistir na mesma thread sem alterar o contexto global.
+    As operações científicas (potência, logaritmos, trigonometria...) são
+    calculadas em float e convertidas de volta para Decimal.
+    """
+
+    backend = "decimal"
+    zero = Decimal(0)
+
+    def __init__(self, precision: int = 28):
+        """
+        Args:
+            precision: Quantidade de dígitos significativos dos resultados.
+        """
+        self.context = Context(prec=precision, rounding=ROUND_HALF_EVEN)
+        self.dispatch = _decimal_dispatch(self.context)
+        super().__init__()
+
+    def parse(self, text: str) -> Decimal:
+        """
+        Converte o texto do display em Decimal, arredondado para a precisão do contexto.
+
+        Raises:
+            ValueError: Se o texto não for um número, como `float()`.
+        """
+        try:
+            return self.context.create_decimal(text)
+        except DecimalException:
+            raise ValueError(f"Número decimal inválido: {text!r}") from None
+
+    @staticmethod
+    def format(value: Decimal) -> str:
+        """Converte um Decimal no texto do display, sem notação científica."""
+        return f"{value:f}"
+
+    def from_digits(self, mantissa: int, scale: int) -> Decimal:
+        """Converte um número digitado (inteiro e casas decimais) em Decimal."""
+        return self.context.create_decimal(mantissa).scaleb(-scale if scale > 0 else 0, self.context)
+
+
+class FractionCalculator(Calculator):
+    """
+    Calculadora com aritmética racional exata (`fractions.Fraction`).
+
+    Soma, subtração, multiplicação, divisão, porcentagem e potências de
+    expoente inteiro (até MAX_EXACT_POWER_BITS) são exatas; resultados com mais
+    de MAX_FRACTION_BITS no numerador ou no denominador levantam ResultOverflowError. A raiz quadrada é exata para quadrados
+    perfeitos e, nos demais casos, aproximada pela raiz em float; as demais
+    operações científicas são calculadas em float.
+    """
+
+    backend = "fraction"
+    zero = Fraction(0)
+    parse = Fraction
+    dispatch = {operator: _fraction_checked(function) for operator, function in
+                {**Calculator.dispatch, **_FRACTION_SCIENTIFIC, 'sqrt': _fraction_sqrt, '^': _fraction_power}.items()}
+
+    @staticmethod
+    def format(value: Fraction) -> str:
+        """
+        Converte uma fração no texto do display.
+
+        Frações com representação decimal finita (denominador só com fatores 2 e 5)
+        são exibidas como decimal; as demais como "numerador/denominador", que
+        `Fraction` também aceita de volta.
+        """
+        denominator = value.denominator
+        if denominator == 1:
+            return str(value.numerator)
+        twos = (denominator & -denominator).bit_length() - 1
+        rest = denominator >> twos
+        fives = 0
+        while rest % 5 == 0:
+            rest //= 5
+            fives += 1
+        if rest != 1:
+            return f"{value.numerator}/{denominator}"
+        digits = max(twos, fives)
+        scaled = abs(value.numerator) * 10 ** digits // denominator
+        sign = "-" if value < 0 else ""
+        return f"{sign}{scaled // 10 ** digits}.{scaled % 10 ** digits:0{digits}d}"
+
+    @staticmethod
+    def from_digits(mantissa: int, scale: int) -> Fraction:
+        """Converte um número digitado (inteiro e casas decimais) em fração exata."""
+        return Fraction(mantissa, 10 ** scale) if scale > 0 else Fraction(mantissa)
+
+
+# Tipos numéricos disponíveis, pelo nome
+BACKENDS = {
+    "float": Calculator,
+    "decimal": DecimalCalculator,
+    "fraction": FractionCalculator,
+}
+
+
+def create_calculator(backend: str = "float", precision: int | None = None) -> Calculator:
+    """
+    Cria uma calculadora com o tipo numérico escolhido.
+
+    A escolha é feita uma única vez, pela classe da calculadora: as operações
+    de cada sessão não testam o tipo numérico, e o caminho float é a própria
+    Calculator, sem nenhum custo adicional.
+
+    Args:
+        backend: "float", "decimal" ou "fraction".
+        precision: Dígitos significativos (apenas para "decimal").
+
+    Returns:
+        Calculator: Instância da calculadora correspondente.
+
+    Raises:
+        ValueError: Se o tipo numérico for desconhecido ou a precisão não se aplicar a ele.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Tipo numérico desconhecido: {backend!r} (opções: {', '.join(BACKENDS)})")
+    if precision is not None:
+        if backend != "decimal":
+            raise ValueError("A precisão só se aplica ao tipo numérico 'decimal'.")
+        return DecimalCalculator(precision)
+    return BACKENDS[backend]()
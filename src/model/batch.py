@@ -0,0 +1,375 @@
+import math
+import numpy as np
+from .exceptions import DivisionByZeroError, NegativeNumberSqrtError, DomainError, ResultOverflowError, NO_ERROR
+from .exceptions import ERROR_TYPES, OPERATION_ERRORS
+from .opcodes import OPERATORS  # Operadores aceitos pela avaliação em lote (mesmo conjunto do Controller)
+from .operations import EXACT_LIMIT, MAX_FACTORIAL, OVERFLOW_MESSAGE, factorial
+
+# Fatoriais de 0 a MAX_FACTORIAL, iguais aos do caminho escalar (fatorial exato arredondado para float)
+FACTORIALS = np.array([float(math.factorial(n)) for n in range(MAX_FACTORIAL + 1)])
+
+# Funções NumPy das operações científicas de um operando, sem restrição além das verificadas em `evaluate`
+_UNARY_UFUNCS = {'log': np.log10, 'ln': np.log, 'exp': np.exp, 'sin': np.sin, 'cos': np.cos, 'tan': np.tan}
+
+class BatchCalculator:
+    """
+    Versão vetorizada da Calculator, que opera sobre arrays NumPy inteiros.
+
+    Cada elemento de `current_values` se comporta como o `current_value` de uma
+    Calculator independente: a mesma operação é aplicada a todos os elementos
+    em uma única chamada vetorizada, produzindo os mesmos resultados (float64)
+    que o caminho escalar.
+    """
+
+    def __init__(self, values=None):
+        """
+        Inicializa a calculadora vetorizada.
+
+        Args:
+            values: Valores iniciais (qualquer sequência ou array). Se omitido,
+                    a calculadora começa com um array vazio.
+        """
+        if values is None:
+            self.current_values = np.zeros(0, dtype=np.float64)
+        else:
+            # Copia os dados para que as operações in-place não alterem o array do chamador
+            self.current_values = np.array(values, dtype=np.float64)
+
+    def add(self, values) -> np.ndarray:
+        """
+        Adiciona valores (escalar ou array do mesmo tamanho) aos valores atuais.
+
+        Args:
+            values: Número ou array a ser somado elemento a elemento.
+
+        Returns:
+            np.ndarray: Os novos valores atuais.
+        """
+        np.add(self.current_values, values, out=self.current_values)
+        return self.current_values
+
+    def subtract(self, values) -> np.ndarray:
+        """
+        Subtrai valores (escalar ou array do mesmo tamanho) dos valores atuais.
+
+        Args:
+            values: Número ou array a ser subtraído elemento a elemento.
+
+        Returns:
+            np.ndarray: Os novos valores atuais.
+        """
+        np.subtract(self.current_values, values, out=self.current_values)
+        return self.current_values
+
+    def multiply(self, values) -> np.ndarray:
+        """
+        Multiplica os valores atuais por valores (escalar ou array).
+
+        Args:
+            values: Número ou array pelo qual multiplicar elemento a elemento.
+
+        Returns:
+            np.ndarray: Os novos valores atuais.
+        """
+        np.multiply(self.current_values, values, out=self.current_values)
+        return self.current_values
+
+    def divide(self, values) -> np.ndarray:
+        """
+        Divide os valores atuais por valores (escalar ou array).
+
+        Args:
+            values: Número ou array pelo qual dividir elemento a elemento.
+
+        Returns:
+            np.ndarray: Os novos valores atuais.
+
+        Raises:
+            DivisionByZeroError: Se algum divisor for zero. Nenhum valor é alterado.
+        """
+        if np.any(np.equal(values, 0)):
+            raise DivisionByZeroError("Não é possível dividir por zero.")
+        np.divide(self.current_values, values, out=self.current_values)
+        return self.current_values
+
+    def sqrt(self) -> np.ndarray:
+        """
+        Calcula a raiz quadrada de todos os valores atuais.
+
+        Returns:
+            np.ndarray: Os valores atuais atualizados com a raiz quadrada.
+
+        Raises:
+            NegativeNumberSqrtError: Se algum valor atual for negativo. Nenhum valor é alterado.
+        """
+        if np.any(self.current_values < 0):
+            raise NegativeNumberSqrtError("Não é possível calcular a raiz quadrada de um número negativo.")
+        np.sqrt(self.current_values, out=self.current_values)
+        return self.current_values
+
+    def percent(self, base) -> np.ndarray:
+        """
+        Calcula a porcentagem dos valores atuais em relação a uma base.
+
+        Fórmula: (base * current_values) / 100, na mesma ordem do caminho escalar.
+
+        Args:
+            base: Número ou array em relação ao qual calcular a porcentagem.
+
+        Returns:
+            np.ndarray: Os valores atuais atualizados com a porcentagem.
+        """
+        np.multiply(base, self.current_values, out=self.current_values)
+        np.divide(self.current_values, 100, out=self.current_values)
+        return self.current_values
+
+    def apply(self, operator: str, operands=None) -> np.ndarray:
+        """
+        Aplica qualquer operador da calculadora, inclusive os científicos, aos valores atuais.
+
+        Args:
+            operator: Um dos operadores em OPERATORS.
+            operands: Número ou array do segundo operando. Ignorado para os operadores unários.
+
+        Returns:
+            np.ndarray: Os novos valores atuais.
+
+        Raises:
+            ValueError: Se o operador não for suportado.
+            DivisionByZeroError, NegativeNumberSqrtError, DomainError, ResultOverflowError:
+                O erro do primeiro valor inválido. Nenhum valor é alterado.
+        """
+        result, errors = evaluate(operator, self.current_values, operands)
+        invalid = np.flatnonzero(errors)
+        if invalid.size:
+            error_type = ERROR_TYPES[errors[invalid[0]]]
+            # Mensagem igual à do caminho escalar, obtida da própria operação escalar
+            raise error_type(_scalar_message(operator, self.current_values, operands, invalid[0]))
+        self.current_values = result
+        return self.current_values
+
+    def clear(self):
+        """
+        Reseta todos os valores atuais para 0.0, mantendo o tamanho do array.
+        """
+        self.current_values.fill(0.0)
+
+    def __len__(self):
+        """
+        Retorna a quantidade de valores processados em lote.
+        """
+        return len(self.current_values)
+
+    def __str__(self):
+        """
+        Retorna uma representação em string dos valores atuais.
+
+        Returns:
+            str: Valores atuais convertidos para string.
+        """
+        return str(self.current_values)
+
+
+def evaluate(operator: str, values, operands=None, out=None, errors=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Avalia uma operação sobre todas as linhas sem levantar exceções.
+
+    Em vez de interromper o lote no primeiro erro, cada linha inválida recebe
+    NaN no buffer de resultados e o código da exceção correspondente
+    (`DivisionByZeroError.code`, `NegativeNumberSqrtError.code`, `DomainError.code`,
+    `ResultOverflowError.code`) no array de erros. As linhas válidas produzem os
+    mesmos resultados da Calculator escalar (nas funções transcendentes, a menos
+    do último bit, pois as implementações do NumPy e de `math` podem diferir).
+
+    Args:
+        operator: Um dos operadores em OPERATORS.
+        values: Valores atuais de cada linha (equivalente a `current_value`).
+        operands: Segundo operando de cada linha (escalar ou array). Ignorado para os
+                  operadores unários (UNARY_OPERATORS).
+        out: Buffer float64 opcional para os resultados (pode ser o próprio `values`).
+        errors: Buffer uint8 opcional para os códigos de erro.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Os resultados e os códigos de erro (NO_ERROR quando válida).
+
+    Raises:
+        ValueError: Se o operador não for suportado.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(values)
+    if errors is None:
+        errors = np.zeros(values.shape, dtype=np.uint8)
+    else:
+        errors.fill(NO_ERROR)
+
+    if operator == '+':
+        np.add(values, operands, out=out)
+    elif operator == '-':
+        np.subtract(values, operands, out=out)
+    elif operator == '*':
+        np.multiply(values, operands, out=out)
+    elif operator == '/':
+        # A máscara é calculada antes da divisão, pois `out` pode ser o próprio `values`
+        invalid = np.equal(operands, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values, operands, out=out)
+        out[invalid] = np.nan
+        errors[invalid] = DivisionByZeroError.code
+    elif operator == 'sqrt':
+        invalid = values < 0
+        with np.errstate(invalid='ignore'):
+            np.sqrt(values, out=out)
+        out[invalid] = np.nan
+        errors[invalid] = NegativeNumberSqrtError.code
+    elif operator == '%':
+        np.multiply(operands, values, out=out)
+        np.divide(out, 100, out=out)
+    elif operator in ('^', 'root'):
+        _evaluate_power(operator, values, operands, out, errors)
+    elif operator in ('log', 'ln'):
+        invalid = values <= 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _UNARY_UFUNCS[operator](values, out=out)
+        _mark(out, errors, invalid, DomainError.code)
+    elif operator == 'exp':
+        finite = np.isfinite(values)
+        with np.errstate(over='ignore'):
+            np.exp(values, out=out)
+        _mark(out, errors, np.isinf(out) & finite, ResultOverflowError.code)
+    elif operator in ('sin', 'cos', 'tan'):
+        invalid = np.isinf(values)
+        with np.errstate(invalid='ignore'):
+            _UNARY_UFUNCS[operator](values, out=out)
+        _mark(out, errors, invalid, DomainError.code)
+    elif operator == '!':
+        _evaluate_factorial(values, out, errors)
+    else:
+        raise ValueError(f"Operador não suportado: {operator}")
+
+    return out, errors
+
+
+def _is_integer(values) -> np.ndarray:
+    """Máscara dos valores inteiros; falsa para infinito e NaN, como `float.is_integer`."""
+    return (np.trunc(values) == values) & np.isfinite(values)
+
+
+def _mark(out: np.ndarray, errors: np.ndarray, invalid: np.ndarray, code: int) -> None:
+    """Marca as linhas inválidas com NaN e o código do erro."""
+    out[invalid] = np.nan
+    errors[invalid] = code
+
+
+def _evaluate_power(operator: str, values, operands, out: np.ndarray, errors: np.ndarray) -> None:
+    """
+    Avalia '^' (potência) ou 'root' (raiz de índice `operands`) com as mesmas regras de `model/operations.py`.
+
+    As máscaras são calculadas antes do resultado, pois `out` pode ser o próprio `values`.
+    """
+    operands = np.broadcast_to(np.asarray(operands, dtype=np.float64), values.shape)
+    negative = values < 0
+    finite = np.isfinite(values) & np.isfinite(operands)
+    integer = _is_integer(operands)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if operator == '^':
+            zero_division = (values == 0) & (operands < 0)
+            domain = negative & ~integer
+            np.power(values, operands, out=out)
+        else:
+            exponent = 1 / operands
+            # Índice zero, ou raiz de zero com índice negativo (0 elevado a expoente negativo)
+            zero_division = (operands == 0) | ((values == 0) & (exponent < 0))
+            odd = integer & ~_is_integer(operands * 0.5)
+            domain = negative & ~odd
+            magnitude = np.abs(values)
+            result = np.power(magnitude, exponent)
+            # Raízes inteiras exatas, como no caminho escalar
+            check = integer & (operands > 0) & (magnitude < EXACT_LIMIT)
+            nearest = np.rint(result)
+            exact = check & (np.power(nearest, operands) == magnitude)
+            np.copyto(result, nearest, where=exact)
+            np.negative(result, out=result, where=negative)
+            out[...] = result
+            finite &= np.isfinite(exponent)
+    overflow = np.isinf(out) & finite & ~zero_division & ~domain
+    _mark(out, errors, zero_division, DivisionByZeroError.code)
+    _mark(out, errors, domain & ~zero_division, DomainError.code)
+    _mark(out, errors, overflow, ResultOverflowError.code)
+
+
+def _evaluate_factorial(values, out: np.ndarray, errors: np.ndarray) -> None:
+    """
+    Avalia o fatorial: tabela de consulta para inteiros, função gama (escalar) para os demais.
+
+    Os inteiros não negativos, caso comum, são resolvidos por indexação; os
+    valores fracionários passam pela função escalar, linha a linha.
+    """
+    integer = _is_integer(values)
+    negative_integer = integer & (values < 0)
+    too_large = integer & (values > MAX_FACTORIAL)
+    table = integer & ~negative_integer & ~too_large
+    fractional = np.flatnonzero(~integer & ~np.isnan(values))
+    fractional_values = values[fractional]                 # Copiados antes de escrever em `out`
+    out[table] = FACTORIALS[values[table].astype(np.intp)]
+    out[~integer] = np.nan                                 # NaN continua NaN, como no caminho escalar
+    _mark(out, errors, negative_integer, DomainError.code)
+    _mark(out, errors, too_large, ResultOverflowError.code)
+    for i, value in zip(fractional, fractional_values):
+        try:
+            out[i] = factorial(float(value))
+        except OPERATION_ERRORS as e:
+            out[i] = np.nan
+            errors[i] = e.code
+
+
+def _scalar_message(operator: str, values, operands, index: int) -> str:
+    """Mensagem do erro da linha `index`, obtida do caminho escalar."""
+    from .operations import apply
+    b = None if operands is None else np.broadcast_to(operands, np.shape(values))[index]
+    try:
+        apply(operator, float(values[index]), None if b is None else float(b))
+    except OPERATION_ERRORS as e:
+        return str(e)
+    return OVERFLOW_MESSAGE
+
+
+def check_opcodes(opcodes) -> None:
+    """
+    Confere se todos os códigos correspondem a operadores (OPCODES).
+
+    Raises:
+        ValueError: Na primeira linha com um código desconhecido.
+    """
+    unknown = np.flatnonzero(np.asarray(opcodes) >= len(OPERATORS))
+    if unknown.size:
+        raise ValueError(f"Opcode desconhecido na linha {unknown[0]}: {opcodes[unknown[0]]} "
+                         f"({unknown.size} linhas com opcodes inválidos)")
+
+
+def evaluate_opcodes(values, operands, opcodes, out, errors) -> None:
+    """
+    Avalia linhas com operadores diferentes, operador a operador.
+
+    Cada linha usa o operador de código `opcodes[i]` (OPCODES). Os resultados e os
+    códigos de erro são gravados em `out` e `errors`, como em `evaluate`.
+
+    Args:
+        values: Primeiro operando de cada linha.
+        operands: Segundo operando de cada linha (ignorado para 'sqrt').
+        opcodes: Código do operador de cada linha (uint8).
+        out: Buffer float64 para os resultados.
+        errors: Buffer uint8 para os códigos de erro.
+
+    Raises:
+        ValueError: Se algum código não corresponder a um operador (nenhuma linha é avaliada).
+    """
+    check_opcodes(opcodes)
+    for code, operator in enumerate(OPERATORS):
+        rows = opcodes == code
+        if rows.all():
+            # Lote homogêneo: avalia direto nos buffers, sem seleção
+            evaluate(operator, values, operands, out=out, errors=errors)
+            return
+        if rows.any():
+            out[rows], errors[rows] = evaluate(operator, values[rows], operands[rows])
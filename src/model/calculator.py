@@ -1,21 +1,52 @@
-import math
-from .exceptions import DivisionByZeroError, NegativeNumberSqrtError
+from . import operations
 
 class Calculator:
     """
     Classe que representa a lógica de uma calculadora básica.
 
     Gerencia o estado do valor atual e permite operações matemáticas
-    como adição, subtração, multiplicação, divisão, raiz quadrada e porcentagem.
+    como adição, subtração, multiplicação, divisão, raiz quadrada e porcentagem,
+    além das científicas: potência, raiz de índice qualquer, logaritmos,
+    exponencial, funções trigonométricas e fatorial.
+
+    As operações em si são as funções puras de `model/operations.py`, buscadas
+    na tabela `dispatch`; esta classe só guarda o valor atual. Para usar uma
+    mesma instância em várias threads, use `apply`, que não altera o estado.
+
+    Esta classe usa números `float`. Outros tipos numéricos (Decimal, Fraction)
+    são subclasses em `model/backends.py` que redefinem os atributos abaixo e,
+    quando necessário, a tabela de operações.
     """
 
+    backend = "float"               # Nome do tipo numérico
+    zero = 0.0                      # Valor inicial e após limpar
+    parse = staticmethod(float)     # Converte o texto do display em número (ValueError se inválido)
+    format = staticmethod(str)      # Converte um número no texto do display
+    dispatch = operations.DISPATCH  # Operador -> função pura f(a, b)
+
+    @staticmethod
+    def from_digits(mantissa: int, scale: int) -> float:
+        """
+        Converte um número digitado, guardado como inteiro e casas decimais, no tipo numérico.
+
+        Args:
+            mantissa: Dígitos digitados, como inteiro.
+            scale: Quantidade de casas decimais (0 ou negativo se não houver).
+
+        Returns:
+            float: `mantissa / 10 ** scale`, arredondado corretamente como `float(texto)`.
+        """
+        if scale <= 0:
+            return float(mantissa)
+        return mantissa / 10 ** scale
+
     def __init__(self):
         """
         Inicializa a calculadora.
 
         O valor inicial é 0.0 e não há operador armazenado.
         """
-        self.current_value = 0.0  # Valor atual da calculadora
+        self.current_value = self.zero  # Valor atual da calculadora
         self.operator = None       # Operador pendente (não utilizado nesta classe, mas mantido para compatibilidade)
 
     def add(self, value: float) -> float:
@@ -28,7 +59,7 @@ class Calculator:
         Returns:
             float: O novo valor atual após a operação.
         """
-        self.current_value += value
+        self.current_value = self.dispatch['+'](self.current_value, value)
         return self.current_value
 
     def subtract(self, value: float) -> float:
@@ -41,7 +72,7 @@ class Calculator:
         Returns:
             float: O novo valor atual após a operação.
         """
-        self.current_value -= value
+        self.current_value = self.dispatch['-'](self.current_value, value)
         return self.current_value
 
     def multiply(self, value: float) -> float:
@@ -54,7 +85,7 @@ class Calculator:
         Returns:
             float: O novo valor atual após a multiplicação.
         """
-        self.current_value *= value
+        self.current_value = self.dispatch['*'](self.current_value, value)
         return self.current_value
 
     def divide(self, value: float) -> float:
@@ -70,9 +101,7 @@ class Calculator:
         Raises:
             DivisionByZeroError: Se o valor for zero, não é possível dividir.
         """
-        if value == 0:
-            raise DivisionByZeroError("Não é possível dividir por zero.")
-        self.current_value /= value
+        self.current_value = self.dispatch['/'](self.current_value, value)
         return self.current_value
 
     def sqrt(self) -> float:
@@ -85,9 +114,7 @@ class Calculator:
         Raises:
             NegativeNumberSqrtError: Se o valor atual for negativo.
         """
-        if self.current_value < 0:
-            raise NegativeNumberSqrtError("Não é possível calcular a raiz quadrada de um número negativo.")
-        self.current_value = math.sqrt(self.current_value)
+        self.current_value = self.dispatch['sqrt'](self.current_value, None)
         return self.current_value
 
     def percent(self, base: float) -> float:
@@ -102,16 +129,173 @@ class Calculator:
         Returns:
             float: O valor atual atualizado com a porcentagem.
         """
-        self.current_value = base * self.current_value / 100
+        self.current_value = self.dispatch['%'](self.current_value, base)
+        return self.current_value
+
+    def power(self, value: float) -> float:
+        """
+        Eleva o valor atual da calculadora a um expoente.
+
+        Args:
+            value: Expoente.
+
+        Returns:
+            float: O novo valor atual após a potência.
+
+        Raises:
+            DivisionByZeroError: Se o valor atual for zero e o expoente negativo.
+            DomainError: Se o valor atual for negativo e o expoente não for inteiro.
+            ResultOverflowError: Se o resultado não couber em um float.
+        """
+        self.current_value = self.dispatch['^'](self.current_value, value)
+        return self.current_value
+
+    def root(self, value: float) -> float:
+        """
+        Calcula a raiz de índice `value` do valor atual da calculadora.
+
+        Args:
+            value: Índice da raiz (2 para raiz quadrada, 3 para cúbica...).
+
+        Returns:
+            float: O novo valor atual após a raiz.
+
+        Raises:
+            DivisionByZeroError: Se o índice for zero.
+            DomainError: Se o valor atual for negativo e o índice não for um inteiro ímpar.
+            ResultOverflowError: Se o resultado não couber em um float.
+        """
+        self.current_value = self.dispatch['root'](self.current_value, value)
+        return self.current_value
+
+    def log(self) -> float:
+        """
+        Calcula o logaritmo na base 10 do valor atual da calculadora.
+
+        Returns:
+            float: O valor atual atualizado com o logaritmo.
+
+        Raises:
+            DomainError: Se o valor atual for menor ou igual a zero.
+        """
+        self.current_value = self.dispatch['log'](self.current_value, None)
+        return self.current_value
+
+    def ln(self) -> float:
+        """
+        Calcula o logaritmo natural do valor atual da calculadora.
+
+        Returns:
+            float: O valor atual atualizado com o logaritmo natural.
+
+        Raises:
+            DomainError: Se o valor atual for menor ou igual a zero.
+        """
+        self.current_value = self.dispatch['ln'](self.current_value, None)
+        return self.current_value
+
+    def exp(self) -> float:
+        """
+        Calcula `e` elevado ao valor atual da calculadora.
+
+        Returns:
+            float: O valor atual atualizado com a exponencial.
+
+        Raises:
+            ResultOverflowError: Se o resultado não couber em um float.
+        """
+        self.current_value = self.dispatch['exp'](self.current_value, None)
+        return self.current_value
+
+    def sin(self) -> float:
+        """
+        Calcula o seno do valor atual da calculadora (em radianos).
+
+        Returns:
+            float: O valor atual atualizado com o seno.
+
+        Raises:
+            DomainError: Se o valor atual for infinito.
+        """
+        self.current_value = self.dispatch['sin'](self.current_value, None)
+        return self.current_value
+
+    def cos(self) -> float:
+        """
+        Calcula o cosseno do valor atual da calculadora (em radianos).
+
+        Returns:
+            float: O valor atual atualizado com o cosseno.
+
+        Raises:
+            DomainError: Se o valor atual for infinito.
+        """
+        self.current_value = self.dispatch['cos'](self.current_value, None)
+        return self.current_value
+
+    def tan(self) -> float:
+        """
+        Calcula a tangente do valor atual da calculadora (em radianos).
+
+        Returns:
+            float: O valor atual atualizado com a tangente.
+
+        Raises:
+            DomainError: Se o valor atual for infinito.
+        """
+        self.current_value = self.dispatch['tan'](self.current_value, None)
+        return self.current_value
+
+    def factorial(self) -> float:
+        """
+        Calcula o fatorial do valor atual da calculadora (função gama para não inteiros).
+
+        Returns:
+            float: O valor atual atualizado com o fatorial.
+
+        Raises:
+            DomainError: Se o valor atual for um inteiro negativo.
+            ResultOverflowError: Se o resultado não couber em um float.
+        """
+        self.current_value = self.dispatch['!'](self.current_value, None)
         return self.current_value
 
+    def apply(self, operator: str, a: float, b: float | None = None) -> float:
+        """
+        Aplica um operador a dois valores sem alterar o valor atual.
+
+        Não lê nem escreve nenhum atributo da instância, então pode ser chamado
+        de várias threads ao mesmo tempo sem travas.
+
+        Args:
+            operator: Um dos operadores em OPERATORS ('+', '-', '*', '/', 'sqrt', '%', '^', 'root',
+                      'log', 'ln', 'exp', 'sin', 'cos', 'tan', '!').
+            a: Primeiro operando (o papel do valor atual).
+            b: Segundo operando. Ignorado para os operadores unários (UNARY_OPERATORS).
+
+        Returns:
+            float: O resultado da operação.
+
+        Raises:
+            ValueError: Se o operador não for suportado.
+            DivisionByZeroError: Se houver divisão por zero.
+            NegativeNumberSqrtError: Se houver raiz quadrada de número negativo.
+            DomainError: Se o valor estiver fora do domínio de uma operação científica.
+            ResultOverflowError: Se o resultado de uma operação científica não couber em um float.
+        """
+        try:
+            operation = self.dispatch[operator]
+        except KeyError:
+            raise ValueError(f"Operador não suportado: {operator}") from None
+        return operation(a, b)
+
     def clear(self):
         """
         Limpa o valor atual da calculadora, resetando para 0.0.
 
         Útil para iniciar um novo cálculo.
         """
-        self.current_value = 0.0
+        self.current_value = self.zero
 
     def __str__(self):
         """
@@ -0,0 +1,303 @@
+import csv
+import math
+import mmap
+import struct
+import sys
+from .calculator import Calculator
+from .exceptions import NO_ERROR, ERROR_TYPES, OPERATION_ERRORS
+from .opcodes import OPERATORS, OPCODES
+
+# Layout do arquivo (little-endian, colunas alinhadas em 8 bytes):
+#
+#   cabeçalho   32 bytes   magic "CALC", versão (uint16), reservado (uint16), linhas (uint64), preenchimento
+#   a           float64[n] primeiro operando (valor atual da calculadora)
+#   b           float64[n] segundo operando (NaN para os operadores unários)
+#   result      float64[n] resultado (NaN enquanto não avaliado ou em caso de erro)
+#   op          uint8[n]   código do operador (OPCODES)
+#   error       uint8[n]   código de erro (NO_ERROR ou `<Exceção>.code`)
+MAGIC = b"CALC"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHQ16x")
+HEADER_SIZE = _HEADER.size
+
+# Nomes das colunas de cada tipo, na ordem em que aparecem no arquivo
+FLOAT_COLUMNS = ("a", "b", "result")
+BYTE_COLUMNS = ("op", "error")
+
+
+def file_size(count: int) -> int:
+    """
+    Retorna o tamanho em bytes de um arquivo colunar com `count` linhas.
+    """
+    return HEADER_SIZE + 3 * 8 * count + 2 * count
+
+
+class ColumnarFile:
+    """
+    Lote de operações em formato binário colunar, acessado via mmap.
+
+    As colunas são expostas como memoryviews tipados (`a`, `b`, `result`:
+    float64; `op`, `error`: uint8) diretamente sobre as páginas mapeadas,
+    sem cópias. Com o NumPy, `arrays()` devolve as mesmas colunas como arrays.
+
+    Uso:
+        with ColumnarFile("lote.calc", writable=True) as batch:
+            batch.evaluate()
+    """
+
+    def __init__(self, path: str, writable: bool = False):
+        """
+        Abre um arquivo colunar existente.
+
+        Args:
+            path: Caminho do arquivo.
+            writable: Se verdadeiro, as colunas podem ser alteradas (ex.: resultados).
+
+        Raises:
+            ValueError: Se o arquivo não estiver no formato esperado.
+        """
+        self.path = path
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Arquivo colunar vazio: {path}")
+
+        if len(self._mmap) < HEADER_SIZE:   # Menor que o cabeçalho: nem dá para lê-lo
+            magic = version = count = None
+        else:
+            magic, version, _, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION or len(self._mmap) < file_size(count):
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(f"Arquivo colunar inválido: {path}")
+        self.count = count
+
+        view = memoryview(self._mmap)
+        offset = HEADER_SIZE
+        self._views = [view]
+        for name in FLOAT_COLUMNS:
+            column = view[offset:offset + 8 * count].cast("d")
+            setattr(self, name, column)
+            self._views.append(column)
+            offset += 8 * count
+        for name in BYTE_COLUMNS:
+            column = view[offset:offset + count]
+            setattr(self, name, column)
+            self._views.append(column)
+            offset += count
+
+    @classmethod
+    def create(cls, path: str, count: int) -> "ColumnarFile":
+        """
+        Cria um arquivo colunar com `count` linhas e o abre para escrita.
+
+        Os resultados começam como NaN e os erros como NO_ERROR.
+
+        Args:
+            path: Caminho do arquivo (sobrescrito se existir).
+            count: Quantidade de linhas.
+
+        Returns:
+            ColumnarFile: O arquivo aberto para escrita.
+        """
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, count))
+            f.truncate(file_size(count))
+        batch = cls(path, writable=True)
+        if count:
+            batch.result[:] = _nan_column(count)
+        return batch
+
+    def arrays(self) -> dict:
+        """
+        Retorna as colunas como arrays NumPy que compartilham as páginas mapeadas.
+
+        Returns:
+            dict: Arrays "a", "b", "result", "op" e "error".
+        """
+        import numpy as np
+        return {name: np.frombuffer(getattr(self, name), dtype=np.float64 if name in FLOAT_COLUMNS else np.uint8)
+                for name in FLOAT_COLUMNS + BYTE_COLUMNS}
+
+    def evaluate(self) -> None:
+        """
+        Avalia todas as linhas com a Calculator escalar, gravando as colunas result e error.
+
+        Linhas inválidas recebem NaN e o código do erro, sem interromper o lote.
+
+        Raises:
+            ValueError: Se uma linha tiver um opcode que não corresponde a nenhum operador.
+        """
+        # Funções puras da Calculator, na ordem dos opcodes (os operadores unários ignoram b)
+        operations = [Calculator.dispatch[operator] for operator in OPERATORS]
+        a, b, op, result, error = self.a, self.b, self.op, self.result, self.error
+        for i in range(self.count):
+            try:
+                result[i] = operations[op[i]](a[i], b[i])
+                error[i] = NO_ERROR
+            except OPERATION_ERRORS as e:
+                result[i] = math.nan
+                error[i] = e.code
+            except IndexError:
+                raise ValueError(f"Opcode desconhecido na linha {i}: {op[i]}") from None
+
+    def evaluate_vectorized(self) -> None:
+        """
+        Avalia todas as linhas com o motor vetorizado (NumPy), operador a operador.
+
+        Produz os mesmos resultados e códigos de erro que `evaluate`.
+        """
+        from .batch import evaluate_opcodes
+        columns = self.arrays()
+        evaluate_opcodes(columns["a"], columns["b"], columns["op"], columns["result"], columns["error"])
+
+    def flush(self) -> None:
+        """
+        Garante que as alterações das colunas sejam gravadas no disco.
+        """
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Libera as colunas e fecha o mapeamento e o arquivo.
+
+        Arrays NumPy obtidos com `arrays()` devem ser descartados antes.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "ColumnarFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _nan_column(count: int) -> memoryview:
+    """Cria uma coluna float64 preenchida com NaN."""
+    return memoryview(struct.pack("<d", math.nan) * count).cast("d")
+
+
+def csv_to_columnar(csv_path: str, path: str) -> int:
+    """
+    Converte um CSV de linhas (a, op, b) para o formato colunar.
+
+    Um cabeçalho "a,op,b" na primeira linha é ignorado. A coluna b pode ficar
+    vazia para os operadores unários. Se o CSV tiver as colunas result e error (saída do modo em
+    lote), elas também são convertidas.
+
+    Args:
+        csv_path: CSV de entrada.
+        path: Arquivo colunar de saída.
+
+    Returns:
+        int: Quantidade de linhas convertidas.
+
+    Raises:
+        ValueError: Se alguma linha tiver operador ou número inválido.
+    """
+    error_codes = {exc.__name__: code for code, exc in ERROR_TYPES.items()}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = sum(1 for row in csv.reader(f) if row)
+        f.seek(0)
+        reader = csv.reader(f)
+        first = next(reader, None)
+        has_header = first is not None and first[0].strip().lower() == "a"
+        count = rows - 1 if has_header else rows
+
+        with ColumnarFile.create(path, count) as batch:
+            source = reader if has_header else _chain_first(first, reader)
+            i = 0
+            for line, row in enumerate(source, start=2 if has_header else 1):
+                if not row:
+                    continue
+                try:
+                    batch.a[i] = float(row[0])
+                    batch.op[i] = OPCODES[row[1].strip()]
+                    batch.b[i] = float(row[2]) if len(row) > 2 and row[2].strip() else math.nan
+                    if len(row) > 3 and row[3].strip():
+                        batch.result[i] = float(row[3])
+                    if len(row) > 4 and row[4].strip():
+                        batch.error[i] = error_codes[row[4].strip()]
+                except (IndexError, KeyError, ValueError) as e:
+                    raise ValueError(f"Linha {line} inválida em {csv_path}: {row}") from e
+                i += 1
+            batch.flush()
+    return count
+
+
+def _chain_first(first, rest):
+    """Gera a primeira linha já lida seguida das demais."""
+    if first is not None:
+        yield first
+    yield from rest
+
+
+def columnar_to_csv(path: str, csv_path: str) -> int:
+    """
+    Converte um arquivo colunar para CSV com as colunas a,op,b,result,error.
+
+    Args:
+        path: Arquivo colunar de entrada.
+        csv_path: CSV de saída.
+
+    Returns:
+        int: Quantidade de linhas convertidas.
+    """
+    with ColumnarFile(path) as batch, open(csv_path, "w", newline="", encoding="utf-8") as f:
+        write_csv(f, batch.a, batch.op, batch.b, batch.result, batch.error)
+        return batch.count
+
+
+def write_csv(f, a, op, b, result, error) -> None:
+    """
+    Escreve colunas (a, op, b, result, error) como CSV, com cabeçalho.
+
+    Args:
+        f: Arquivo de texto aberto para escrita.
+        a, b, result: Colunas float64 (NaN em b e result vira campo vazio).
+        op, error: Colunas uint8 com os códigos do operador e do erro.
+    """
+    f.write("a,op,b,result,error\n")
+    for a_value, code, b_value, value, error_code in zip(a, op, b, result, error):
+        f.write(f"{a_value!r},{OPERATORS[code]},{'' if math.isnan(b_value) else repr(b_value)},"
+                f"{'' if math.isnan(value) else repr(value)},"
+                f"{ERROR_TYPES[error_code].__name__ if error_code else ''}\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Converte e avalia arquivos colunares pela linha de comando.
+
+    Uso:
+        PYTHONPATH=src python -m model.columnar to-binary entrada.csv lote.calc
+        PYTHONPATH=src python -m model.columnar evaluate lote.calc [--vectorized]
+        PYTHONPATH=src python -m model.columnar to-csv lote.calc saida.csv
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) >= 3 and args[0] == "to-binary":
+        print(f"{csv_to_columnar(args[1], args[2])} linhas convertidas")
+    elif len(args) >= 3 and args[0] == "to-csv":
+        print(f"{columnar_to_csv(args[1], args[2])} linhas convertidas")
+    elif len(args) >= 2 and args[0] == "evaluate":
+        with ColumnarFile(args[1], writable=True) as batch:
+            if "--vectorized" in args:
+                batch.evaluate_vectorized()
+            else:
+                batch.evaluate()
+            batch.flush()
+    else:
+        print(main.__doc__)
+
+
+if __name__ == "__main__":
+    main()
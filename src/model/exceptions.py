@@ -1,3 +1,7 @@
+# Código usado nos arrays de erro da avaliação em lote quando a linha não teve erro
+NO_ERROR = 0
+
+
 class DivisionByZeroError(Exception):
     """
     Exceção personalizada para erros de divisão por zero.
@@ -7,8 +11,11 @@ class DivisionByZeroError(Exception):
 
     Uso:
         raise DivisionByZeroError("Mensagem de erro")
+
+    Na avaliação em lote sem exceções, as linhas com este erro
+    são marcadas com o código `DivisionByZeroError.code`.
     """
-    pass
+    code = 1
 
 
 class NegativeNumberSqrtError(Exception):
@@ -21,5 +28,83 @@ class NegativeNumberSqrtError(Exception):
 
     Uso:
         raise NegativeNumberSqrtError("Mensagem de erro")
+
+    Na avaliação em lote sem exceções, as linhas com este erro
+    são marcadas com o código `NegativeNumberSqrtError.code`.
+    """
+    code = 2
+
+
+class DomainError(Exception):
+    """
+    Exceção personalizada para operações científicas fora do domínio da função.
+
+    Esta exceção é levantada quando o valor não pertence ao domínio da
+    operação nos números reais: logaritmo de número menor ou igual a zero,
+    potência de base negativa com expoente fracionário, raiz de número
+    negativo com índice que não é inteiro ímpar, fatorial de inteiro negativo
+    ou função trigonométrica de valor infinito.
+
+    Uso:
+        raise DomainError("Mensagem de erro")
+
+    Na avaliação em lote sem exceções, as linhas com este erro
+    são marcadas com o código `DomainError.code`.
+    """
+    code = 3
+
+
+class ResultOverflowError(Exception):
+    """
+    Exceção personalizada para resultados grandes demais para um float.
+
+    Esta exceção é levantada quando uma operação científica (potência, raiz,
+    exponencial ou fatorial) com operandos finitos produziria um resultado
+    infinito.
+
+    Uso:
+        raise ResultOverflowError("Mensagem de erro")
+
+    Na avaliação em lote sem exceções, as linhas com este erro
+    são marcadas com o código `ResultOverflowError.code`.
+    """
+    code = 4
+
+
+# Mapeia cada código de erro para o tipo de exceção correspondente
+ERROR_TYPES = {
+    DivisionByZeroError.code: DivisionByZeroError,
+    NegativeNumberSqrtError.code: NegativeNumberSqrtError,
+    DomainError.code: DomainError,
+    ResultOverflowError.code: ResultOverflowError,
+}
+
+# Exceções que as operações da calculadora podem levantar (para uso em `except`)
+OPERATION_ERRORS = tuple(ERROR_TYPES.values())
+
+
+class InvalidExpressionError(Exception):
+    """
+    Exceção personalizada para expressões sintaticamente inválidas.
+
+    Esta exceção é levantada pelo motor de expressões quando a expressão
+    contém caracteres desconhecidos, parênteses desbalanceados ou
+    operadores sem operandos.
+
+    Uso:
+        raise InvalidExpressionError("Mensagem de erro")
+    """
+    pass
+
+
+class CircularReferenceError(Exception):
+    """
+    Exceção personalizada para referências circulares entre células.
+
+    Esta exceção é levantada pela planilha quando uma fórmula faria
+    uma célula depender, direta ou indiretamente, de si mesma.
+
+    Uso:
+        raise CircularReferenceError("Mensagem de erro")
     """
     pass
@@ -0,0 +1,317 @@
+import re
+from functools import lru_cache
+from .calculator import Calculator
+from .exceptions import InvalidExpressionError
+
+# Instruções do programa compilado (pilha)
+PUSH = 0           # Empilha o literal de índice `arg`
+ADD = 1
+SUBTRACT = 2
+MULTIPLY = 3
+DIVIDE = 4
+SQRT = 5
+NEGATE = 6
+DUPLICATE = 7      # Duplica o topo da pilha (base de um percentual em + e -)
+PERCENT = 8        # Percentual relativo à base: base * valor / 100
+PERCENT_FRACTION = 9  # Percentual como fração: valor / 100
+
+# Números no formato aceito pelos botões da calculadora (dígitos e ponto)
+_TOKEN = re.compile(r'\s*(?:(\d+\.?\d*|\.\d+)|(sqrt|[-+*/%()]))')
+
+# Marcador que substitui os literais na forma estrutural da expressão
+LITERAL = '#'
+
+# Aninhamento máximo de parênteses, sinais e `sqrt`; cada nível usa alguns quadros da pilha do
+# analisador, e o limite o mantém longe do limite de recursão do Python
+MAX_NESTING = 100
+
+
+def tokenize(expression: str) -> tuple[str, list[float]]:
+    """
+    Separa a expressão em sua forma estrutural e seus literais numéricos.
+
+    Expressões com a mesma estrutura e literais diferentes ("2+3" e "10+7")
+    produzem a mesma forma ("#+#"), que é a chave do cache de programas.
+
+    Args:
+        expression: Expressão infixa, por exemplo "12*(3+4)/sqrt(16)".
+
+    Returns:
+        tuple[str, list[float]]: A forma estrutural e os literais em ordem de aparição.
+
+    Raises:
+        InvalidExpressionError: Se a expressão contiver caracteres inválidos.
+    """
+    shape = []
+    literals = []
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            position += len(expression) - position - len(expression[position:].lstrip())
+            raise InvalidExpressionError(f"Caractere inválido na posição {position}: {expression[position]!r}")
+        number, symbol = match.groups()
+        if number is not None:
+            shape.append(LITERAL)
+            literals.append(float(number))
+        else:
+            shape.append(symbol)
+        position = match.end()
+    return ' '.join(shape), literals
+
+
+class _Parser:
+    """
+    Analisador descendente recursivo que gera o programa em notação pós-fixa.
+
+    Gramática (precedência usual: * e / antes de + e -):
+        expr    := term (('+' | '-') term)*
+        term    := unary (('*' | '/') unary)*
+        unary   := ('-' | '+') unary | postfix
+        postfix := primary '%'*
+        primary := '#' | '(' expr ')' | 'sqrt' primary
+
+    O `%` segue as regras do Controller: após + ou - é o percentual do operando
+    da esquerda (base * valor / 100); após * ou / é a fração valor / 100;
+    sem operador pendente não altera o valor.
+
+    Parênteses, sinais e `sqrt` aninhados além de MAX_NESTING níveis levantam
+    InvalidExpressionError, em vez de esgotar a pilha de recursão.
+    """
+
+    def __init__(self, tokens: list[str]):
+        self.tokens = tokens
+        self.position = 0
+        self.literal_count = 0
+        self.depth = 0
+
+    def parse(self) -> tuple[tuple[int, int], ...]:
+        if not self.tokens:
+            raise InvalidExpressionError("Expressão vazia.")
+        code = self._strip_percent(self._expr())
+        if self.position != len(self.tokens):
+            raise InvalidExpressionError(f"Símbolo inesperado: {self.tokens[self.position]!r}")
+        return tuple(code)
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise InvalidExpressionError("Fim inesperado da expressão.")
+        self.position += 1
+        return token
+
+    def _nested(self, parse) -> list:
+        """Analisa um nível aninhado (entre parênteses, após um sinal ou após `sqrt`)."""
+        if self.depth == MAX_NESTING:
+            raise InvalidExpressionError(f"Expressão aninhada demais (máximo de {MAX_NESTING} níveis).")
+        self.depth += 1
+        code = parse()
+        self.depth -= 1
+        return code
+
+    def _expr(self) -> list:
+        code = self._term()
+        while self._peek() in ('+', '-'):
+            # Um `%` no operando da esquerda não tem operador pendente e não altera o valor
+            self._strip_percent(code)
+            operator = self._next()
+            right, percents = self._operand(self._term)
+            code += self._binary(operator, right, percents)
+        return code
+
+    def _term(self) -> list:
+        code = self._unary()
+        while self._peek() in ('*', '/'):
+            self._strip_percent(code)
+            operator = self._next()
+            right, percents = self._operand(self._unary)
+            code += self._binary(operator, right, percents)
+        return code
+
+    def _operand(self, parse) -> tuple[list, int]:
+        """Lê o operando da direita e separa os `%` que o acompanham."""
+        code = parse()
+        percents = 0
+        # Os `%` no fim do operando (ex.: "a + b%") dependem do operador
+        while code and code[-1] == (PERCENT, -1):
+            code.pop()
+            percents += 1
+        return code, percents
+
+    def _binary(self, operator: str, right: list, percents: int) -> list:
+        opcode = {'+': ADD, '-': SUBTRACT, '*': MULTIPLY, '/': DIVIDE}[operator]
+        if not percents:
+            return right + [(opcode, 0)]
+        if operator in ('+', '-'):
+            # A base do percentual é o operando da esquerda, já no topo da pilha
+            return [(DUPLICATE, 0)] * percents + right + [(PERCENT, 0)] * percents + [(opcode, 0)]
+        return right + [(PERCENT_FRACTION, 0)] * percents + [(opcode, 0)]
+
+    def _unary(self) -> list:
+        if self._peek() == '-':
+            self._next()
+            return self._strip_percent(self._nested(self._unary)) + [(NEGATE, 0)]
+        if self._peek() == '+':
+            self._next()
+            return self._nested(self._unary)
+        return self._postfix()
+
+    def _postfix(self) -> list:
+        code = self._primary()
+        while self._peek() == '%':
+            self._next()
+            # Marcador provisório, resolvido pelo operador binário que consome o operando
+            code.append((PERCENT, -1))
+        return code
+
+    def _primary(self) -> list:
+        token = self._next()
+        if token == LITERAL:
+            index = self.literal_count
+            self.literal_count += 1
+            return [(PUSH, index)]
+        if token == '(':
+            code = self._strip_percent(self._nested(self._expr))
+            if self._next() != ')':
+                raise InvalidExpressionError("Parêntese não fechado.")
+            return code
+        if token == 'sqrt':
+            return self._strip_percent(self._nested(self._primary)) + [(SQRT, 0)]
+        raise InvalidExpressionError(f"Símbolo inesperado: {token!r}")
+
+    @staticmethod
+    def _strip_percent(code: list) -> list:
+        """Remove `%` sem operador pendente, que não alteram o valor (como no Controller)."""
+        while code and code[-1] == (PERCENT, -1):
+            code.pop()
+        return code
+
+
+def compile_shape(shape: str) -> tuple[tuple[int, int], ...]:
+    """
+    Compila a forma estrutural de uma expressão em um programa de pilha.
+
+    Args:
+        shape: Forma estrutural gerada por `tokenize`.
+
+    Returns:
+        tuple[tuple[int, int], ...]: Instruções (opcode, argumento) em notação pós-fixa.
+
+    Raises:
+        InvalidExpressionError: Se a expressão for sintaticamente inválida.
+    """
+    tokens = shape.split(' ') if shape else []
+    return _Parser(tokens).parse()
+
+
+class ExpressionEngine:
+    """
+    Avaliador de expressões infixas sem interface gráfica.
+
+    Cada forma estrutural é compilada uma única vez e guardada em um cache LRU
+    limitado; os literais são passados ao programa a cada avaliação. A execução
+    usa os métodos da Calculator, preservando sua semântica e suas exceções.
+    """
+
+    def __init__(self, cache_size: int = 256):
+        """
+        Inicializa o motor de expressões.
+
+        Args:
+            cache_size: Quantidade máxima de programas compilados mantidos no cache.
+        """
+        self.calculator = Calculator()
+        self._compile = lru_cache(maxsize=cache_size)(compile_shape)
+
+    def compile(self, expression: str) -> tuple[tuple[tuple[int, int], ...], list[float]]:
+        """
+        Obtém o programa compilado (do cache, se possível) e os literais da expressão.
+
+        Args:
+            expression: Expressão infixa.
+
+        Returns:
+            tuple: O programa compilado e a lista de literais.
+        """
+        shape, literals = tokenize(expression)
+        return self._compile(shape), literals
+
+    def evaluate(self, expression: str) -> float:
+        """
+        Avalia uma expressão infixa.
+
+        Args:
+            expression: Expressão infixa, por exemplo "12*(3+4)/sqrt(16)".
+
+        Returns:
+            float: O resultado da expressão.
+
+        Raises:
+            InvalidExpressionError: Se a expressão for inválida.
+            DivisionByZeroError: Se houver divisão por zero.
+            NegativeNumberSqrtError: Se houver raiz quadrada de número negativo.
+        """
+        program, literals = self.compile(expression)
+        return self.run(program, literals)
+
+    def run(self, program: tuple[tuple[int, int], ...], literals: list[float]) -> float:
+        """
+        Executa um programa compilado com os literais informados.
+
+        Args:
+            program: Programa gerado por `compile_shape`.
+            literals: Valores de cada literal, na ordem de aparição.
+
+        Returns:
+            float: O valor final da pilha.
+        """
+        calc = self.calculator
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for opcode, arg in program:
+            if opcode == PUSH:
+                push(literals[arg])
+            elif opcode == DUPLICATE:
+                push(stack[-1])
+            elif opcode == NEGATE:
+                push(-pop())
+            elif opcode == SQRT:
+                calc.current_value = pop()
+                push(calc.sqrt())
+            elif opcode == PERCENT:
+                value = pop()
+                calc.current_value = value
+                push(calc.percent(pop()))
+            elif opcode == PERCENT_FRACTION:
+                calc.current_value = pop()
+                calc.current_value /= 100
+                push(calc.current_value)
+            else:
+                b = pop()
+                calc.current_value = pop()
+                if opcode == ADD:
+                    push(calc.add(b))
+                elif opcode == SUBTRACT:
+                    push(calc.subtract(b))
+                elif opcode == MULTIPLY:
+                    push(calc.multiply(b))
+                else:
+                    push(calc.divide(b))
+        return stack[-1]
+
+    def cache_info(self):
+        """
+        Retorna as estatísticas do cache de programas (acertos, falhas e tamanho).
+        """
+        return self._compile.cache_info()
+
+    def clear_cache(self):
+        """
+        Esvazia o cache de programas compilados.
+        """
+        self._compile.cache_clear()
@@ -0,0 +1,218 @@
+import math
+from array import array
+from .exceptions import NO_ERROR
+from .opcodes import OPERATORS, OPCODES
+from .columnar import ColumnarFile, FLOAT_COLUMNS, BYTE_COLUMNS, write_csv
+
+
+class HistoryTape:
+    """
+    Histórico das operações da calculadora em arrays tipados, com desfazer e refazer em O(1).
+
+    Cada operação ocupa uma posição nas colunas `a`, `b`, `result` (float64),
+    `op` e `error` (uint8), as mesmas do formato colunar: 26 bytes por operação,
+    sem nenhum objeto Python por entrada. As colunas formam um buffer circular
+    de `capacity` posições; quando cheio, cada nova operação sobrescreve a mais
+    antiga.
+
+    As entradas antes do cursor estão ativas; `undo` e `redo` só movem o cursor.
+    Uma operação nova depois de desfazer descarta as entradas que podiam ser
+    refeitas, como em um editor de texto.
+
+    Os valores são guardados como float64, qualquer que seja o tipo numérico da
+    calculadora. Erros de cálculo também são registrados, com resultado NaN e o
+    código da exceção.
+    """
+
+    def __init__(self, capacity: int = 1_000_000):
+        """
+        Args:
+            capacity: Quantidade máxima de operações guardadas.
+
+        Raises:
+            ValueError: Se a capacidade não for positiva.
+        """
+        if capacity <= 0:
+            raise ValueError("A capacidade do histórico deve ser positiva.")
+        self.capacity = capacity
+        # As colunas crescem até a capacidade e depois são reutilizadas em círculo
+        self.a = array('d')
+        self.b = array('d')
+        self.result = array('d')
+        self.op = array('B')
+        self.error = array('B')
+        self._head = 0        # Posição física da entrada mais antiga
+        self._size = 0        # Entradas guardadas (ativas e refazíveis)
+        self._cursor = 0      # Entradas ativas
+        self.dropped = 0      # Entradas descartadas por falta de espaço
+
+    def record(self, a: float, operator: str, b: float | None, result: float, error: int = NO_ERROR) -> None:
+        """
+        Registra uma operação, descartando as entradas que podiam ser refeitas.
+
+        Args:
+            a: Primeiro operando.
+            operator: Operador (um dos OPERATORS).
+            b: Segundo operando (None para os operadores unários).
+            result: Resultado (ignorado se houve erro).
+            error: Código do erro (`<Exceção>.code`) ou NO_ERROR.
+        """
+        size = self._cursor
+        if size < self.capacity:
+            position = self._head + size
+            if position >= self.capacity:
+                position -= self.capacity
+            size += 1
+        else:
+            position = self._head
+            self._head = position + 1 if position + 1 < self.capacity else 0
+            self.dropped += 1
+        b = math.nan if b is None else b
+        result = math.nan if error else result
+        if position == len(self.op):
+            self.a.append(a)
+            self.b.append(b)
+            self.result.append(result)
+            self.op.append(OPCODES[operator])
+            self.error.append(error)
+        else:
+            self.a[position] = a
+            self.b[position] = b
+            self.result[position] = result
+            self.op[position] = OPCODES[operator]
+            self.error[position] = error
+        self._size = self._cursor = size
+
+    def undo(self) -> tuple | None:
+        """
+        Desfaz a última operação ativa.
+
+        Returns:
+            tuple | None: A entrada desfeita (a, operador, b, result, error), ou None
+                          se não houver o que desfazer.
+        """
+        if self._cursor == 0:
+            return None
+        self._cursor -= 1
+        return self._entry(self._cursor)
+
+    def redo(self) -> tuple | None:
+        """
+        Refaz a última operação desfeita.
+
+        Returns:
+            tuple | None: A entrada refeita (a, operador, b, result, error), ou None
+                          se não houver o que refazer.
+        """
+        if self._cursor == self._size:
+            return None
+        self._cursor += 1
+        return self._entry(self._cursor - 1)
+
+    def clear(self) -> None:
+        """Descarta todo o histórico, mantendo a memória já alocada."""
+        self._head = self._size = self._cursor = 0
+
+    @property
+    def can_undo(self) -> bool:
+        return self._cursor > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._cursor < self._size
+
+    def __len__(self) -> int:
+        """Quantidade de entradas ativas (sem as desfeitas)."""
+        return self._cursor
+
+    def __getitem__(self, index: int) -> tuple:
+        """
+        Retorna a entrada ativa de índice `index`, da mais antiga (0) para a mais recente.
+
+        As entradas desfeitas não são acessíveis por índice, só por `redo`.
+
+        Returns:
+            tuple: (a, operador, b, result, error), com NaN em b para os operadores unários
+                   e em result em caso de erro.
+
+        Raises:
+            IndexError: Se o índice estiver fora das entradas ativas.
+        """
+        if index < 0:
+            index += self._cursor
+        if not 0 <= index < self._cursor:
+            raise IndexError("Índice fora do histórico.")
+        return self._entry(index)
+
+    def _entry(self, index: int) -> tuple:
+        """Lê a entrada guardada de índice `index` (ativa ou refazível), sem verificar os limites."""
+        position = (self._head + index) % self.capacity
+        return (self.a[position], OPERATORS[self.op[position]], self.b[position],
+                self.result[position], self.error[position])
+
+    def columns(self) -> dict:
+        """
+        Copia as entradas ativas, em ordem cronológica, em arrays contíguos.
+
+        Returns:
+            dict: Arrays "a", "b", "result" ('d'), "op" e "error" ('B').
+        """
+        columns = {}
+        for name, column in zip(FLOAT_COLUMNS + BYTE_COLUMNS, self._columns()):
+            columns[name] = array(column.typecode)
+            for start, stop in self._segments():
+                columns[name] += column[start:stop]
+        return columns
+
+    def to_columnar(self, path: str) -> int:
+        """
+        Exporta as entradas ativas para um arquivo do formato colunar (model/columnar.py).
+
+        As colunas são copiadas em bloco para as páginas mapeadas, sem
+        conversão entrada a entrada.
+
+        Args:
+            path: Arquivo de saída (sobrescrito se existir).
+
+        Returns:
+            int: Quantidade de entradas exportadas.
+        """
+        with ColumnarFile.create(path, self._cursor) as batch:
+            targets = [getattr(batch, name) for name in FLOAT_COLUMNS + BYTE_COLUMNS]
+            offset = 0
+            for start, stop in self._segments():
+                for target, column in zip(targets, self._columns()):
+                    target[offset:offset + stop - start] = memoryview(column)[start:stop]
+                offset += stop - start
+            batch.flush()
+        return self._cursor
+
+    def to_csv(self, path: str) -> int:
+        """
+        Exporta as entradas ativas para CSV (a,op,b,result,error), como `columnar_to_csv`.
+
+        Args:
+            path: Arquivo de saída.
+
+        Returns:
+            int: Quantidade de entradas exportadas.
+        """
+        columns = self.columns()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            write_csv(f, columns["a"], columns["op"], columns["b"], columns["result"], columns["error"])
+        return self._cursor
+
+    def memory_bytes(self) -> int:
+        """Bytes ocupados pelos dados das colunas (sem o cabeçalho fixo dos objetos array)."""
+        return sum(column.itemsize * column.buffer_info()[1] for column in self._columns())
+
+    def _columns(self) -> tuple:
+        """Colunas na ordem do formato colunar: a, b, result, op, error."""
+        return self.a, self.b, self.result, self.op, self.error
+
+    def _segments(self) -> list[tuple[int, int]]:
+        """Trechos físicos (início, fim) das entradas ativas, em ordem cronológica."""
+        end = self._head + self._cursor
+        if end <= self.capacity:
+            return [(self._head, end)]
+        return [(self._head, self.capacity), (0, end - self.capacity)]
@@ -0,0 +1,11 @@
+# Operadores da calculadora, na ordem dos seus códigos numéricos (opcodes)
+OPERATORS = ('+', '-', '*', '/', 'sqrt', '%', '^', 'root', 'log', 'ln', 'exp', 'sin', 'cos', 'tan', '!')
+
+# Código de cada operador, usado em colunas uint8 e tabelas de despacho
+OPCODES = {operator: code for code, operator in enumerate(OPERATORS)}
+
+# Operadores de um único operando: aplicados ao número exibido, sem segundo operando
+UNARY_OPERATORS = ('sqrt', 'log', 'ln', 'exp', 'sin', 'cos', 'tan', '!')
+
+# Teclas que formam números: só os dígitos ASCII e o ponto ("12" ou "٣" não são teclas)
+NUMBER_KEYS = frozenset('0123456789.')
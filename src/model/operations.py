@@ -0,0 +1,246 @@
+import math
+from .exceptions import DivisionByZeroError, NegativeNumberSqrtError, DomainError, ResultOverflowError
+from .opcodes import OPERATORS
+
+# Núcleo sem estado das operações da calculadora.
+#
+# Cada operação é uma função pura `f(a, b) -> resultado`: não lê nem altera
+# nenhum objeto compartilhado, então a mesma tabela pode ser usada por
+# qualquer quantidade de threads ao mesmo tempo, sem travas. A Calculator e o
+# Controller são construídos sobre ela; `a` faz o papel do valor atual.
+
+
+def add(a: float, b: float) -> float:
+    """Retorna `a + b`."""
+    return a + b
+
+
+def subtract(a: float, b: float) -> float:
+    """Retorna `a - b`."""
+    return a - b
+
+
+def multiply(a: float, b: float) -> float:
+    """Retorna `a * b`."""
+    return a * b
+
+
+def divide(a: float, b: float) -> float:
+    """
+    Retorna `a / b`.
+
+    Raises:
+        DivisionByZeroError: Se `b` for zero.
+    """
+    if b == 0:
+        raise DivisionByZeroError("Não é possível dividir por zero.")
+    return a / b
+
+
+def sqrt(a: float, b: float | None = None) -> float:
+    """
+    Retorna a raiz quadrada de `a` (`b` é ignorado, para manter a mesma assinatura).
+
+    Raises:
+        NegativeNumberSqrtError: Se `a` for negativo.
+    """
+    if a < 0:
+        raise NegativeNumberSqrtError("Não é possível calcular a raiz quadrada de um número negativo.")
+    return math.sqrt(a)
+
+
+def percent(a: float, base: float) -> float:
+    """Retorna `a` por cento de `base`: `(base * a) / 100`."""
+    return base * a / 100
+
+
+# Operações científicas. As unárias também recebem `b` (ignorado), como `sqrt`;
+# os ângulos das funções trigonométricas são em radianos.
+
+OVERFLOW_MESSAGE = "Resultado grande demais para ser representado."
+
+# Abaixo deste valor, todo inteiro é exato em float: raízes inteiras exatas podem ser conferidas
+EXACT_LIMIT = 2 ** 53
+
+
+def power(a: float, b: float) -> float:
+    """
+    Retorna `a` elevado a `b`.
+
+    Raises:
+        DivisionByZeroError: Se `a` for zero e `b` negativo.
+        DomainError: Se `a` for negativo e `b` não for inteiro.
+        ResultOverflowError: Se o resultado não couber em um float.
+    """
+    if a == 0 and b < 0:
+        raise DivisionByZeroError("Não é possível dividir por zero.")
+    if a < 0 and not float(b).is_integer():
+        raise DomainError("Não é possível elevar um número negativo a um expoente fracionário.")
+    try:
+        return a ** b
+    except OverflowError:
+        raise ResultOverflowError(OVERFLOW_MESSAGE) from None
+
+
+def root(a: float, b: float) -> float:
+    """
+    Retorna a raiz de índice `b` de `a`.
+
+    Raízes inteiras exatas de valores até EXACT_LIMIT (ex.: raiz cúbica de 27)
+    são devolvidas sem o erro de arredondamento de `a ** (1 / b)`.
+
+    Raises:
+        DivisionByZeroError: Se o índice for zero.
+        DomainError: Se `a` for negativo e o índice não for um inteiro ímpar.
+        ResultOverflowError: Se o resultado não couber em um float.
+    """
+    if b == 0:
+        raise DivisionByZeroError("Não é possível dividir por zero.")
+    integer_index = float(b).is_integer()
+    if a < 0 and not (integer_index and b % 2 == 1):
+        raise DomainError("A raiz de um número negativo só existe para índice inteiro ímpar.")
+    result = power(abs(a), 1 / b)
+    if integer_index and b > 0 and abs(a) < EXACT_LIMIT:
+        nearest = float(round(result))
+        if nearest ** b == abs(a):
+            result = nearest
+    return -result if a < 0 else result
+
+
+def log(a: float, b: float | None = None) -> float:
+    """
+    Retorna o logaritmo de `a` na base 10.
+
+    Raises:
+        DomainError: Se `a` for menor ou igual a zero.
+    """
+    if a <= 0:
+        raise DomainError("Não é possível calcular o logaritmo de um número menor ou igual a zero.")
+    return math.log10(a)
+
+
+def ln(a: float, b: float | None = None) -> float:
+    """
+    Retorna o logaritmo natural de `a`.
+
+    Raises:
+        DomainError: Se `a` for menor ou igual a zero.
+    """
+    if a <= 0:
+        raise DomainError("Não é possível calcular o logaritmo de um número menor ou igual a zero.")
+    return math.log(a)
+
+
+def exp(a: float, b: float | None = None) -> float:
+    """
+    Retorna `e` elevado a `a`.
+
+    Raises:
+        ResultOverflowError: Se o resultado não couber em um float.
+    """
+    try:
+        return math.exp(a)
+    except OverflowError:
+        raise ResultOverflowError(OVERFLOW_MESSAGE) from None
+
+
+def _check_angle(a: float) -> None:
+    """Rejeita ângulos infinitos, para os quais seno, cosseno e tangente não existem."""
+    if math.isinf(a):
+        raise DomainError("Não é possível calcular funções trigonométricas de um valor infinito.")
+
+
+def sin(a: float, b: float | None = None) -> float:
+    """
+    Retorna o seno de `a` (em radianos).
+
+    Raises:
+        DomainError: Se `a` for infinito.
+    """
+    _check_angle(a)
+    return math.sin(a)
+
+
+def cos(a: float, b: float | None = None) -> float:
+    """
+    Retorna o cosseno de `a` (em radianos).
+
+    Raises:
+        DomainError: Se `a` for infinito.
+    """
+    _check_angle(a)
+    return math.cos(a)
+
+
+def tan(a: float, b: float | None = None) -> float:
+    """
+    Retorna a tangente de `a` (em radianos).
+
+    Raises:
+        DomainError: Se `a` for infinito.
+    """
+    _check_angle(a)
+    return math.tan(a)
+
+
+# Maior n cujo fatorial cabe em um float
+MAX_FACTORIAL = 170
+
+
+def factorial(a: float, b: float | None = None) -> float:
+    """
+    Retorna o fatorial de `a`, estendido aos números reais pela função gama: `gamma(a + 1)`.
+
+    Para inteiros não negativos, o resultado é o fatorial exato arredondado
+    para float.
+
+    Raises:
+        DomainError: Se `a` for um inteiro negativo (polo da função gama).
+        ResultOverflowError: Se o resultado não couber em um float.
+    """
+    if float(a).is_integer():
+        if a < 0:
+            raise DomainError("Não é possível calcular o fatorial de um inteiro negativo.")
+        if a > MAX_FACTORIAL:
+            raise ResultOverflowError(OVERFLOW_MESSAGE)
+        return float(math.factorial(int(a)))
+    try:
+        return math.gamma(a + 1)
+    except OverflowError:
+        raise ResultOverflowError(OVERFLOW_MESSAGE) from None
+    except ValueError:  # -inf
+        raise DomainError("Não é possível calcular o fatorial de menos infinito.") from None
+
+
+# Funções na ordem dos opcodes (OPCODES), para despacho por código numérico
+OPERATIONS = (add, subtract, multiply, divide, sqrt, percent,
+              power, root, log, ln, exp, sin, cos, tan, factorial)
+
+# Tabela de despacho pelo símbolo do operador, montada uma única vez
+DISPATCH = dict(zip(OPERATORS, OPERATIONS))
+
+
+def apply(operator: str, a: float, b: float | None = None) -> float:
+    """
+    Aplica um operador a dois valores, sem estado.
+
+    Args:
+        operator: Um dos operadores em OPERATORS.
+        a: Primeiro operando (o valor atual da calculadora).
+        b: Segundo operando. Ignorado para os operadores unários (UNARY_OPERATORS).
+
+    Returns:
+        float: O resultado da operação.
+
+    Raises:
+        ValueError: Se o operador não for suportado.
+        DivisionByZeroError: Se houver divisão por zero.
+        NegativeNumberSqrtError: Se houver raiz quadrada de número negativo.
+        DomainError: Se o valor estiver fora do domínio de uma operação científica.
+        ResultOverflowError: Se o resultado de uma operação científica não couber em um float.
+    """
+    try:
+        operation = DISPATCH[operator]
+    except KeyError:
+        raise ValueError(f"Operador não suportado: {operator}") from None
+    return operation(a, b)
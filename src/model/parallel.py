@@ -0,0 +1,224 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from .batch import check_opcodes, evaluate_opcodes
+from .exceptions import NO_ERROR
+from .opcodes import OPCODES
+
+# Layout do bloco de memória compartilhada (mesma ordem das colunas de model/columnar.py):
+#
+#   a           float64[n] primeiro operando (valor atual da calculadora)
+#   b           float64[n] segundo operando (NaN para sqrt)
+#   result      float64[n] resultado (NaN em caso de erro)
+#   op          uint8[n]   código do operador (OPCODES)
+#   error       uint8[n]   código de erro (NO_ERROR ou `<Exceção>.code`)
+FLOAT_COLUMNS = ("a", "b", "result")
+BYTE_COLUMNS = ("op", "error")
+
+
+def block_size(count: int) -> int:
+    """
+    Retorna o tamanho em bytes do bloco compartilhado para `count` linhas.
+
+    Args:
+        count: Quantidade de linhas.
+
+    Returns:
+        int: Tamanho do bloco (no mínimo 1 byte, exigido pelo sistema operacional).
+    """
+    return max(1, count * (8 * len(FLOAT_COLUMNS) + len(BYTE_COLUMNS)))
+
+
+class SharedBatch:
+    """
+    Lote de linhas (a, op, b) em `multiprocessing.shared_memory`, avaliado por vários processos.
+
+    As colunas são arrays NumPy sobre um único bloco de memória compartilhada.
+    Cada processo de trabalho abre o mesmo bloco pelo nome e avalia uma fatia
+    disjunta das linhas diretamente nas colunas result e error: nenhum dado é
+    serializado ou copiado entre os processos, só o nome do bloco e os limites
+    da fatia.
+
+    O processo que cria o lote é o dono do bloco e deve liberá-lo com `unlink`
+    (ou usando o lote em um bloco `with`).
+
+    Uso:
+        with SharedBatch.create(len(valores)) as batch:
+            batch.a[:] = valores
+            batch.b[:] = operandos
+            batch.op[:] = OPCODES['/']
+            batch.evaluate(workers=4)
+            resultados = batch.result.copy()
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, count: int, owner: bool = False):
+        """
+        Monta as colunas sobre um bloco já existente. Use `create` ou `attach`.
+
+        Args:
+            memory: Bloco de memória compartilhada.
+            count: Quantidade de linhas.
+            owner: Se verdadeiro, `close` também remove o bloco do sistema.
+        """
+        self.memory = memory
+        self.count = count
+        self.owner = owner
+        offset = 0
+        for name in FLOAT_COLUMNS:
+            setattr(self, name, np.ndarray(count, dtype=np.float64, buffer=memory.buf, offset=offset))
+            offset += 8 * count
+        for name in BYTE_COLUMNS:
+            setattr(self, name, np.ndarray(count, dtype=np.uint8, buffer=memory.buf, offset=offset))
+            offset += count
+
+    @classmethod
+    def create(cls, count: int) -> "SharedBatch":
+        """
+        Cria um bloco compartilhado novo para `count` linhas.
+
+        Args:
+            count: Quantidade de linhas.
+
+        Returns:
+            SharedBatch: O lote, com result em NaN e error em NO_ERROR.
+        """
+        memory = shared_memory.SharedMemory(create=True, size=block_size(count))
+        batch = cls(memory, count, owner=True)
+        batch.result.fill(np.nan)
+        batch.error.fill(NO_ERROR)
+        return batch
+
+    @classmethod
+    def attach(cls, name: str, count: int) -> "SharedBatch":
+        """
+        Abre um bloco criado por outro processo.
+
+        Args:
+            name: Nome do bloco (`batch.name` no processo que o criou).
+            count: Quantidade de linhas.
+
+        Returns:
+            SharedBatch: O lote, sem a posse do bloco.
+        """
+        if sys.version_info >= (3, 13):
+            # O dono do bloco é quem o remove; o processo de trabalho não deve rastreá-lo
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+        return cls(memory, count)
+
+    @property
+    def name(self) -> str:
+        """Nome do bloco compartilhado, usado pelos outros processos para abri-lo."""
+        return self.memory.name
+
+    def evaluate_slice(self, start: int, stop: int) -> None:
+        """
+        Avalia as linhas `start:stop` nas próprias colunas compartilhadas.
+
+        Args:
+            start: Primeira linha da fatia.
+            stop: Linha seguinte à última da fatia.
+        """
+        rows = slice(start, stop)
+        evaluate_opcodes(self.a[rows], self.b[rows], self.op[rows], self.result[rows], self.error[rows])
+
+    def evaluate(self, workers: int | None = None, executor: ProcessPoolExecutor | None = None) -> None:
+        """
+        Avalia todas as linhas, dividindo-as em fatias disjuntas entre processos.
+
+        Args:
+            workers: Quantidade de fatias (e de processos, se `executor` não for dado).
+                     0 avalia no próprio processo. Padrão: os.cpu_count().
+            executor: Pool de processos já criado, reaproveitado entre chamadas para
+                      não pagar a criação dos processos a cada lote.
+
+        Raises:
+            ValueError: Se alguma linha tiver um opcode desconhecido (conferido antes
+                        de enviar as fatias, para que nenhuma seja avaliada).
+        """
+        check_opcodes(self.op)
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers == 0 or self.count == 0:
+            self.evaluate_slice(0, self.count)
+            return
+        bounds = np.linspace(0, self.count, workers + 1).astype(int).tolist()
+        slices = [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                self._run(pool, slices)
+        else:
+            self._run(executor, slices)
+
+    def _run(self, executor: ProcessPoolExecutor, slices: list[tuple[int, int]]) -> None:
+        """Envia as fatias ao pool e aguarda todas (propagando erros dos processos)."""
+        futures = [executor.submit(_evaluate_shared, self.name, self.count, start, stop)
+                   for start, stop in slices]
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        """
+        Libera as colunas e fecha o bloco; se este processo é o dono, remove o bloco.
+
+        Arrays obtidos das colunas (inclusive fatias) devem ser descartados antes.
+        """
+        for name in FLOAT_COLUMNS + BYTE_COLUMNS:
+            setattr(self, name, None)
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+            self.owner = False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "SharedBatch":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _evaluate_shared(name: str, count: int, start: int, stop: int) -> None:
+    """Função dos processos de trabalho: abre o bloco pelo nome e avalia uma fatia."""
+    batch = SharedBatch.attach(name, count)
+    try:
+        batch.evaluate_slice(start, stop)
+    finally:
+        batch.close()
+
+
+def evaluate_parallel(operator: str, values, operands=None, workers: int | None = None,
+                      executor: ProcessPoolExecutor | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Avalia uma operação sobre todas as linhas em vários processos, sem levantar exceções.
+
+    Equivalente a `model.batch.evaluate`, mas com os operandos e os resultados
+    em memória compartilhada. Os dados de entrada são copiados uma única vez
+    para o bloco; para evitar até essa cópia, preencha um `SharedBatch` diretamente.
+
+    Args:
+        operator: Um dos operadores em OPERATORS.
+        values: Valores atuais de cada linha.
+        operands: Segundo operando de cada linha (escalar ou array). Ignorado para os operadores unários.
+        workers: Quantidade de processos (0 = no próprio processo). Padrão: os.cpu_count().
+        executor: Pool de processos opcional, reaproveitado entre chamadas.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Os resultados e os códigos de erro (NO_ERROR quando válida).
+
+    Raises:
+        ValueError: Se o operador não for suportado.
+    """
+    if operator not in OPCODES:
+        raise ValueError(f"Operador não suportado: {operator}")
+    values = np.asarray(values, dtype=np.float64)
+    with SharedBatch.create(len(values)) as batch:
+        batch.a[:] = values
+        batch.b[:] = np.nan if operands is None else operands
+        batch.op[:] = OPCODES[operator]
+        batch.evaluate(workers, executor)
+        return batch.result.copy(), batch.error.copy()
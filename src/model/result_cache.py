@@ -0,0 +1,304 @@
+import sqlite3
+import time
+from decimal import MAX_EMAX, MIN_EMIN, Context, Decimal
+from .calculator import Calculator
+from .exceptions import ERROR_TYPES, OPERATION_ERRORS
+from .expression import tokenize, LITERAL
+
+# Erros de cálculo guardados no cache como resultado (a mesma entrada sempre levanta o mesmo erro)
+CACHED_ERRORS = {error.__name__: error for error in ERROR_TYPES.values()}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key       TEXT PRIMARY KEY,
+    value     TEXT,
+    error     TEXT,
+    message   TEXT,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+def backend_name(calculator: Calculator) -> str:
+    """
+    Nome do tipo numérico usado nas chaves do cache.
+
+    Inclui a precisão do contexto decimal, pois o mesmo cálculo com precisões
+    diferentes tem resultados diferentes.
+    """
+    context = getattr(calculator, "context", None)
+    return calculator.backend if context is None else f"{calculator.backend}:{context.prec}"
+
+
+def operation_key(operator: str, a: float, b: float | None = None) -> str:
+    """
+    Chave normalizada de uma operação (a, op, b): "2 + 3" e "2.0 + 3" têm a mesma chave.
+
+    Args:
+        operator: Operador.
+        a: Primeiro operando.
+        b: Segundo operando (None para os operadores unários).
+
+    Returns:
+        str: A chave, por exemplo "op:+ 2.0 3.0".
+    """
+    if b is None:
+        return f"op:{operator} {_canonical(a)}"
+    return f"op:{operator} {_canonical(a)} {_canonical(b)}"
+
+
+def _canonical(value) -> str:
+    """
+    Texto canônico de um operando: inteiros como o float equivalente (2 e 2.0 são o mesmo número)
+    e Decimals sem zeros à direita (Decimal("2") e Decimal("2.0") também).
+    """
+    if isinstance(value, int):
+        return repr(float(value))
+    if isinstance(value, Decimal) and value.is_finite():
+        # Contexto com todos os dígitos do coeficiente: só remove os zeros, sem arredondar
+        digits = len(value.as_tuple().digits)
+        return repr(value.normalize(Context(prec=digits, Emax=MAX_EMAX, Emin=MIN_EMIN)))
+    return repr(value)
+
+
+def expression_key(expression: str) -> str:
+    """
+    Chave normalizada de uma expressão infixa, sem espaços e com os literais canônicos.
+
+    "2+3", " 2 + 3.0 " e "2.+3" têm a mesma chave.
+
+    Raises:
+        InvalidExpressionError: Se a expressão contiver caracteres inválidos.
+    """
+    shape, literals = tokenize(expression)
+    values = iter(literals)
+    return "expr:" + " ".join(repr(next(values)) if token == LITERAL else token for token in shape.split(" "))
+
+
+class ResultCache:
+    """
+    Cache persistente de resultados em SQLite, compartilhado entre processos e execuções.
+
+    As chaves são a operação ou a expressão normalizada mais o tipo numérico
+    da calculadora. O arquivo usa o modo WAL, então vários processos leem ao
+    mesmo tempo enquanto um deles grava. As gravações (resultados novos e a
+    data de último uso das entradas lidas) ficam em um buffer na memória e são
+    gravadas em lote, em uma transação a cada `batch_size` alterações ou em
+    `flush`. Acima de `max_entries` entradas, as usadas há mais tempo são
+    removidas (LRU). As entradas já lidas ou gravadas por este processo ficam
+    também em um dicionário limitado a `memory_entries`, consultado antes do
+    arquivo.
+
+    Erros de cálculo (OPERATION_ERRORS, como `DivisionByZeroError`) também
+    são guardados e levantados de novo a cada acerto.
+
+    Uso:
+        with ResultCache("resultados.db") as cache:
+            cache.get_or_compute(expression_key(texto), lambda: engine.evaluate(texto))
+            cache.stats()   # {"hits": ..., "misses": ..., "hit_rate": ..., "io_seconds": ...}
+    """
+
+    def __init__(self, path: str, calculator: Calculator | None = None, max_entries: int = 100_000,
+                 batch_size: int = 256, memory_entries: int = 4096, timeout: float = 5.0):
+        """
+        Abre (ou cria) o arquivo do cache.
+
+        Args:
+            path: Caminho do banco SQLite (":memory:" para um cache só deste processo).
+            calculator: Calculadora cujo tipo numérico compõe as chaves e converte os valores.
+                        Se omitida, usa uma Calculator de floats.
+            max_entries: Quantidade máxima de entradas no arquivo.
+            batch_size: Alterações acumuladas antes de uma gravação em lote.
+            memory_entries: Entradas mantidas na memória deste processo (0 desliga).
+            timeout: Segundos de espera quando outro processo está gravando.
+        """
+        calculator = calculator if calculator is not None else Calculator()
+        self.path = path
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.memory_entries = memory_entries
+        self._prefix = backend_name(calculator) + "|"
+        self._parse = calculator.parse
+        self._format = calculator.format
+        self._pending: dict[str, tuple] = {}   # Chave -> (valor, erro, mensagem) ainda não gravados
+        self._touched: set[str] = set()        # Chaves lidas do arquivo desde a última gravação
+        self._memory: dict[str, tuple] = {}    # Chave -> (valor, erro, mensagem) já lidos ou gravados
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.io_seconds = 0.0                  # Tempo gasto em consultas e gravações no SQLite
+        start = time.perf_counter()
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self.io_seconds += time.perf_counter() - start
+
+    def get(self, key: str):
+        """
+        Procura um resultado no cache.
+
+        Args:
+            key: Chave normalizada (`operation_key` ou `expression_key`).
+
+        Returns:
+            O valor guardado, ou None se a chave não estiver no cache.
+
+        Raises:
+            OPERATION_ERRORS: Se o resultado guardado for um desses erros.
+        """
+        key = self._prefix + key
+        entry = self._memory.get(key)
+        if entry is None:
+            start = time.perf_counter()
+            row = self._db.execute("SELECT value, error, message FROM results WHERE key = ?", (key,)).fetchone()
+            self.io_seconds += time.perf_counter() - start
+            if row is None:
+                self.misses += 1
+                return None
+            value, error, message = row
+            entry = (None if value is None else self._parse(value), error, message)
+            self._remember(key, entry)
+        if key not in self._pending:
+            self._touch(key)
+        self.hits += 1
+        value, error, message = entry
+        if error is not None:
+            raise CACHED_ERRORS[error](message)
+        return value
+
+    def put(self, key: str, value=None, error: Exception | None = None) -> None:
+        """
+        Guarda um resultado (ou um erro de cálculo) no buffer de gravação.
+
+        Args:
+            key: Chave normalizada.
+            value: Resultado do cálculo.
+            error: Erro levantado pelo cálculo, no lugar do valor.
+        """
+        key = self._prefix + key
+        if error is None:
+            self._pending[key] = (self._format(value), None, None)
+            self._remember(key, (value, None, None))
+        else:
+            self._pending[key] = (None, type(error).__name__, str(error))
+            self._remember(key, self._pending[key])
+        if len(self._pending) + len(self._touched) >= self.batch_size:
+            self.flush()
+
+    def get_or_compute(self, key: str, compute):
+        """
+        Retorna o resultado do cache ou o calcula com `compute()` e o guarda.
+
+        Args:
+            key: Chave normalizada.
+            compute: Função sem argumentos que calcula o resultado.
+
+        Returns:
+            O resultado, do cache ou calculado.
+
+        Raises:
+            OPERATION_ERRORS: Se o cálculo levantar (ou tiver levantado) um desses erros.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        try:
+            value = compute()
+        except OPERATION_ERRORS as e:
+            self.put(key, error=e)
+            raise
+        self.put(key, value)
+        return value
+
+    def flush(self) -> None:
+        """Grava o buffer em uma única transação e remove as entradas excedentes."""
+        if not self._pending and not self._touched:
+            return
+        now = time.time()
+        start = time.perf_counter()
+        with _Transaction(self._db):
+            if self._touched:
+                self._db.executemany("UPDATE results SET last_used = ? WHERE key = ?",
+                                     ((now, key) for key in self._touched))
+            if self._pending:
+                self._db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                                     ((key, *entry, now) for key, entry in self._pending.items()))
+            excess = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._db.execute("DELETE FROM results WHERE key IN "
+                                 "(SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+                self.evictions += excess
+        self.io_seconds += time.perf_counter() - start
+        self.writes += len(self._pending)
+        self._pending.clear()
+        self._touched.clear()
+
+    def stats(self) -> dict:
+        """
+        Retorna as estatísticas de uso do cache neste processo.
+
+        Returns:
+            dict: hits, misses, hit_rate, writes (entradas gravadas), evictions, pending
+                  (ainda no buffer) e io_seconds (tempo gasto no SQLite).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "pending": len(self._pending),
+            "io_seconds": self.io_seconds,
+        }
+
+    def __len__(self) -> int:
+        """Quantidade de entradas gravadas no arquivo (sem o buffer)."""
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        """Grava o buffer e fecha o arquivo."""
+        self.flush()
+        self._db.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Guarda uma entrada na memória do processo, descartando a mais antiga se estiver cheia."""
+        if self.memory_entries <= 0:
+            return
+        if len(self._memory) >= self.memory_entries:
+            del self._memory[next(iter(self._memory))]
+        self._memory[key] = entry
+
+    def _touch(self, key: str) -> None:
+        """Marca uma entrada lida para atualizar a data de último uso na próxima gravação."""
+        self._touched.add(key)
+        if len(self._pending) + len(self._touched) >= self.batch_size:
+            self.flush()
+
+
+class _Transaction:
+    """
+    Transação de escrita em uma conexão sem transações implícitas.
+
+    BEGIN IMMEDIATE reserva a escrita logo no início, então dois processos
+    gravando ao mesmo tempo esperam um pelo outro (até o `timeout`) em vez de
+    falharem ao promover uma leitura a escrita.
+    """
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, *exc):
+        self.db.execute("ROLLBACK" if exc_type is not None else "COMMIT")
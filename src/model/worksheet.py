@@ -0,0 +1,269 @@
+from heapq import heappush, heappop
+from itertools import count
+from .calculator import Calculator
+from .exceptions import CircularReferenceError, OPERATION_ERRORS
+from .opcodes import OPERATORS, UNARY_OPERATORS
+
+
+class _Cell:
+    """
+    Estado de uma célula da planilha.
+
+    `rank` é maior que o de todas as células das quais a fórmula depende,
+    então recalcular em ordem crescente de `rank` respeita as dependências.
+    """
+    __slots__ = ("operator", "inputs", "value", "error", "dependents", "rank")
+
+    def __init__(self):
+        self.operator = None    # Operador da fórmula (None para células com valor fixo)
+        self.inputs = ()        # Argumentos da fórmula: nomes de células ou números
+        self.value = None       # Último valor calculado
+        self.error = None       # Exceção do último cálculo (propagada às dependentes)
+        self.dependents = []    # Células cujas fórmulas referenciam esta
+        self.rank = 0           # Posição na ordem topológica
+
+
+class Worksheet:
+    """
+    Planilha de células nomeadas com fórmulas avaliadas pela Calculator.
+
+    Cada fórmula aplica um operador da calculadora ('+', '-', '*', '/', 'sqrt',
+    '%' ou um científico, como '^' e 'log') a células ou números. A planilha mantém o grafo de dependências e,
+    após uma edição, recalcula apenas as células afetadas, em ordem topológica.
+    Uma célula cujo resultado não mudou não repassa a mudança adiante, então o
+    custo do recálculo é proporcional ao tamanho da mudança, não da planilha.
+
+    Uso:
+        sheet = Worksheet()
+        sheet.set_value("preco", 100)
+        sheet.set_value("taxa", 1.1)
+        sheet.set_formula("total", "*", "preco", "taxa")
+        sheet.value("total")  # 110.00000000000001
+    """
+
+    def __init__(self, calculator: Calculator | None = None):
+        """
+        Args:
+            calculator: Calculadora usada nas fórmulas (permite escolher o tipo numérico).
+                        Se omitida, usa uma Calculator de floats.
+        """
+        self.calculator = calculator if calculator is not None else Calculator()
+        self._dispatch = self.calculator.dispatch       # Funções puras f(a, b) do tipo numérico
+        self._cells: dict[str, _Cell] = {}
+        self._pending: list[tuple[int, int, str]] = []  # Heap de (rank, ordem, nome) a recalcular
+        self._queued: set[str] = set()                  # Nomes presentes em _pending
+        self._order = count()
+        self.last_recomputed = 0                        # Células recalculadas no último recálculo
+        self.total_recomputed = 0                       # Células recalculadas desde a criação
+
+    def set_value(self, name: str, value: float) -> None:
+        """
+        Define uma célula com valor fixo, criando-a se necessário.
+
+        Args:
+            name: Nome da célula.
+            value: Valor da célula.
+        """
+        cell = self._cells.get(name)
+        if cell is None:
+            cell = self._cells[name] = _Cell()
+        elif cell.operator is not None:
+            self._detach(name, cell)
+            cell.operator, cell.inputs = None, ()
+        elif cell.error is None and cell.value == value:
+            return
+        cell.value, cell.error = value, None
+        for dependent in cell.dependents:
+            self._schedule(dependent)
+
+    def set_formula(self, name: str, operator: str, *args) -> None:
+        """
+        Define a fórmula de uma célula, criando-a se necessário.
+
+        Operadores binários aceitam dois ou mais argumentos, aplicados da esquerda
+        para a direita (`'+', 'a', 'b', 'c'` é `a + b + c`); os unários (`sqrt`, `log`,
+        `sin`...) aceitam um; `%` aceita dois e calcula `args[0]` por cento de `args[1]`,
+        como `Calculator.percent`.
+
+        Args:
+            name: Nome da célula.
+            operator: Operador da calculadora.
+            *args: Nomes de células existentes ou números.
+
+        Raises:
+            ValueError: Se o operador for desconhecido ou a quantidade de argumentos não servir para ele.
+            KeyError: Se a fórmula referenciar uma célula inexistente.
+            CircularReferenceError: Se a célula passar a depender de si mesma.
+        """
+        if operator not in OPERATORS:
+            raise ValueError(f"Operador desconhecido: {operator!r}")
+        if operator in UNARY_OPERATORS:
+            valid = len(args) == 1
+        elif operator == '%':
+            valid = len(args) == 2
+        else:
+            valid = len(args) >= 2
+        if not valid:
+            raise ValueError(f"Quantidade de argumentos inválida para {operator!r}: {len(args)}")
+        references = list(dict.fromkeys(arg for arg in args if isinstance(arg, str)))
+        for reference in references:
+            if reference not in self._cells:
+                raise KeyError(f"Célula inexistente: {reference!r}")
+
+        cell = self._cells.get(name)
+        if cell is None:
+            cell = self._cells[name] = _Cell()
+        else:
+            self._check_cycle(name, references)
+            self._detach(name, cell)
+        cell.operator, cell.inputs = operator, args
+        for reference in references:
+            self._cells[reference].dependents.append(name)
+        rank = 1 + max((self._cells[reference].rank for reference in references), default=-1)
+        if rank > cell.rank:
+            self._raise_rank(name, rank)
+        self._schedule(name)
+
+    def value(self, name: str) -> float:
+        """
+        Retorna o valor de uma célula, recalculando antes as células pendentes.
+
+        Args:
+            name: Nome da célula.
+
+        Returns:
+            float: Valor da célula.
+
+        Raises:
+            KeyError: Se a célula não existir.
+            OPERATION_ERRORS (DivisionByZeroError, DomainError...): Se o cálculo da célula
+                (ou de uma célula da qual ela depende) falhou.
+        """
+        if self._pending:
+            self.recalculate()
+        cell = self._cells[name]
+        if cell.error is not None:
+            raise cell.error
+        return cell.value
+
+    def error(self, name: str) -> Exception | None:
+        """
+        Retorna o erro do último cálculo de uma célula, ou None se não houve erro.
+        """
+        if self._pending:
+            self.recalculate()
+        return self._cells[name].error
+
+    def recalculate(self) -> int:
+        """
+        Recalcula as células afetadas pelas edições desde o último recálculo.
+
+        As células saem do heap em ordem crescente de `rank`, então cada uma é
+        calculada depois de todas as suas entradas e no máximo uma vez. Se o
+        resultado não mudou, as dependentes não são agendadas.
+
+        Returns:
+            int: Quantidade de células recalculadas.
+        """
+        cells, pending, queued = self._cells, self._pending, self._queued
+        recomputed = 0
+        while pending:
+            rank, _, name = heappop(pending)
+            cell = cells[name]
+            if rank != cell.rank:
+                # O rank subiu depois do agendamento (nova fórmula acima): reagenda na posição certa
+                heappush(pending, (cell.rank, next(self._order), name))
+                continue
+            queued.discard(name)
+            if cell.operator is None:
+                continue  # Virou valor fixo depois de agendada
+            recomputed += 1
+            value, error = self._evaluate(cell)
+            if value == cell.value and type(error) is type(cell.error):
+                continue
+            cell.value, cell.error = value, error
+            for dependent in cell.dependents:
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heappush(pending, (cells[dependent].rank, next(self._order), dependent))
+        self.last_recomputed = recomputed
+        self.total_recomputed += recomputed
+        return recomputed
+
+    def _evaluate(self, cell: _Cell) -> tuple[float | None, Exception | None]:
+        """Calcula a fórmula de uma célula, retornando o valor ou o erro."""
+        cells = self._cells
+        values = []
+        for arg in cell.inputs:
+            if isinstance(arg, str):
+                source = cells[arg]
+                if source.error is not None:
+                    return None, source.error
+                arg = source.value
+            values.append(arg)
+
+        operation = self._dispatch[cell.operator]
+        result = values[0]
+        try:
+            if len(values) == 1:
+                result = operation(result, None)    # Operadores unários
+            for value in values[1:]:
+                result = operation(result, value)   # Da esquerda para a direita; '%' tem dois argumentos
+        except OPERATION_ERRORS as e:
+            return None, e
+        return result, None
+
+    def _schedule(self, name: str) -> None:
+        """Agenda uma célula para o próximo recálculo."""
+        if name not in self._queued:
+            self._queued.add(name)
+            heappush(self._pending, (self._cells[name].rank, next(self._order), name))
+
+    def _detach(self, name: str, cell: _Cell) -> None:
+        """Remove a célula das listas de dependentes das entradas da fórmula atual."""
+        for reference in dict.fromkeys(arg for arg in cell.inputs if isinstance(arg, str)):
+            self._cells[reference].dependents.remove(name)
+
+    def _raise_rank(self, name: str, rank: int) -> None:
+        """Sobe o rank da célula e, se preciso, das dependentes, mantendo a ordem topológica."""
+        stack = [(name, rank)]
+        while stack:
+            name, rank = stack.pop()
+            cell = self._cells[name]
+            if rank <= cell.rank:
+                continue
+            cell.rank = rank
+            stack.extend((dependent, rank + 1) for dependent in cell.dependents)
+
+    def _check_cycle(self, name: str, references: list[str]) -> None:
+        """
+        Verifica se alguma referência depende (direta ou indiretamente) da célula.
+
+        Como as dependentes de uma célula têm rank maior que o dela, só as
+        referências com rank acima do da célula podem fechar um ciclo, e a busca
+        não precisa passar de células com rank acima do maior deles.
+
+        Raises:
+            CircularReferenceError: Se a fórmula criaria um ciclo.
+        """
+        if name in references:
+            raise CircularReferenceError(f"A célula {name!r} referencia a si mesma.")
+        rank = self._cells[name].rank
+        candidates = {reference for reference in references if self._cells[reference].rank > rank}
+        if not candidates:
+            return
+        limit = max(self._cells[reference].rank for reference in candidates)
+        stack, seen = [name], {name}
+        while stack:
+            for dependent in self._cells[stack.pop()].dependents:
+                if dependent in candidates:
+                    raise CircularReferenceError(f"A célula {name!r} depende de {dependent!r}, que a referencia.")
+                if dependent not in seen and self._cells[dependent].rank <= limit:
+                    seen.add(dependent)
+                    stack.append(dependent)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._cells
+
+    def __len__(self) -> int:
+        return len(self._cells)
@@ -0,0 +1,261 @@
+import argparse
+import asyncio
+import json
+import math
+from model.calculator import Calculator
+from model.expression import ExpressionEngine
+from model.exceptions import OPERATION_ERRORS, InvalidExpressionError
+from model.opcodes import UNARY_OPERATORS
+from controller.headless import unknown_keys
+from controller.sessions import SessionManager
+
+class InvalidRequestError(ValueError):
+    """
+    Exceção para requisições malformadas (JSON inválido ou campos ausentes).
+    """
+    pass
+
+
+# Erros de cálculo devolvidos ao cliente como resposta (e não como falha da conexão)
+CALCULATION_ERRORS = (*OPERATION_ERRORS, InvalidExpressionError, ValueError, OverflowError)
+
+
+def _reject_constant(name: str):
+    """Rejeita NaN e Infinity, que não são JSON padrão (json.loads os aceitaria)."""
+    raise InvalidRequestError(f"Valor não permitido em JSON: {name}")
+
+
+def _parse_float(text: str) -> float:
+    """Converte um número JSON em float, rejeitando os que estouram para infinito (ex.: 1e999)."""
+    value = float(text)
+    if math.isinf(value):
+        raise InvalidRequestError(f"Número fora do intervalo do float: {text}")
+    return value
+
+
+def _operand(value) -> float:
+    """Converte um operando da requisição em float (inteiros enormes, como 10**400, são rejeitados)."""
+    try:
+        return float(value)
+    except OverflowError:
+        raise InvalidRequestError("Operando fora do intervalo do float.") from None
+
+
+class CalculatorService:
+    """
+    Serviço que avalia requisições de calculadora, independente do transporte.
+
+    Cada requisição é uma linha: um objeto JSON ou, para texto simples,
+    uma expressão infixa. Os formatos aceitos são:
+
+        {"op": "+", "a": 1, "b": 2}        Operação única da Calculator
+        {"keys": "1 2 + 3 ="}              Teclas na sessão da conexão (string ou lista)
+        {"expr": "12*(3+4)/sqrt(16)"}      Expressão infixa
+        12*(3+4)/sqrt(16)                  Expressão infixa em texto simples
+
+    Um campo "id" opcional é devolvido na resposta, que também é uma linha JSON.
+    As respostas são JSON padrão: resultados infinitos ou NaN são enviados como
+    texto ("inf", "-inf", "nan"), como no display da calculadora.
+    """
+
+    def __init__(self, cache_size: int = 1024, result_cache=None):
+        """
+        Args:
+            cache_size: Tamanho do cache de expressões compiladas.
+            result_cache: ResultCache opcional (model/result_cache.py) para os resultados de
+                          operações e expressões, persistente e compartilhado entre processos.
+        """
+        self.calculator = Calculator()      # Só `apply`, sem estado: seguro entre conexões e threads
+        self.engine = ExpressionEngine(cache_size=cache_size)
+        self.sessions = SessionManager()
+        self.result_cache = result_cache
+
+    def handle_line(self, session: int, line: bytes) -> bytes:
+        """
+        Avalia uma linha de requisição e devolve a linha de resposta.
+
+        Args:
+            session: Sessão da conexão no SessionManager.
+            line: Linha recebida, com ou sem a quebra de linha.
+
+        Returns:
+            bytes: Resposta JSON terminada em quebra de linha.
+        """
+        text = line.decode("utf-8", errors="replace").strip()
+        request_id = None
+        try:
+            if text.startswith("{"):
+                request = self._parse_request(text)
+                request_id = request.get("id")
+                response = self._dispatch(session, request)
+            else:
+                response = {"result": self._evaluate_expression(text)}
+            response["ok"] = True
+        except InvalidRequestError as e:
+            response = {"ok": False, "error": "InvalidRequest", "message": str(e)}
+        except CALCULATION_ERRORS as e:
+            response = {"ok": False, "error": type(e).__name__, "message": str(e)}
+        if request_id is not None:
+            response["id"] = request_id
+        result = response.get("result")
+        if isinstance(result, float) and not math.isfinite(result):
+            response["result"] = repr(result)
+        return json.dumps(response, ensure_ascii=False, allow_nan=False).encode("utf-8") + b"\n"
+
+    @staticmethod
+    def _parse_request(text: str) -> dict:
+        """Decodifica a requisição JSON, validando que é um objeto."""
+        try:
+            request = json.loads(text, parse_float=_parse_float, parse_constant=_reject_constant)
+        except json.JSONDecodeError as e:
+            raise InvalidRequestError(f"JSON inválido: {e}") from e
+        except RecursionError:
+            raise InvalidRequestError("JSON aninhado demais.") from None
+        if not isinstance(request, dict):
+            raise InvalidRequestError("A requisição JSON deve ser um objeto.")
+        return request
+
+    def _dispatch(self, session: int, request: dict) -> dict:
+        """Encaminha a requisição JSON para a operação, as teclas ou a expressão."""
+        try:
+            return self._evaluate_request(session, request)
+        except KeyError as e:
+            raise InvalidRequestError(f"Campo obrigatório ausente: {e}") from e
+        except (TypeError, AttributeError) as e:
+            raise InvalidRequestError(f"Tipo de campo inválido: {e}") from e
+
+    def _evaluate_request(self, session: int, request: dict) -> dict:
+        """Avalia a operação, as teclas ou a expressão da requisição."""
+        if "op" in request:
+            operator = request["op"]
+            a = _operand(request["a"])
+            b = None if operator in UNARY_OPERATORS else _operand(request["b"])
+            if self.result_cache is None:
+                return {"result": self.calculator.apply(operator, a, b)}
+            from model.result_cache import operation_key
+            return {"result": self.result_cache.get_or_compute(
+                operation_key(operator, a, b), lambda: self.calculator.apply(operator, a, b))}
+        if "keys" in request:
+            keys = request["keys"]
+            if isinstance(keys, str):
+                keys = keys.split()
+            unknown = unknown_keys(keys)
+            if unknown:
+                raise InvalidRequestError(f"Teclas desconhecidas: {unknown}")
+            for key in keys:
+                try:
+                    self.sessions.process_input(session, key)
+                except ValueError:
+                    pass  # Operador sobre mensagem de erro: ignorado, como na GUI
+            return {"result": self.sessions.current_value(session), "display": self.sessions.display_text(session)}
+        if "expr" in request:
+            return {"result": self._evaluate_expression(request["expr"])}
+        raise InvalidRequestError("A requisição deve conter 'op', 'keys' ou 'expr'.")
+
+    def _evaluate_expression(self, expression: str) -> float:
+        """Avalia uma expressão infixa, passando pelo cache de resultados se houver."""
+        if self.result_cache is None:
+            return self.engine.evaluate(expression)
+        from model.result_cache import expression_key
+        return self.result_cache.get_or_compute(expression_key(expression), lambda: self.engine.evaluate(expression))
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                                max_pipeline: int = 256) -> None:
+        """
+        Atende uma conexão: lê requisições em pipeline e responde na mesma ordem.
+
+        A leitura e a avaliação são separadas por uma fila limitada. Se o cliente
+        envia mais rápido do que consome as respostas, `drain` pausa a avaliação,
+        a fila enche e a leitura para, propagando a contrapressão via TCP.
+
+        Args:
+            reader: Fluxo de entrada da conexão.
+            writer: Fluxo de saída da conexão.
+            max_pipeline: Requisições lidas e ainda não respondidas, no máximo.
+        """
+        queue = asyncio.Queue(maxsize=max_pipeline)
+        session = self.sessions.open()
+
+        async def read_requests():
+            try:
+                while line := await reader.readline():
+                    await queue.put(line)
+            except (ConnectionError, ValueError):
+                pass  # Conexão encerrada ou linha acima do limite do StreamReader
+            await queue.put(None)
+
+        reader_task = asyncio.create_task(read_requests())
+        try:
+            while (line := await queue.get()) is not None:
+                if session not in self.sessions:
+                    session = self.sessions.open()  # A sessão expirou por inatividade
+                writer.write(self.handle_line(session, line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            reader_task.cancel()
+            if session in self.sessions:
+                self.sessions.close(session)
+            writer.close()
+
+
+async def serve(host: str, port: int, max_pipeline: int = 256, session_idle: float = 600.0,
+                cache_path: str | None = None) -> None:
+    """
+    Inicia o servidor TCP e atende conexões até ser interrompido.
+
+    Args:
+        host: Endereço de escuta.
+        port: Porta de escuta.
+        max_pipeline: Requisições em pipeline por conexão antes da contrapressão.
+        session_idle: Segundos de inatividade antes de uma sessão expirar.
+        cache_path: Arquivo SQLite do cache persistente de resultados. Padrão: sem cache.
+    """
+    result_cache = None
+    if cache_path is not None:
+        from model.result_cache import ResultCache
+        result_cache = ResultCache(cache_path)
+    service = CalculatorService(result_cache=result_cache)
+    server = await asyncio.start_server(
+        lambda r, w: service.handle_connection(r, w, max_pipeline), host, port)
+    print(f"Servidor da calculadora em {', '.join(str(s.getsockname()) for s in server.sockets)}")
+
+    async def evict_idle_sessions():
+        while True:
+            await asyncio.sleep(session_idle / 2)
+            service.sessions.evict_idle(session_idle)
+
+    evictor = asyncio.create_task(evict_idle_sessions())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        evictor.cancel()
+        if result_cache is not None:
+            print(f"Cache de resultados: {result_cache.stats()}")
+            result_cache.close()
+
+
+def main(argv: list[str] | None = None):
+    """
+    Ponto de entrada do serviço de rede da calculadora, sem interface gráfica.
+
+    Uso:
+        python src/server.py [--host 127.0.0.1] [--port 8765] [--cache resultados.db]
+    """
+    parser = argparse.ArgumentParser(description="Serviço TCP da calculadora (requisições por linha).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-pipeline", type=int, default=256)
+    parser.add_argument("--session-idle", type=float, default=600.0)
+    parser.add_argument("--cache", default=None, help="Arquivo SQLite do cache persistente de resultados")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_pipeline, args.session_idle, args.cache))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,66 @@
+import time
 import tkinter as tk
+from tkinter import ttk
+from collections import deque
+
+
+class DisplayStats:
+    """
+    Estatísticas das atualizações do display com coalescência.
+
+    Mede quantas atualizações foram pedidas pelo controlador, quantas
+    realmente redesenharam o display e a latência entre a primeira
+    atualização pendente e a pintura correspondente.
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        """
+        Args:
+            max_samples: Quantidade de amostras de latência mantidas (as mais recentes).
+        """
+        self.updates = 0                                # Chamadas a update_display
+        self.redraws = 0                                # Vezes em que o display foi realmente alterado
+        self.latencies = deque(maxlen=max_samples)      # Latências tecla-pintura, em segundos
+
+    @property
+    def redraws_avoided(self) -> int:
+        """Atualizações absorvidas pela coalescência (não redesenhadas)."""
+        return self.updates - self.redraws
+
+    def summary(self) -> str:
+        """
+        Retorna um resumo legível das estatísticas.
+
+        Returns:
+            str: Atualizações, redesenhos evitados e latências média e máxima em milissegundos.
+        """
+        if self.latencies:
+            mean = sum(self.latencies) / len(self.latencies) * 1000
+            worst = max(self.latencies) * 1000
+        else:
+            mean = worst = 0.0
+        return (f"{self.updates} atualizações, {self.redraws} redesenhos "
+                f"({self.redraws_avoided} evitados), latência média {mean:.2f} ms, máxima {worst:.2f} ms")
+
+
+class _DisplayVar(tk.StringVar):
+    """
+    StringVar do display que enxerga o texto ainda não desenhado.
+
+    O controlador lê o display com `display_var.get()`; enquanto há uma
+    atualização pendente, a leitura devolve o texto pendente, de modo que a
+    coalescência não altera o comportamento da calculadora.
+    """
+
+    def __init__(self, master, value):
+        super().__init__(master, value=value)
+        self.pending: str | None = None  # Texto aguardando o próximo ciclo ocioso
+
+    def get(self):
+        if self.pending is not None:
+            return self.pending
+        return super().get()
+
 
 class Gui:
     """
@@ -7,7 +69,7 @@ class Gui:
     Responsável por criar a interface gráfica, exibir o display,
     criar os botões e enviar os eventos de clique para o controlador.
     """
-    def __init__(self, controller):
+    def __init__(self, controller, coalesce: bool = True):
         """
         Inicializa a interface gráfica da calculadora.
 
@@ -16,12 +78,20 @@ class Gui:
         Args:
             controller: Instância do controlador (Controller) que lidará com os eventos
                         disparados pelos botões da interface.
+            coalesce: Se verdadeiro, agrupa as atualizações consecutivas do display
+                      em um único redesenho por ciclo ocioso do Tk.
         """
         self.controller = controller
         self.window = tk.Tk()
-        self.display_var = tk.StringVar(value=0)  # Variável que controla o texto exibido no display
+        self.display_var = _DisplayVar(self.window, value=0)  # Variável que controla o texto exibido no display
+        self.coalesce = coalesce
+        self.display_stats = DisplayStats()
+        self._flush_id = None        # Identificador do after_idle agendado, se houver
+        self._paint_id = None        # Medição de latência agendada sem coalescência, se houver
+        self._pending_since = 0.0    # Instante da primeira atualização ainda não desenhada
         self.window.title("Calculator")
-        self.window.geometry("300x400")  # Define o tamanho da janela
+        self.window.geometry("320x560")  # Define o tamanho da janela
+        self.window.protocol("WM_DELETE_WINDOW", self.close)  # Encerra as tarefas antes de fechar
 
         self._create_widgets()  # Cria o display e os botões
 
@@ -50,7 +120,9 @@ class Gui:
             '4', '5', '6', '*',
             '1', '2', '3', '-',
             'C', '0', '.', '+',
-            '%', 'sqrt', '='
+            '%', 'sqrt', '^', 'root',
+            'log', 'ln', 'exp', '!',
+            'sin', 'cos', 'tan', '='
         ]
 
         row = 0
@@ -74,19 +146,101 @@ class Gui:
         # Configura pesos para linhas e colunas para que os botões expandam proporcionalmente
         for i in range(4):
             buttons_frame.grid_columnconfigure(i, weight=1)
+        for i in range((len(buttons) + 3) // 4):
             buttons_frame.grid_rowconfigure(i, weight=1)
 
+        # Indicador de progresso das tarefas em segundo plano (oculto enquanto não há nenhuma)
+        self.progress_frame = tk.Frame(self.window)
+        self.progress_bar = ttk.Progressbar(self.progress_frame, maximum=1.0, mode="determinate")
+        self.progress_bar.pack(side="left", fill="x", expand=True, padx=(10, 5))
+        cancel_button = tk.Button(self.progress_frame, text="Cancelar",
+                                  command=lambda: self.controller.cancel_background())
+        cancel_button.pack(side="right", padx=(0, 10))
+
     def update_display(self, text: str):
         """
         Atualiza o texto do display da calculadora.
 
         Este método é chamado pelo controlador sempre que o valor
-        mostrado no display deve ser alterado.
+        mostrado no display deve ser alterado. Com a coalescência ativa,
+        o texto fica pendente e apenas o último de uma rajada é desenhado,
+        no próximo ciclo ocioso do Tk.
 
         Args:
             text: Novo texto a ser exibido no display.
         """
+        self.display_stats.updates += 1
+        if not self.coalesce:
+            self.display_var.set(text)
+            self.display_stats.redraws += 1
+            if self._paint_id is None:
+                # Uma medição por ciclo ocioso: a latência da primeira atualização até a pintura
+                self._pending_since = time.perf_counter()
+                self._paint_id = self.window.after_idle(self._record_paint, self._pending_since)
+            return
+
+        self.display_var.pending = text
+        if self._flush_id is None:
+            self._pending_since = time.perf_counter()
+            self._flush_id = self.window.after_idle(self._flush_display)
+
+    def flush_display(self):
+        """
+        Desenha imediatamente o texto pendente do display, se houver.
+
+        Útil antes de ler o display fora do controlador ou ao encerrar a aplicação.
+        """
+        if self._flush_id is not None:
+            self.window.after_cancel(self._flush_id)
+            self._flush_display()
+
+    def _flush_display(self):
+        """Aplica o último texto pendente ao display (um único redesenho)."""
+        self._flush_id = None
+        text = self.display_var.pending
+        if text is None:
+            return
+        self.display_var.pending = None
         self.display_var.set(text)
+        self.display_stats.redraws += 1
+        # O redesenho do Label também ocorre no ciclo ocioso; a próxima tarefa ociosa roda após a pintura
+        self.window.after_idle(self._record_paint, self._pending_since)
+
+    def _record_paint(self, since: float):
+        """Registra a latência entre a primeira atualização pendente e a pintura."""
+        self._paint_id = None
+        self.display_stats.latencies.append(time.perf_counter() - since)
+
+    def schedule(self, delay_ms: int, callback):
+        """
+        Agenda `callback` na thread da interface após `delay_ms` milissegundos.
+
+        Usado pelo controlador para trazer de volta os resultados das tarefas em segundo plano.
+        """
+        return self.window.after(delay_ms, callback)
+
+    def show_progress(self, fraction: float | None):
+        """
+        Mostra o progresso das tarefas em segundo plano.
+
+        Args:
+            fraction: Fração concluída (0 a 1), ou None para ocultar o indicador.
+        """
+        if fraction is None:
+            self.progress_frame.pack_forget()
+            return
+        if not self.progress_frame.winfo_manager():
+            self.progress_frame.pack(fill="x", pady=(0, 10))
+        self.progress_bar["value"] = fraction
+
+    def close(self):
+        """
+        Fecha a janela, encerrando antes as tarefas em segundo plano do controlador.
+
+        Chamado quando o usuário fecha a janela (WM_DELETE_WINDOW).
+        """
+        self.controller.close()
+        self.window.destroy()
 
     def start(self):
         """
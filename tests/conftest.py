@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Raiz única de importação dos testes: 'src', a mesma dos módulos da aplicação
+# (ex.: `from model.calculator import Calculator`), para que cada classe tenha uma só identidade
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
@@ -0,0 +1,145 @@
+import math
+import pickle
+import random
+import statistics
+import unittest
+from model.accumulators import KahanSum, RunningStats, QuantileSketch, StreamingStats
+from model.backends import FractionCalculator
+from model.calculator import Calculator
+from controller.headless import HeadlessController
+
+class TestAccumulators(unittest.TestCase):
+    """
+    Conjunto de testes unitários para os acumuladores de fluxo.
+
+    Compara cada acumulador com o cálculo exato sobre a lista completa,
+    inclusive após combinar acumuladores parciais.
+    """
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.values = [rng.lognormvariate(3, 1.5) * rng.choice((1, 1, 1, -1)) for _ in range(20_000)]
+
+    def test_kahan_sum(self):
+        """Verifica se a soma compensada mantém as parcelas pequenas que a soma simples perde."""
+        total = KahanSum()
+        for value in [1e16, 1.0, -1e16] * 1000:
+            total.add(value)
+        self.assertEqual(total.value, 1000.0)
+        self.assertNotEqual(sum([1e16, 1.0, -1e16] * 1000), 1000.0)  # A soma simples perde os 1.0
+        total.clear()
+        self.assertEqual(total.value, 0.0)
+
+    def test_running_stats(self):
+        """Verifica se contagem, média, variâncias, mínimo e máximo coincidem com o módulo statistics."""
+        stats = RunningStats()
+        for value in self.values:
+            stats.add(value)
+        self.assertEqual(stats.count, len(self.values))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(self.values), places=9)
+        self.assertAlmostEqual(stats.variance(), statistics.pvariance(self.values), delta=1e-9 * stats.variance())
+        self.assertAlmostEqual(stats.variance(sample=True), statistics.variance(self.values),
+                               delta=1e-9 * stats.variance())
+        self.assertEqual((stats.min, stats.max), (min(self.values), max(self.values)))
+        self.assertTrue(math.isnan(RunningStats().variance()))
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Verifica se os quantis do sketch respeitam a precisão relativa configurada."""
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in self.values:
+            sketch.add(value)
+        ordered = sorted(self.values)
+        for q in (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * abs(exact) + 1e-12, q)
+        self.assertLess(len(sketch._positive) + len(sketch._negative), 2000)
+        with self.assertRaises(ValueError):
+            sketch.quantile(1.5)
+
+    def test_bucket_limit(self):
+        """Verifica se o limite de intervalos é respeitado sem perder a precisão dos quantis altos."""
+        sketch = QuantileSketch(max_buckets=16)
+        for value in self.values:
+            sketch.add(value)
+        self.assertLessEqual(len(sketch._positive), 16)
+        # Os intervalos unidos são os de menor magnitude: os quantis altos continuam precisos
+        ordered = sorted(self.values)
+        self.assertAlmostEqual(sketch.quantile(0.999), ordered[int(0.999 * (len(ordered) - 1))], delta=0.02 * ordered[-1])
+
+    def test_merge_matches_single_stream(self):
+        """Verifica se combinar acumuladores parciais equivale a acumular o fluxo inteiro."""
+        whole = StreamingStats()
+        parts = [StreamingStats() for _ in range(4)]
+        for i, value in enumerate(self.values):
+            whole.add(value)
+            parts[i % 4].add(value)
+        merged = StreamingStats()
+        for part in parts:
+            merged.merge(pickle.loads(pickle.dumps(part)))  # Como se viesse de outro processo
+
+        expected, actual = whole.summary(), merged.summary()
+        self.assertEqual(actual["count"], expected["count"])
+        for key in ("sum", "mean", "variance", "min", "max", "p50", "p90", "p99"):
+            self.assertAlmostEqual(actual[key], expected[key], delta=1e-9 * abs(expected[key]) + 1e-12, msg=key)
+        with self.assertRaises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_clear_and_empty(self):
+        """Verifica se limpar zera os acumuladores e se o resumo vazio usa NaN."""
+        stats = StreamingStats()
+        stats.add(5)
+        stats.clear()
+        summary = stats.summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertEqual(summary["sum"], 0.0)
+        self.assertTrue(math.isnan(summary["mean"]) and math.isnan(summary["p50"]))
+        stats.add(0)
+        stats.add(-2)
+        self.assertEqual(stats.quantile(0), -2)
+        self.assertEqual(stats.quantile(1), 0)
+
+    def test_non_finite_values(self):
+        """Verifica se os infinitos são contados nos extremos e se NaN é rejeitado sem alterar os acumuladores."""
+        sketch = QuantileSketch()
+        for value in (-math.inf, 1.0, 2.0, math.inf, math.inf):
+            sketch.add(value)
+        self.assertEqual(sketch.quantile(0), -math.inf)
+        self.assertAlmostEqual(sketch.quantile(0.5), 2.0, delta=0.02)
+        self.assertEqual(sketch.quantile(1), math.inf)
+        self.assertEqual(QuantileSketch().merge(sketch).quantile(1), math.inf)
+
+        stats = StreamingStats()
+        for value in (1.0, 2.0, math.inf):
+            stats.add(value)
+        with self.assertRaises(ValueError):
+            stats.add(math.nan)
+        summary = stats.summary()
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual((summary["sum"], summary["mean"], summary["max"]), (math.inf, math.inf, math.inf))
+        self.assertEqual(stats.stats.count, 3)
+
+    def test_controller_stats(self):
+        """Verifica se o controlador alimenta as estatísticas com cada resultado e as limpa no C."""
+        controller = HeadlessController(Calculator())
+        stats = controller.enable_stats()
+        for key in "2 + 3 = * 4 = 1 6 sqrt 1 / 0 = 5 0 + 1 0 %".split():
+            controller.process_input(key)
+        self.assertEqual(stats.count, 4)          # 5, 20, 4 e 5 (10% de 50); a divisão por zero não conta
+        summary = stats.summary()
+        self.assertEqual((summary["min"], summary["max"], summary["sum"]), (4.0, 20.0, 34.0))
+        controller.process_input("C")
+        self.assertEqual(stats.count, 0)
+        controller.disable_stats()
+        for key in "1 + 1 =".split():
+            controller.process_input(key)
+        self.assertEqual(stats.count, 0)
+
+        controller = HeadlessController(FractionCalculator())
+        stats = controller.enable_stats()
+        for key in "1 / 3 =".split():
+            controller.process_input(key)
+        self.assertAlmostEqual(stats.summary()["mean"], 1 / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
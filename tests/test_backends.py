@@ -0,0 +1,141 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from model.backends import DecimalCalculator, FractionCalculator, create_calculator
+from model.calculator import Calculator
+from model.exceptions import DivisionByZeroError, DomainError, NegativeNumberSqrtError, ResultOverflowError
+from controller.controller import Controller
+from controller.headless import HeadlessController
+
+
+class StatefulGui:
+    """
+    Mock da GUI que guarda o texto do display, como o StringVar do Tk.
+    """
+    def __init__(self):
+        self.text = "0"
+        self.display_var = self
+
+    def get(self):
+        return self.text
+
+    def update_display(self, text):
+        self.text = text
+
+
+def run_keys(controller, keys):
+    for key in keys.split():
+        controller.process_input(key)
+
+
+class TestBackends(unittest.TestCase):
+    """
+    Conjunto de testes unitários para os tipos numéricos da calculadora.
+
+    Verifica a aritmética de cada tipo, a conversão do display e que os
+    controladores com e sem GUI produzem o mesmo texto para cada tipo.
+    """
+
+    def test_create_calculator(self):
+        """Verifica se create_calculator escolhe o tipo numérico e recusa opções inválidas."""
+        self.assertIs(type(create_calculator()), Calculator)
+        self.assertIsInstance(create_calculator("decimal"), DecimalCalculator)
+        self.assertIsInstance(create_calculator("fraction"), FractionCalculator)
+        self.assertEqual(create_calculator("decimal", precision=5).context.prec, 5)
+        with self.assertRaises(ValueError):
+            create_calculator("complex")
+        with self.assertRaises(ValueError):
+            create_calculator("float", precision=5)
+
+    def test_decimal_arithmetic(self):
+        """Testa as operações da calculadora Decimal, sem os erros de arredondamento do float."""
+        calc = DecimalCalculator(precision=10)
+        self.assertEqual(calc.current_value, Decimal(0))
+        calc.add(Decimal("0.1"))
+        calc.add(Decimal("0.2"))
+        self.assertEqual(calc.current_value, Decimal("0.3"))
+        calc.divide(Decimal(3))
+        self.assertEqual(calc.current_value, Decimal("0.1000000000"))
+        calc.current_value = Decimal(2)
+        self.assertEqual(calc.sqrt(), Decimal("1.414213562"))
+        calc.current_value = Decimal(50)
+        self.assertEqual(calc.percent(Decimal(200)), Decimal(100))
+
+    def test_decimal_precision_is_per_instance(self):
+        """Verifica se cada DecimalCalculator usa a própria precisão."""
+        low, high = DecimalCalculator(precision=3), DecimalCalculator(precision=20)
+        low.current_value = high.current_value = Decimal(1)
+        self.assertEqual(str(low.divide(Decimal(3))), "0.333")
+        self.assertEqual(str(high.divide(Decimal(3))), "0.33333333333333333333")
+
+    def test_fraction_arithmetic(self):
+        """Testa as operações exatas da calculadora de frações."""
+        calc = FractionCalculator()
+        calc.add(Fraction(1, 3))
+        calc.multiply(Fraction(3))
+        self.assertEqual(calc.current_value, Fraction(1))
+        calc.current_value = Fraction(9, 16)
+        self.assertEqual(calc.sqrt(), Fraction(3, 4))
+        calc.current_value = Fraction(2)
+        self.assertAlmostEqual(float(calc.sqrt()), 2 ** 0.5)
+
+    def test_errors(self):
+        """Verifica se os tipos exatos lançam as mesmas exceções que a Calculator."""
+        for calc in (DecimalCalculator(), FractionCalculator()):
+            with self.assertRaises(DivisionByZeroError):
+                calc.divide(calc.zero)
+            calc.current_value = calc.parse("-4")
+            with self.assertRaises(NegativeNumberSqrtError):
+                calc.sqrt()
+
+    def test_repeated_squaring_overflows(self):
+        """Verifica se elevar ao quadrado repetidamente termina em estouro, e não em exceção do decimal."""
+        for backend in ("decimal", "fraction"):
+            controller = HeadlessController(create_calculator(backend))
+            with self.subTest(backend=backend):
+                for key in "1 0 ^ 3 0 0 =".split():
+                    controller.process_input(key)
+                for _ in range(12):
+                    controller.process_input("*")
+                    controller.process_input("=")
+                    if controller.display_text == "Resultado grande demais para ser representado.":
+                        break
+                else:
+                    self.fail("O resultado não estourou.")
+                self.assertIsInstance(controller.last_error, ResultOverflowError)
+        calc = DecimalCalculator()
+        with self.assertRaises(DomainError):          # infinito - infinito
+            calc.apply('-', Decimal("Infinity"), Decimal("Infinity"))
+
+    def test_parse_and_format(self):
+        """Testa a conversão entre texto do display e valores Decimal e Fraction."""
+        self.assertEqual(FractionCalculator.format(Fraction(-1, 4)), "-0.25")
+        self.assertEqual(FractionCalculator.format(Fraction(1, 3)), "1/3")
+        self.assertEqual(FractionCalculator.format(Fraction(7)), "7")
+        self.assertEqual(FractionCalculator.parse("1/3"), Fraction(1, 3))
+        self.assertEqual(DecimalCalculator.format(Decimal("1E+3")), "1000")
+        with self.assertRaises(ValueError):
+            DecimalCalculator().parse("Não é possível dividir por zero.")
+
+    def test_controllers_agree(self):
+        """Verifica se o controlador exibe os resultados esperados com cada tipo numérico."""
+        sequences = ["0 . 1 + 0 . 2 =", "1 / 3 * 3 =", "5 0 + 1 0 % =", "1 6 sqrt", "2 * 5 % =", "8 / 0 =", "9 - 1 . 2 5 ="]
+        expected = {
+            "decimal": ["0.3", "0.9999999999999999999999999999", "55", "4", "0.10", "Não é possível dividir por zero.", "7.75"],
+            "fraction": ["0.3", "1", "55", "4", "0.1", "Não é possível dividir por zero.", "7.75"],
+        }
+        for backend, displays in expected.items():
+            for keys, display in zip(sequences, displays):
+                with self.subTest(backend=backend, keys=keys):
+                    controller = Controller(create_calculator(backend))
+                    gui = StatefulGui()
+                    controller.set_gui(gui)
+                    run_keys(controller, keys)
+                    headless = HeadlessController(create_calculator(backend))
+                    run_keys(headless, keys)
+                    self.assertEqual(gui.text, display)
+                    self.assertEqual(headless.display_text, display)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from model.calculator import Calculator
+from model.exceptions import DivisionByZeroError
+from controller.background import BackgroundRunner
+from controller.controller import Controller
+from view.gui import Gui
+
+
+class FakeTk:
+    """
+    Substitui o loop do Tk: guarda os callbacks agendados e a GUI do controlador.
+    """
+    def __init__(self):
+        self.text = "0"
+        self.display_var = self
+        self.scheduled = []
+        self.progress = []
+
+    def get(self):
+        return self.text
+
+    def update_display(self, text):
+        self.text = text
+
+    def schedule(self, delay_ms, callback):
+        self.scheduled.append(callback)
+
+    def show_progress(self, fraction):
+        self.progress.append(fraction)
+
+    def run_until(self, condition, timeout=5.0):
+        """Executa os callbacks agendados, como o mainloop, até a condição ser satisfeita."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                raise AssertionError("Tempo esgotado")
+            pending, self.scheduled = self.scheduled, []
+            for callback in pending:
+                callback()
+            time.sleep(0.001)
+
+
+class TestBackgroundRunner(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a execução em segundo plano.
+
+    Verifica que os callbacks rodam na thread que consulta as tarefas (a da
+    interface), o cancelamento, o progresso e a integração com o controlador.
+    """
+
+    def setUp(self):
+        self.tk = FakeTk()
+        self.runner = BackgroundRunner(self.tk.schedule, poll_interval_ms=1)
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_result_delivered_on_polling_thread(self):
+        """Verifica se a tarefa roda em outra thread e o resultado volta para a thread da janela."""
+        results = []
+
+        def work(task, n):
+            return sum(range(n)), threading.get_ident()
+
+        self.runner.submit(work, 1000, on_done=lambda result: results.append((result, threading.get_ident())))
+        self.tk.run_until(lambda: results)
+        (total, worker_thread), callback_thread = results[0]
+        self.assertEqual(total, 499500)
+        self.assertNotEqual(worker_thread, threading.get_ident())
+        self.assertEqual(callback_thread, threading.get_ident())
+        self.assertEqual(self.runner.active, [])
+
+    def test_cancel(self):
+        """Verifica se uma tarefa em andamento pode ser cancelada."""
+        started = threading.Event()
+        outcome = []
+
+        def work(task):
+            started.set()
+            while True:
+                task.check_cancelled()
+                time.sleep(0.001)
+
+        task = self.runner.submit(work, on_done=outcome.append, on_cancel=lambda: outcome.append("cancelada"))
+        started.wait(5)
+        task.cancel()
+        self.tk.run_until(lambda: outcome)
+        self.assertEqual(outcome, ["cancelada"])
+
+    def test_error_and_progress(self):
+        """Verifica se o progresso e as exceções da tarefa chegam aos callbacks."""
+        errors, progress = [], []
+        release = threading.Event()
+
+        def work(task):
+            task.report(1, 2)
+            release.wait(5)
+            raise DivisionByZeroError("Não é possível dividir por zero.")
+
+        self.runner.submit(work, on_error=errors.append, on_progress=progress.append)
+        self.tk.run_until(lambda: progress)
+        release.set()
+        self.tk.run_until(lambda: errors)
+        self.assertEqual(progress, [0.5])
+        self.assertIsInstance(errors[0], DivisionByZeroError)
+
+    def test_controller_replay_in_background(self):
+        """Verifica se a reprodução em segundo plano deixa o controlador no estado final das teclas."""
+        controller = Controller(Calculator())
+        controller.set_gui(self.tk)
+        task = controller.replay_in_background("1 2 + 3 = * 2 =".split() * 5000)
+        self.tk.run_until(lambda: task.done and not controller._background.active)
+        self.assertEqual(self.tk.text, "30.0")
+        self.assertEqual(self.tk.progress[0], 0.0)
+        self.assertIsNone(self.tk.progress[-1])
+        # O estado final passa a ser o do controlador: a próxima tecla continua dele
+        for key in "+ 1 =".split():
+            controller.process_input(key)
+        self.assertEqual(self.tk.text, "31.0")
+        controller._background.shutdown()
+
+    def test_close_window_stops_workers(self):
+        """Verifica se fechar a janela cancela a reprodução em andamento e encerra as threads do pool."""
+        controller = Controller(Calculator())
+        controller.set_gui(self.tk)
+        task = controller.replay_in_background("1 + 1 =".split() * 2_000_000)
+        workers = list(controller._background._executor._threads)
+        destroyed = []
+        window = SimpleNamespace(destroy=lambda: destroyed.append(True))
+        Gui.close(SimpleNamespace(controller=controller, window=window))   # Handler do WM_DELETE_WINDOW
+        self.assertEqual(destroyed, [True])
+        self.assertTrue(task.cancelled and task.done)
+        self.assertFalse(any(thread.is_alive() for thread in workers))
+        self.assertIsNone(controller._background)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import numpy as np
+from model.batch import BatchCalculator, evaluate
+from model.calculator import Calculator
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError, NO_ERROR
+
+class TestBatchCalculator(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a classe BatchCalculator.
+
+    Verifica se as operações vetorizadas produzem os mesmos resultados
+    que o caminho escalar da Calculator e se os erros são levantados.
+    """
+
+    def setUp(self):
+        """Prepara operandos com valores variados antes de cada teste."""
+        rng = np.random.default_rng(42)
+        self.a = rng.uniform(-1000, 1000, 500)
+        self.b = rng.uniform(1, 1000, 500)
+
+    def _scalar(self, method, *args):
+        """Aplica a operação elemento a elemento com a Calculator escalar."""
+        calc = Calculator()
+        results = []
+        for i, x in enumerate(self.a):
+            calc.current_value = float(x)
+            results.append(getattr(calc, method)(*(float(arg[i]) for arg in args)))
+        return np.array(results)
+
+    def test_binary_operations_match_scalar(self):
+        """Testa se add, subtract, multiply, divide e percent coincidem com a Calculator."""
+        for method in ("add", "subtract", "multiply", "divide", "percent"):
+            batch = BatchCalculator(self.a)
+            result = getattr(batch, method)(self.b)
+            np.testing.assert_array_equal(result, self._scalar(method, self.b), err_msg=method)
+
+    def test_sqrt_matches_scalar(self):
+        """Testa se a raiz quadrada vetorizada coincide com a Calculator."""
+        self.a = np.abs(self.a)
+        batch = BatchCalculator(self.a)
+        np.testing.assert_array_equal(batch.sqrt(), self._scalar("sqrt"))
+
+    def test_scalar_operand_broadcast(self):
+        """Testa se um operando escalar é aplicado a todos os elementos."""
+        batch = BatchCalculator([1, 2, 3])
+        np.testing.assert_array_equal(batch.multiply(2), [2, 4, 6])
+
+    def test_does_not_modify_input(self):
+        """Verifica se o array original do chamador não é alterado."""
+        original = self.a.copy()
+        BatchCalculator(self.a).add(1)
+        np.testing.assert_array_equal(self.a, original)
+
+    def test_divide_by_zero(self):
+        """Verifica se algum divisor zero lança a exceção e preserva os valores."""
+        batch = BatchCalculator([10, 20])
+        with self.assertRaises(DivisionByZeroError):
+            batch.divide([2, 0])
+        np.testing.assert_array_equal(batch.current_values, [10, 20])
+
+    def test_sqrt_negative(self):
+        """Verifica se algum valor negativo na raiz quadrada lança a exceção correta."""
+        batch = BatchCalculator([4, -9])
+        with self.assertRaises(NegativeNumberSqrtError):
+            batch.sqrt()
+
+    def test_clear(self):
+        """Verifica se clear zera todos os valores mantendo o tamanho."""
+        batch = BatchCalculator([1, 2, 3])
+        batch.clear()
+        np.testing.assert_array_equal(batch.current_values, [0, 0, 0])
+        self.assertEqual(len(batch), 3)
+
+
+class TestEvaluate(unittest.TestCase):
+    """
+    Testes da avaliação em lote sem exceções (resultados mascarados).
+    """
+
+    def test_valid_rows_match_batch(self):
+        """Testa se as linhas válidas coincidem com a BatchCalculator."""
+        a, b = np.array([1.5, -2.0, 8.0]), np.array([3.0, 4.0, 0.5])
+        for operator, method in (('+', 'add'), ('-', 'subtract'), ('*', 'multiply'), ('/', 'divide'), ('%', 'percent')):
+            result, errors = evaluate(operator, a, b)
+            np.testing.assert_array_equal(result, getattr(BatchCalculator(a), method)(b))
+            self.assertTrue((errors == NO_ERROR).all())
+
+    def test_divide_by_zero_is_masked(self):
+        """Verifica se a divisão por zero marca apenas as linhas inválidas."""
+        result, errors = evaluate('/', [10, 20, 30], [2, 0, 3])
+        np.testing.assert_array_equal(errors, [NO_ERROR, DivisionByZeroError.code, NO_ERROR])
+        self.assertEqual(result[0], 5)
+        self.assertTrue(np.isnan(result[1]))
+        self.assertEqual(result[2], 10)
+
+    def test_sqrt_negative_is_masked(self):
+        """Verifica se a raiz de negativos marca apenas as linhas inválidas."""
+        result, errors = evaluate('sqrt', [16, -9])
+        np.testing.assert_array_equal(errors, [NO_ERROR, NegativeNumberSqrtError.code])
+        self.assertEqual(result[0], 4)
+        self.assertTrue(np.isnan(result[1]))
+
+    def test_in_place_buffers(self):
+        """Testa se os buffers fornecidos são reutilizados, inclusive in-place."""
+        values = np.array([8.0, 4.0])
+        errors = np.full(2, 99, dtype=np.uint8)
+        result, codes = evaluate('/', values, np.array([0.0, 2.0]), out=values, errors=errors)
+        self.assertIs(result, values)
+        self.assertIs(codes, errors)
+        np.testing.assert_array_equal(codes, [DivisionByZeroError.code, NO_ERROR])
+        self.assertEqual(values[1], 2)
+
+    def test_unknown_operator(self):
+        """Verifica se um operador desconhecido lança ValueError."""
+        with self.assertRaises(ValueError):
+            evaluate('**', [1], [2])
+
+if __name__ == "__main__":
+    unittest.main()
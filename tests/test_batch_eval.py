@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from batch_eval import evaluate_file
+
+class TestBatchEval(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o modo em lote por arquivo (batch_eval).
+
+    Verifica os resultados, os erros por linha e a preservação da
+    ordem de entrada com e sem o pool de processos.
+    """
+
+    def setUp(self):
+        """Cria um diretório temporário para os arquivos de cada teste."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def _write(self, name, text):
+        with open(self._path(name), "w", encoding="utf-8") as f:
+            f.write(text)
+        return self._path(name)
+
+    def _read(self, name):
+        with open(self._path(name), encoding="utf-8") as f:
+            return f.read()
+
+    def test_csv_results_and_errors(self):
+        """Testa resultados e erros por linha em um CSV com cabeçalho."""
+        source = self._write("in.csv", "a,op,b\n1,+,2\n10,/,0\n-4,sqrt,\n50,%,10\nx,+,1\n")
+        evaluate_file(source, self._path("out.csv"), workers=0)
+        self.assertEqual(self._read("out.csv"),
+                         "a,op,b,result,error\n"
+                         "1,+,2,3.0,\n"
+                         "10,/,0,,DivisionByZeroError\n"
+                         "-4,sqrt,,,NegativeNumberSqrtError\n"
+                         "50,%,10,5.0,\n"
+                         "x,+,1,,ValueError\n")
+
+    def test_csv_quoted_fields(self):
+        """Verifica se campos com vírgulas ou aspas são escritos entre aspas, como no CSV de entrada."""
+        source = self._write("in.csv", 'a,op,b\n"1,5",+,2\n7,"x""y",1\n')
+        evaluate_file(source, self._path("out.csv"), workers=0)
+        self.assertEqual(self._read("out.csv"),
+                         "a,op,b,result,error\n"
+                         '"1,5",+,2,,ValueError\n'
+                         '7,"x""y",1,,KeyError\n')
+
+    def test_quoted_line_breaks_stay_in_one_chunk(self):
+        """Verifica se um campo entre aspas com quebra de linha não é dividido entre blocos."""
+        rows = '"1\n2",+,2\n' + "".join(f'{i},"*\n\nx",2\n3,*,{i}\n' for i in range(5))
+        source = self._write("in.csv", rows)
+        evaluate_file(source, self._path("whole.csv"), workers=0, chunk_size=1000)
+        evaluate_file(source, self._path("split.csv"), workers=0, chunk_size=1)
+        evaluate_file(source, self._path("pool.csv"), workers=2, chunk_size=2)
+        expected = self._read("whole.csv")
+        self.assertEqual(self._read("split.csv"), expected)
+        self.assertEqual(self._read("pool.csv"), expected)
+        self.assertEqual(expected.count("KeyError"), 5)   # O operador "*\n\nx" é desconhecido
+        self.assertTrue(expected.startswith('a,op,b,result,error\n"1\n2",+,2,,ValueError\n0,'))
+
+    def test_jsonl(self):
+        """Testa a entrada e a saída em JSONL."""
+        source = self._write("in.jsonl", '{"a": 9, "op": "sqrt"}\n{"a": 1, "op": "/", "b": 0}\n')
+        evaluate_file(source, self._path("out.jsonl"), workers=0)
+        self.assertEqual(self._read("out.jsonl"),
+                         '{"a": 9, "op": "sqrt", "result": 3.0}\n'
+                         '{"a": 1, "op": "/", "b": 0, "error": "DivisionByZeroError"}\n')
+
+    def test_non_finite_values(self):
+        """Verifica se operandos não finitos são recusados e a saída JSONL continua sendo JSON padrão."""
+        source = self._write("in.csv", "a,op,b\nnan,+,1\n1,*,inf\n1e308,*,10\n")
+        evaluate_file(source, self._path("out.csv"), workers=0)
+        self.assertEqual(self._read("out.csv"),
+                         "a,op,b,result,error\n"
+                         "nan,+,1,,ValueError\n"
+                         "1,*,inf,,ValueError\n"
+                         "1e308,*,10,inf,\n")
+        source = self._write("in.jsonl", '{"a": "inf", "op": "+", "b": 1}\n{"a": NaN, "op": "+", "b": 1}\n'
+                                         '{"a": 1e999, "op": "+", "b": 1}\n{"a": 1e308, "op": "*", "b": 10}\n')
+        evaluate_file(source, self._path("out.jsonl"), workers=0)
+        self.assertEqual(self._read("out.jsonl"),
+                         '{"a": "inf", "op": "+", "b": 1, "error": "ValueError"}\n'
+                         '{"line": "{\\"a\\": NaN, \\"op\\": \\"+\\", \\"b\\": 1}", "error": "ValueError"}\n'
+                         '{"line": "{\\"a\\": 1e999, \\"op\\": \\"+\\", \\"b\\": 1}", "error": "ValueError"}\n'
+                         '{"a": 1e+308, "op": "*", "b": 10, "result": "inf"}\n')
+
+    def test_process_pool_preserves_order(self):
+        """Verifica se o pool de processos produz a mesma saída, na ordem de entrada."""
+        rows = "".join(f"{i},*,2\n" for i in range(1000))
+        source = self._write("in.csv", rows)
+        evaluate_file(source, self._path("serial.csv"), workers=0, chunk_size=37)
+        chunks = evaluate_file(source, self._path("pool.csv"), workers=2, chunk_size=37)
+        self.assertEqual(self._read("pool.csv"), self._read("serial.csv"))
+        self.assertEqual(chunks, 27)  # 999 linhas em blocos de 37; a primeira (sem cabeçalho) é avaliada à parte
+
+if __name__ == "__main__":
+    unittest.main()
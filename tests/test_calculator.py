@@ -1,6 +1,6 @@
 import unittest
-from src.model.calculator import Calculator
-from src.model.exceptions import DivisionByZeroError, NegativeNumberSqrtError
+from model.calculator import Calculator
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError
 
 class TestCalculator(unittest.TestCase):
     """
@@ -0,0 +1,82 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from cli import main
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestCli(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o ponto de entrada sem interface gráfica.
+
+    Verifica os comandos da CLI e que os módulos do modelo, do controlador
+    e dos pontos de entrada não carregam o tkinter ao serem importados.
+    """
+
+    def run_cli(self, *args):
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = main(list(args))
+        return code, out.getvalue(), err.getvalue()
+
+    def test_expr(self):
+        """Testa o cálculo de uma expressão pela linha de comando."""
+        self.assertEqual(self.run_cli("expr", "12*(3+4)/sqrt(16)"), (0, "21.0\n", ""))
+
+    def test_expr_error(self):
+        """Verifica se um erro de cálculo sai pela saída de erro com código 1."""
+        code, out, err = self.run_cli("expr", "1/0")
+        self.assertEqual(code, 1)
+        self.assertEqual(out, "")
+        self.assertTrue(err)
+        self.assertEqual(self.run_cli("expr", "(" * 200 + "1" + ")" * 200),
+                         (1, "", "Expressão aninhada demais (máximo de 100 níveis).\n"))
+
+    def test_keys(self):
+        """Testa a reprodução de teclas e a recusa de teclas desconhecidas."""
+        self.assertEqual(self.run_cli("keys", "1 2 + 3 ="), (0, "15.0\n", ""))
+        code, out, err = self.run_cli("keys", "12 + 3 =")
+        self.assertEqual((code, out), (1, ""))
+        self.assertIn("Teclas desconhecidas: 12", err)
+        self.assertEqual(self.run_cli("keys", "1 / 0 = +"), (0, "Não é possível dividir por zero.\n", ""))
+
+    def test_stats_errors(self):
+        """Verifica se o comando stats aceita infinitos e recusa valores inválidos e arquivos inexistentes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "valores.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("1\n2\ninf\n")
+            code, out, _ = self.run_cli("stats", path)
+            self.assertEqual(code, 0)
+            self.assertIn("max: inf", out)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("1\ndois\n")
+            self.assertEqual(self.run_cli("stats", path), (1, "", "Valor inválido na linha 2: 'dois'\n"))
+            code, out, err = self.run_cli("stats", os.path.join(tmp, "inexistente.txt"))
+            self.assertEqual((code, out), (1, ""))
+            self.assertIn("Não foi possível abrir", err)
+
+    def test_unknown_command(self):
+        """Verifica se um comando desconhecido mostra o uso com código 2."""
+        code, _, err = self.run_cli("gui")
+        self.assertEqual(code, 2)
+        self.assertIn("Uso:", err)
+
+    def test_no_tkinter_import(self):
+        """Verifica se os módulos sem interface gráfica não importam o tkinter."""
+        modules = ("model.calculator", "model.expression", "controller.controller", "controller.headless",
+                   "controller.sessions", "main", "cli", "server", "batch_eval")
+        code = (f"import sys; sys.path.insert(0, 'src'); import {', '.join(modules)}; "
+                "print('tkinter' in sys.modules)")
+        completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(completed.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
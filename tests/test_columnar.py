@@ -0,0 +1,86 @@
+import math
+import os
+import tempfile
+import unittest
+from model.columnar import ColumnarFile, csv_to_columnar, columnar_to_csv, file_size
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError, NO_ERROR
+from model.opcodes import OPCODES
+
+class TestColumnarFile(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o formato binário colunar.
+
+    Verifica a criação, a avaliação escalar e vetorizada sobre o
+    arquivo mapeado e a conversão de e para CSV.
+    """
+
+    def setUp(self):
+        """Cria um diretório temporário e um CSV de exemplo antes de cada teste."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.csv_path = os.path.join(self.tmp.name, "in.csv")
+        self.path = os.path.join(self.tmp.name, "lote.calc")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("a,op,b\n1,+,2\n10,/,0\n-4,sqrt,\n16,sqrt,\n50,%,10\n7,*,3\n")
+
+    def test_csv_to_columnar(self):
+        """Testa a conversão do CSV e o tamanho do arquivo gerado."""
+        self.assertEqual(csv_to_columnar(self.csv_path, self.path), 6)
+        self.assertEqual(os.path.getsize(self.path), file_size(6))
+        with ColumnarFile(self.path) as batch:
+            self.assertEqual(list(batch.a), [1, 10, -4, 16, 50, 7])
+            self.assertEqual(batch.op[2], OPCODES['sqrt'])
+            self.assertTrue(math.isnan(batch.b[2]))
+            self.assertTrue(all(math.isnan(r) for r in batch.result))
+
+    def test_scalar_and_vectorized_evaluation_match(self):
+        """Verifica se as avaliações escalar e vetorizada gravam as mesmas colunas."""
+        csv_to_columnar(self.csv_path, self.path)
+        with ColumnarFile(self.path, writable=True) as batch:
+            batch.evaluate()
+            scalar = bytes(batch._views[0])
+            self.assertEqual(list(batch.error), [NO_ERROR, DivisionByZeroError.code, NegativeNumberSqrtError.code, 0, 0, 0])
+            self.assertEqual([r for r in batch.result if not math.isnan(r)], [3, 4, 5, 21])
+            batch.result[:] = memoryview(bytes(8 * len(batch))).cast("d")
+            batch.evaluate_vectorized()
+            self.assertEqual(bytes(batch._views[0]), scalar)
+
+    def test_round_trip_csv(self):
+        """Testa a conversão de volta para CSV, com resultados e erros."""
+        csv_to_columnar(self.csv_path, self.path)
+        with ColumnarFile(self.path, writable=True) as batch:
+            batch.evaluate()
+        out_csv = os.path.join(self.tmp.name, "out.csv")
+        columnar_to_csv(self.path, out_csv)
+        with open(out_csv, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "a,op,b,result,error")
+        self.assertEqual(lines[2], "10.0,/,0.0,,DivisionByZeroError")
+        self.assertEqual(lines[4], "16.0,sqrt,,4.0,")
+
+        copy = os.path.join(self.tmp.name, "copia.calc")
+        csv_to_columnar(out_csv, copy)
+        with open(self.path, "rb") as a, open(copy, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_unknown_opcode(self):
+        """Verifica se um opcode desconhecido é rejeitado nas avaliações escalar e vetorizada."""
+        csv_to_columnar(self.csv_path, self.path)
+        with ColumnarFile(self.path, writable=True) as batch:
+            batch.op[3] = 200
+            with self.assertRaisesRegex(ValueError, "Opcode desconhecido"):
+                batch.evaluate()
+            with self.assertRaisesRegex(ValueError, "Opcode desconhecido"):
+                batch.evaluate_vectorized()
+
+    def test_invalid_file(self):
+        """Verifica se um arquivo fora do formato é rejeitado."""
+        for content in (b"x" * 64, b"CAL"):      # Formato errado e arquivo menor que o cabeçalho
+            with open(self.path, "wb") as f:
+                f.write(content)
+            with self.subTest(size=len(content)):
+                with self.assertRaisesRegex(ValueError, "Arquivo colunar inválido"):
+                    ColumnarFile(self.path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
-from src.model.calculator import Calculator
-from src.controller.controller import Controller
+from model.calculator import Calculator
+from controller.controller import Controller
 
 class MockGui:
     """
@@ -0,0 +1,66 @@
+import unittest
+from model.expression import MAX_NESTING, ExpressionEngine, tokenize
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError, InvalidExpressionError
+
+class TestExpressionEngine(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o motor de expressões (ExpressionEngine).
+
+    Verifica a precedência, as regras de porcentagem do Controller,
+    o tratamento de erros e o cache de programas compilados.
+    """
+
+    def setUp(self):
+        """Configura um novo ExpressionEngine antes de cada teste."""
+        self.engine = ExpressionEngine(cache_size=4)
+
+    def test_precedence_and_functions(self):
+        """Testa precedência, parênteses, sqrt e sinal negativo."""
+        self.assertEqual(self.engine.evaluate("12*(3+4)/sqrt(16)"), 21)
+        self.assertEqual(self.engine.evaluate("2+3*4"), 14)
+        self.assertEqual(self.engine.evaluate("-(2+3) * 2"), -10)
+        self.assertEqual(self.engine.evaluate(".5 + 1."), 1.5)
+
+    def test_percent_rules(self):
+        """Testa as regras de porcentagem do Controller."""
+        self.assertEqual(self.engine.evaluate("50+10%"), 55)   # 10% de 50
+        self.assertEqual(self.engine.evaluate("50-10%"), 45)
+        self.assertEqual(self.engine.evaluate("50*10%"), 5)    # 10% como fração
+        self.assertEqual(self.engine.evaluate("200/10%"), 2000)
+        self.assertEqual(self.engine.evaluate("10%"), 10)      # Sem operador pendente
+
+    def test_errors(self):
+        """Verifica se os erros da Calculator e de sintaxe são levantados."""
+        with self.assertRaises(DivisionByZeroError):
+            self.engine.evaluate("1/(2-2)")
+        with self.assertRaises(NegativeNumberSqrtError):
+            self.engine.evaluate("sqrt(0-4)")
+        for expression in ("", "1+", "(1+2", "1+2)", "2 x 3"):
+            with self.assertRaises(InvalidExpressionError):
+                self.engine.evaluate(expression)
+
+    def test_nesting_limit(self):
+        """Verifica se o aninhamento excessivo levanta InvalidExpressionError em vez de RecursionError."""
+        self.assertEqual(self.engine.evaluate("(" * MAX_NESTING + "1" + ")" * MAX_NESTING), 1)
+        self.assertEqual(self.engine.evaluate("-" * MAX_NESTING + "1"), 1)
+        for expression in ("(" * 200 + "1" + ")" * 200, "-" * 1000 + "1", "sqrt " * 5000 + "1", "(" * 5000):
+            with self.subTest(length=len(expression)):
+                with self.assertRaisesRegex(InvalidExpressionError, "aninhada"):
+                    self.engine.evaluate(expression)
+
+    def test_cache_keyed_on_structure(self):
+        """Verifica se expressões com a mesma estrutura reutilizam o programa compilado."""
+        self.assertEqual(tokenize("2 + 3")[0], tokenize("10+7")[0])
+        self.assertEqual(self.engine.evaluate("2+3"), 5)
+        self.assertEqual(self.engine.evaluate("10+7"), 17)
+        info = self.engine.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_cache_is_bounded(self):
+        """Verifica se o cache respeita o tamanho máximo."""
+        for expression in ("1+1", "1-1", "1*1", "1/1", "sqrt(1)", "1%"):
+            self.engine.evaluate(expression)
+        self.assertEqual(self.engine.cache_info().currsize, 4)
+
+if __name__ == "__main__":
+    unittest.main()
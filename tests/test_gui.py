@@ -0,0 +1,100 @@
+import tkinter as tk
+import unittest
+from view.gui import DisplayStats, Gui, _DisplayVar
+
+
+class FakeWindow:
+    """
+    Substitui a janela do Tk: guarda as tarefas de `after_idle` até o próximo ciclo ocioso.
+    """
+    def __init__(self):
+        self.idle = {}
+        self.scheduled = 0
+        self.cancelled = 0
+
+    def after_idle(self, callback, *args):
+        self.scheduled += 1
+        self.idle[self.scheduled] = (callback, args)
+        return self.scheduled
+
+    def after_cancel(self, identifier):
+        self.cancelled += 1
+        self.idle.pop(identifier, None)
+
+    def run_idle(self):
+        """Executa as tarefas ociosas, como o mainloop, inclusive as agendadas por elas."""
+        while self.idle:
+            identifier = min(self.idle)
+            callback, args = self.idle.pop(identifier)
+            callback(*args)
+
+
+class TestDisplayCoalescing(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a coalescência das atualizações do display.
+
+    Verifica se uma rajada de atualizações produz um único redesenho, se a
+    leitura do display enxerga o texto pendente e se `flush_display` força o
+    redesenho, sem abrir uma janela (o interpretador Tcl dispensa o display).
+    """
+
+    def make_gui(self, coalesce=True):
+        """Cria a Gui só com o estado do display, sobre uma janela falsa."""
+        gui = Gui.__new__(Gui)
+        gui.window = FakeWindow()
+        gui.display_var = _DisplayVar(tk.Tcl(), value=0)
+        gui.coalesce = coalesce
+        gui.display_stats = DisplayStats()
+        gui._flush_id = None
+        gui._paint_id = None
+        gui._pending_since = 0.0
+        return gui
+
+    def painted(self, gui):
+        """Texto efetivamente aplicado à StringVar (o que o Label desenha)."""
+        return tk.StringVar.get(gui.display_var)
+
+    def test_burst_produces_one_redraw(self):
+        """Verifica se N atualizações em uma rajada resultam em um único redesenho."""
+        gui = self.make_gui()
+        for i in range(50):
+            gui.update_display(str(i))
+        self.assertEqual(gui.window.scheduled, 1)
+        self.assertEqual(self.painted(gui), "0")
+        self.assertEqual(gui.display_var.get(), "49")     # O controlador lê o texto pendente
+        gui.window.run_idle()
+        self.assertEqual(self.painted(gui), "49")
+        self.assertEqual((gui.display_stats.updates, gui.display_stats.redraws), (50, 1))
+        self.assertEqual(gui.display_stats.redraws_avoided, 49)
+        self.assertEqual(len(gui.display_stats.latencies), 1)
+
+    def test_flush_display(self):
+        """Verifica se `flush_display` desenha o texto pendente na hora e cancela o ciclo agendado."""
+        gui = self.make_gui()
+        for text in ("1", "12", "123"):
+            gui.update_display(text)
+        gui.flush_display()
+        self.assertEqual(self.painted(gui), "123")
+        self.assertEqual(gui.window.cancelled, 1)
+        self.assertIsNone(gui.display_var.pending)
+        gui.window.run_idle()
+        self.assertEqual(gui.display_stats.redraws, 1)
+        gui.flush_display()                                # Sem texto pendente: nada a fazer
+        self.assertEqual(gui.window.cancelled, 1)
+
+    def test_without_coalescing(self):
+        """Verifica se, sem coalescência, cada atualização redesenha e só uma medição é agendada por ciclo."""
+        gui = self.make_gui(coalesce=False)
+        for i in range(10):
+            gui.update_display(str(i))
+            self.assertEqual(self.painted(gui), str(i))
+        self.assertEqual(gui.window.scheduled, 1)
+        gui.window.run_idle()
+        gui.update_display("x")
+        self.assertEqual(gui.window.scheduled, 2)
+        self.assertEqual(gui.display_stats.redraws, 11)
+        self.assertEqual(len(gui.display_stats.latencies), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
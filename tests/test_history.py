@@ -0,0 +1,125 @@
+import math
+import os
+import tempfile
+import unittest
+from model.calculator import Calculator
+from model.backends import DecimalCalculator, FractionCalculator
+from model.exceptions import DivisionByZeroError, NO_ERROR
+from model.history import HistoryTape
+from model.columnar import ColumnarFile, columnar_to_csv
+from controller.headless import HeadlessController
+
+class TestHistoryTape(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o histórico de operações (HistoryTape).
+
+    Verifica o buffer circular, desfazer e refazer, a exportação para os
+    formatos colunar e CSV e o uso pelo controlador.
+    """
+
+    def test_ring_buffer_keeps_latest_entries(self):
+        """Verifica se o buffer circular guarda só as entradas mais recentes."""
+        tape = HistoryTape(capacity=3)
+        for i in range(5):
+            tape.record(i, '+', 1, i + 1)
+        self.assertEqual(len(tape), 3)
+        self.assertEqual(tape.dropped, 2)
+        self.assertEqual([tape[i][0] for i in range(3)], [2.0, 3.0, 4.0])
+        self.assertEqual(tape[-1], (4.0, '+', 1.0, 5.0, NO_ERROR))
+        self.assertEqual(len(tape.a), 3)  # A memória não passa da capacidade
+
+    def test_undo_redo(self):
+        """Testa desfazer e refazer e o descarte das entradas refazíveis."""
+        tape = HistoryTape(capacity=4)
+        self.assertIsNone(tape.undo())
+        tape.record(2, '+', 3, 5)
+        tape.record(5, 'sqrt', None, math.sqrt(5))
+        self.assertEqual(tape.undo()[1], 'sqrt')
+        self.assertEqual(tape.undo()[1], '+')
+        self.assertFalse(tape.can_undo)
+        self.assertEqual(tape.redo()[3], 5.0)
+        self.assertTrue(tape.can_redo)
+        tape.record(5, '*', 2, 10)          # Nova operação descarta o que podia ser refeito
+        self.assertFalse(tape.can_redo)
+        self.assertIsNone(tape.redo())
+        self.assertEqual([tape[i][1] for i in range(len(tape))], ['+', '*'])
+        tape.undo()
+        self.assertEqual(tape[-1], tape[len(tape) - 1])
+        with self.assertRaises(IndexError):     # A entrada desfeita só volta por redo
+            tape[len(tape)]
+        self.assertEqual(tape.redo()[1], '*')
+
+    def test_undo_and_record_across_wraparound(self):
+        """Verifica se desfazer e registrar funcionam depois de o buffer dar a volta."""
+        tape = HistoryTape(capacity=3)
+        for i in range(4):
+            tape.record(i, '-', 1, i - 1)
+        tape.undo()
+        tape.record(10, '/', 0, 0, DivisionByZeroError.code)
+        self.assertEqual([tape[i][0] for i in range(len(tape))], [1.0, 2.0, 10.0])
+        entry = tape[-1]
+        self.assertTrue(math.isnan(entry[3]))
+        self.assertEqual(entry[4], DivisionByZeroError.code)
+
+    def test_exports(self):
+        """Verifica se as exportações colunar e CSV contêm só as entradas ativas, em ordem."""
+        tape = HistoryTape(capacity=4)
+        for i in range(6):
+            tape.record(i, '*', 2, i * 2)
+        tape.record(9, 'sqrt', None, 3)
+        with tempfile.TemporaryDirectory() as tmp:
+            path, csv_path = os.path.join(tmp, "historico.calc"), os.path.join(tmp, "historico.csv")
+            self.assertEqual(tape.to_columnar(path), 4)
+            with ColumnarFile(path) as batch:
+                self.assertEqual(list(batch.a), [3.0, 4.0, 5.0, 9.0])
+                self.assertEqual(list(batch.result), [6.0, 8.0, 10.0, 3.0])
+            tape.to_csv(csv_path)
+            columnar_to_csv(path, os.path.join(tmp, "via_colunar.csv"))
+            with open(csv_path, encoding="utf-8") as f, \
+                    open(os.path.join(tmp, "via_colunar.csv"), encoding="utf-8") as g:
+                self.assertEqual(f.read(), g.read())
+
+    def test_controller_undo_redo(self):
+        """Testa desfazer e refazer pelo controlador, continuando a partir do valor restaurado."""
+        controller = HeadlessController(Calculator())
+        history = controller.enable_history()
+        for key in "2 + 3 * 4 = C".split():
+            controller.process_input(key)
+        self.assertEqual(len(history), 2)   # (2 + 3) e (5 * 4); limpar não apaga o histórico
+        self.assertTrue(controller.undo())
+        self.assertEqual(controller.display_text, "5.0")
+        self.assertTrue(controller.undo())
+        self.assertEqual(controller.display_text, "2.0")
+        self.assertFalse(controller.undo())
+        self.assertTrue(controller.redo())
+        self.assertEqual(controller.display_text, "5.0")
+        for key in "+ 1 =".split():         # Continua a partir do valor restaurado
+            controller.process_input(key)
+        self.assertEqual(controller.display_text, "6.0")
+        self.assertFalse(controller.redo())
+
+    def test_controller_records_errors(self):
+        """Verifica se as operações com erro são registradas e refeitas com a mensagem."""
+        controller = HeadlessController(Calculator())
+        history = controller.enable_history()
+        for key in "1 / 0 =".split():
+            controller.process_input(key)
+        self.assertEqual(history[-1][4], DivisionByZeroError.code)
+        controller.undo()
+        self.assertEqual(controller.display_text, "1.0")
+        controller.redo()
+        self.assertEqual(controller.display_text, "Não é possível dividir por zero.")
+        self.assertFalse(HeadlessController(Calculator()).undo())  # Histórico desligado
+
+    def test_exact_backends_rejected(self):
+        """Verifica se o histórico em float64 é recusado pelos tipos numéricos exatos."""
+        for calculator in (DecimalCalculator(precision=40), FractionCalculator()):
+            controller = HeadlessController(calculator)
+            with self.subTest(backend=calculator.backend):
+                with self.assertRaisesRegex(ValueError, "float"):
+                    controller.enable_history()
+                self.assertIsNone(controller.history)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import math
+import random
+import unittest
+from itertools import takewhile
+import numpy as np
+from model.calculator import Calculator
+from model.backends import DecimalCalculator
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError
+from controller.headless import HeadlessController
+from controller.macro import Macro
+
+ERROR_MESSAGES = ("Não é possível dividir por zero.", "Não é possível calcular a raiz quadrada de um número negativo.")
+
+
+def run_controller(x_text, tail):
+    """Digita o operando e a sequência no controlador; retorna o valor final ou None se ele terminar em erro."""
+    controller = HeadlessController(Calculator())
+    for key in list(x_text) + tail:
+        try:
+            controller.process_input(key)
+        except ValueError:
+            pass  # Operador sobre a mensagem de erro: ignorado, como na GUI
+    if controller.display_text in ERROR_MESSAGES:
+        return None
+    return controller._display_value()
+
+
+class TestMacro(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a gravação e compilação de macros.
+
+    Verifica que a macro compilada reproduz exatamente o controlador,
+    inclusive operadores encadeados e `%`, no caminho escalar e no vetorizado.
+    """
+
+    def record(self, keys):
+        controller = HeadlessController(Calculator())
+        controller.start_recording()
+        for key in keys.split():
+            controller.process_input(key)
+        return controller, controller.stop_recording()
+
+    def test_recording_matches_controller(self):
+        """Verifica se a macro gravada dá o mesmo resultado que as teclas digitadas."""
+        controller, macro = self.record("1 0 0 * 1 . 0 7 - 3 0 % =")
+        self.assertEqual(macro.keys, "1 0 0 * 1 . 0 7 - 3 0 % =".split())
+        self.assertEqual(macro(100), controller.calculator.current_value)
+        self.assertEqual(macro(250.0), run_controller("250", "* 1 . 0 7 - 3 0 % =".split()))
+        with self.assertRaises(RuntimeError):
+            controller.stop_recording()
+
+    def test_percent_and_chaining_rules(self):
+        """Verifica se a macro segue as regras de porcentagem e de encadeamento do controlador."""
+        cases = {
+            "5 0 + 1 0 % =": 55.0,        # 10% de 50
+            "5 0 - 1 0 % =": 45.0,
+            "5 0 * 1 0 % =": 5.0,         # 10% como fração
+            "2 0 0 / 1 0 % =": 2000.0,
+            "1 0 %": 10.0,                # Sem operador pendente
+            "2 + 3 * 4 =": 20.0,          # Encadeado, da esquerda para a direita
+            "1 6 sqrt + 1 =": 5.0,
+            "3 + =": 6.0,
+            "7 C 2 + 1 =": 3.0,           # Após limpar, o operando não é usado
+        }
+        for keys, expected in cases.items():
+            with self.subTest(keys=keys):
+                operand = "".join(takewhile(lambda key: key.isdigit() or key == '.', keys.split()))
+                self.assertEqual(Macro(keys.split())(float(operand)), expected)
+
+    def test_operand_from_display(self):
+        """Verifica se uma macro que começa com operador usa o valor do display como operando."""
+        macro = Macro("* 2 + 1 =".split())
+        self.assertEqual(macro(10), 21.0)
+
+    def test_errors(self):
+        """Verifica se os erros de cálculo da macro lançam a exceção no escalar e viram códigos no array."""
+        macro = Macro("1 / 0 =".split())
+        with self.assertRaises(DivisionByZeroError):
+            macro(5)
+        macro = Macro("4 - 1 0 = sqrt".split())
+        self.assertEqual(macro(19), 3.0)
+        with self.assertRaises(NegativeNumberSqrtError):
+            macro(4)
+        values, errors = macro.apply(np.array([19.0, 4.0, 10.0]))
+        self.assertEqual(errors.tolist(), [0, NegativeNumberSqrtError.code, 0])
+        self.assertEqual(values[0], 3.0)
+        self.assertTrue(math.isnan(values[1]))
+        with self.assertRaises(ValueError):
+            Macro("1 + . =".split())
+
+    def test_recovery_after_error(self):
+        """Verifica se a macro segue o controlador quando a conta recomeça depois de um erro."""
+        macro = Macro("9 - 4 = sqrt + 1 = C 5 * 2 =".split())
+        self.assertEqual(macro(1), 10.0)                   # sqrt(-3) falha no meio; "C 5 * 2 =" recomeça
+        self.assertEqual(macro(1), run_controller("1", macro.keys[1:]))
+        values, errors = macro.apply(np.array([4.0, 1.0, 13.0]))
+        self.assertEqual(errors.tolist(), [0, 0, 0])
+        self.assertEqual(values.tolist(), [10.0, 10.0, 10.0])
+        macro = Macro("9 / 0 = +".split())                 # Nada recomeça a conta: o erro é o resultado
+        with self.assertRaises(DivisionByZeroError):
+            macro(9)
+
+    def test_float_backend_only(self):
+        """Verifica se a gravação é recusada quando a calculadora não usa float."""
+        controller = HeadlessController(DecimalCalculator())
+        with self.assertRaises(ValueError):
+            controller.start_recording()
+
+    def test_random_sequences_scalar_and_array(self):
+        """Compara macros aleatórias, escalares e vetorizadas, com a reprodução das teclas."""
+        rng = random.Random(7)
+        operators = ['+', '-', '*', '/', '%', 'sqrt', '=']
+        xs = ["0", "3", "12.5", "250", "0.07", "1000"]
+        for _ in range(300):
+            tail = []
+            for _ in range(rng.randint(1, 8)):
+                tail.append(rng.choice(operators))
+                if rng.random() < 0.8:
+                    tail.extend(str(rng.choice([0, 1, 2, 7, 10, 1.5, 100])))
+            try:
+                macro = Macro(list("9") + tail)
+            except ValueError:
+                continue  # Sequências que anexam dígitos ao operando não viram macro
+            values, errors = macro.apply(np.array([float(x) for x in xs]))
+            for i, x in enumerate(xs):
+                expected = run_controller(x, tail)
+                with self.subTest(keys=" ".join(tail), x=x):
+                    if expected is None:
+                        self.assertNotEqual(errors[i], 0)
+                        with self.assertRaises((DivisionByZeroError, NegativeNumberSqrtError)):
+                            macro(float(x))
+                    else:
+                        self.assertEqual(macro(float(x)), expected)
+                        self.assertEqual(errors[i], 0)
+                        self.assertEqual(values[i], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
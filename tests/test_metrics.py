@@ -0,0 +1,80 @@
+import json
+import unittest
+from model.calculator import Calculator
+from controller.headless import HeadlessController
+from controller.metrics import PeriodicExporter
+
+class TestMetrics(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a instrumentação do controlador.
+
+    Verifica contadores, erros por tipo de exceção, histogramas e
+    as exportações em JSON e no formato do Prometheus.
+    """
+
+    def setUp(self):
+        """Configura um controlador sem GUI com métricas ligadas antes de cada teste."""
+        self.controller = HeadlessController(Calculator())
+        self.metrics = self.controller.enable_metrics()
+
+    def _press(self, keys):
+        for key in keys.split():
+            try:
+                self.controller.process_input(key)
+            except ValueError:
+                pass
+
+    def test_counts_by_token_and_operator(self):
+        """Testa a contagem de chamadas por tipo de tecla e por operador."""
+        self._press("1 2 + 3 = 4 * 2 =")
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["input"]["number"]["calls"], 5)
+        self.assertEqual(snapshot["input"]["="]["calls"], 2)
+        self.assertEqual(snapshot["operation"]["+"]["calls"], 1)
+        self.assertEqual(snapshot["operation"]["*"]["calls"], 1)
+        self.assertEqual(sum(snapshot["operation"]["*"]["latency_buckets"]), 1)
+
+    def test_unary_and_percent_operations(self):
+        """Verifica se as operações de um operando e a porcentagem também são medidas por operador."""
+        self._press("1 6 sqrt 5 ! 0 ln 5 0 + 1 0 % = 2 * 5 0 %")
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["operation"]["sqrt"]["calls"], 1)
+        self.assertEqual(snapshot["operation"]["!"]["calls"], 1)
+        self.assertEqual(snapshot["operation"]["ln"]["errors"], {"DomainError": 1})
+        self.assertEqual(snapshot["operation"]["%"]["calls"], 2)     # Após + e após *
+        self.assertEqual(sum(snapshot["operation"]["sqrt"]["latency_buckets"]), 1)
+
+    def test_errors_by_exception_type(self):
+        """Testa a contagem de erros por tipo de exceção."""
+        self._press("8 / 0 = +")   # Divisão por zero e depois operador sobre a mensagem de erro
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["input"]["="]["errors"], {"DivisionByZeroError": 1})
+        self.assertEqual(snapshot["operation"]["/"]["errors"], {"DivisionByZeroError": 1})
+        self.assertEqual(snapshot["input"]["+"]["errors"], {"ValueError": 1})
+
+    def test_exports(self):
+        """Testa as exportações em JSON e no formato do Prometheus."""
+        self._press("9 sqrt 1 / 0 =")
+        self.assertIn("input", json.loads(self.metrics.to_json()))
+        text = self.metrics.to_prometheus()
+        self.assertIn('calculator_input_latency_seconds_count{token="sqrt"} 1', text)
+        self.assertIn('calculator_operation_errors_total{operator="/",exception="DivisionByZeroError"} 1', text)
+        self.assertIn('calculator_operation_latency_seconds_bucket{operator="/",le="+Inf"} 1', text)
+
+    def test_periodic_exporter(self):
+        """Testa a exportação periódica, com uma última exportação ao parar."""
+        exported = []
+        exporter = PeriodicExporter(self.metrics, 60, exported.append, fmt="json")
+        exporter.start()
+        self._press("1 + 1 =")
+        exporter.stop()
+        self.assertEqual(json.loads(exported[-1])["operation"]["+"]["calls"], 1)
+
+    def test_disabled(self):
+        """Verifica se nada é registrado com a instrumentação desligada."""
+        self.controller.disable_metrics()
+        self._press("1 + 1 =")
+        self.assertEqual(self.metrics.snapshot()["input"], {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import math
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from model.operations import OPERATIONS, DISPATCH, apply
+from model.calculator import Calculator
+from model.backends import DecimalCalculator, FractionCalculator
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError
+from model.opcodes import OPCODES, OPERATORS
+
+class TestOperations(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o núcleo sem estado das operações.
+
+    Verifica as funções puras, as tabelas de despacho, o `apply` da Calculator
+    (que não altera o valor atual) e o uso de uma mesma instância por várias threads.
+    """
+
+    def test_apply(self):
+        """Testa as operações puras e a exceção da divisão por zero."""
+        self.assertEqual(apply('+', 2, 3), 5)
+        self.assertEqual(apply('-', 2, 3), -1)
+        self.assertEqual(apply('*', 2, 3), 6)
+        self.assertEqual(apply('/', 3, 2), 1.5)
+        self.assertEqual(apply('sqrt', 16), 4)
+        self.assertEqual(apply('%', 10, 50), 5)
+        with self.assertRaises(DivisionByZeroError):
+            apply('/', 1, 0)
+        with self.assertRaises(NegativeNumberSqrtError):
+            apply('sqrt', -1)
+        with self.assertRaises(ValueError):
+            apply('**', 1, 2)
+
+    def test_dispatch_tables_follow_opcodes(self):
+        """Verifica se as tabelas de despacho seguem a ordem dos opcodes."""
+        for operator in OPERATORS:
+            self.assertIs(OPERATIONS[OPCODES[operator]], DISPATCH[operator])
+
+    def test_calculator_methods_match_apply(self):
+        """Verifica se os métodos da Calculator coincidem com as funções puras."""
+        calc = Calculator()
+        calc.current_value = 50.0
+        self.assertEqual(calc.percent(10), apply('%', 50.0, 10))
+        calc.current_value = 7.0
+        self.assertEqual(calc.divide(3), apply('/', 7.0, 3))
+
+    def test_apply_does_not_touch_state(self):
+        """Verifica se apply não altera o valor atual da calculadora, em nenhum tipo numérico."""
+        for calc in (Calculator(), DecimalCalculator(precision=5), FractionCalculator()):
+            with self.subTest(backend=calc.backend):
+                calc.current_value = calc.parse("8")
+                result = calc.apply('/', calc.parse("1"), calc.parse("3"))
+                self.assertEqual(calc.current_value, calc.parse("8"))
+                self.assertEqual(calc.format(result), {"float": "0.3333333333333333", "decimal": "0.33333",
+                                                       "fraction": "1/3"}[calc.backend])
+        self.assertEqual(DecimalCalculator().apply('sqrt', Decimal(2), None), Decimal(2).sqrt())
+        self.assertEqual(FractionCalculator().apply('sqrt', Fraction(9, 4)), Fraction(3, 2))
+
+    def test_shared_instance_across_threads(self):
+        """Verifica se uma calculadora compartilhada entre threads calcula sem interferência."""
+        calc = Calculator()
+        calc.current_value = 123.0
+
+        def work(seed):
+            results = []
+            for i in range(2000):
+                a, b = float(seed * 1000 + i), float(i % 7)
+                try:
+                    results.append(calc.apply('/', a, b) == a / b)
+                except DivisionByZeroError:
+                    results.append(b == 0)
+                results.append(calc.apply('sqrt', a) == math.sqrt(a))
+            return all(results)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertTrue(all(pool.map(work, range(16))))
+        self.assertEqual(calc.current_value, 123.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from model.batch import evaluate, evaluate_opcodes
+from model.parallel import SharedBatch, evaluate_parallel
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError, NO_ERROR
+from model.opcodes import OPCODES, OPERATORS
+
+class TestParallel(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a avaliação paralela em memória compartilhada.
+
+    Verifica se os processos de trabalho gravam, nas colunas compartilhadas,
+    os mesmos resultados e códigos de erro da avaliação vetorizada em um processo.
+    """
+
+    def setUp(self):
+        """Prepara operandos com zeros e negativos, para que haja erros."""
+        rng = np.random.default_rng(3)
+        self.a = rng.uniform(-100, 100, 10_001)
+        self.b = rng.choice([0.0, 2.5, -4.0, 10.0], 10_001)
+
+    def test_matches_vectorized(self):
+        """Verifica se a avaliação em processos coincide com a vetorizada."""
+        for operator in OPERATORS:
+            with self.subTest(operator=operator):
+                expected, expected_errors = evaluate(operator, self.a, self.b)
+                values, errors = evaluate_parallel(operator, self.a, self.b, workers=3)
+                np.testing.assert_array_equal(values, expected)
+                np.testing.assert_array_equal(errors, expected_errors)
+
+    def test_error_codes(self):
+        """Verifica se os erros de cada linha viram NaN e o código da exceção."""
+        _, errors = evaluate_parallel('/', [1.0, 2.0, 3.0], [1.0, 0.0, 2.0], workers=2)
+        self.assertEqual(errors.tolist(), [NO_ERROR, DivisionByZeroError.code, NO_ERROR])
+        values, errors = evaluate_parallel('sqrt', [4.0, -1.0], workers=2)
+        self.assertEqual(errors.tolist(), [NO_ERROR, NegativeNumberSqrtError.code])
+        self.assertEqual(values[0], 2.0)
+        self.assertTrue(np.isnan(values[1]))
+
+    def test_mixed_operators_with_shared_pool(self):
+        """Testa um lote com operadores misturados avaliado em um pool compartilhado."""
+        opcodes = np.arange(len(self.a), dtype=np.uint8) % len(OPERATORS)
+        with ProcessPoolExecutor(max_workers=2) as pool, SharedBatch.create(len(self.a)) as batch:
+            batch.a[:], batch.b[:], batch.op[:] = self.a, self.b, opcodes
+            batch.evaluate(workers=4, executor=pool)
+            for operator in OPERATORS:
+                rows = opcodes == OPCODES[operator]
+                expected, expected_errors = evaluate(operator, self.a[rows], self.b[rows])
+                np.testing.assert_array_equal(batch.result[rows], expected)
+                np.testing.assert_array_equal(batch.error[rows], expected_errors)
+            del rows
+
+    def test_in_process_and_empty(self):
+        """Testa a avaliação no próprio processo, o lote vazio e o operador desconhecido."""
+        values, errors = evaluate_parallel('+', self.a, 1.0, workers=0)
+        np.testing.assert_array_equal(values, self.a + 1.0)
+        values, errors = evaluate_parallel('*', [], [], workers=2)
+        self.assertEqual(len(values), 0)
+        with self.assertRaises(ValueError):
+            evaluate_parallel('**', self.a, self.b)
+
+    def test_unknown_opcodes(self):
+        """Verifica se linhas com opcodes desconhecidos são rejeitadas em vez de virar NaN sem erro."""
+        opcodes = np.zeros(len(self.a), dtype=np.uint8)
+        opcodes[7] = len(OPERATORS)
+        out, errors = np.zeros_like(self.a), np.zeros(len(self.a), dtype=np.uint8)
+        with self.assertRaisesRegex(ValueError, "linha 7"):
+            evaluate_opcodes(self.a, self.b, opcodes, out, errors)
+        self.assertFalse(out.any())                  # Nenhuma linha avaliada
+        with SharedBatch.create(len(self.a)) as batch:
+            batch.a[:], batch.b[:], batch.op[:] = self.a, self.b, opcodes
+            with self.assertRaises(ValueError):
+                batch.evaluate(workers=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+from model.calculator import Calculator
+from controller.controller import Controller
+from controller.headless import HeadlessController, HeadlessDisplay, KEYS, unknown_keys
+from controller.replay import replay
+
+class StatefulGui:
+    """
+    Mock da GUI que guarda o texto do display, como o StringVar do Tk.
+    """
+    def __init__(self):
+        self.text = "0"
+        self.display_var = self
+
+    def get(self):
+        return self.text
+
+    def update_display(self, text):
+        self.text = text
+
+
+class TestHeadlessController(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o HeadlessController e a reprodução de teclas.
+
+    Verifica se o caminho sem GUI produz exatamente os mesmos
+    displays e valores que o caminho dirigido pela GUI.
+    """
+
+    def _run_both(self, tokens):
+        """Processa as teclas nos dois caminhos e compara o display após cada uma."""
+        gui = StatefulGui()
+        gui_controller = Controller(Calculator())
+        gui_controller.set_gui(gui)
+        headless = HeadlessController(Calculator(), HeadlessDisplay())
+
+        for token in tokens:
+            outcomes = []
+            for controller in (gui_controller, headless):
+                try:
+                    controller.process_input(token)
+                    outcomes.append(None)
+                except ValueError:
+                    outcomes.append(ValueError)
+            self.assertEqual(outcomes[0], outcomes[1], token)
+            self.assertEqual(gui.text, headless.display_text, tokens)
+            self.assertEqual(headless.gui.text, headless.display_text)
+        self.assertEqual(gui_controller.calculator.current_value, headless.calculator.current_value)
+
+    def test_basic_sequences(self):
+        """Testa sequências com números decimais, porcentagem, raiz e erros."""
+        self._run_both("1 2 . 5 + 7 . 2 5 =".split())
+        self._run_both("0 0 . 1 + . 2 =".split())
+        self._run_both("5 0 + 1 0 % = sqrt".split())
+        self._run_both("9 / 0 = 3 + 4 = C 8 - sqrt".split())
+        self._run_both("2 * 3 - 4 / 5 = . . 1 % C . =".split())
+
+    def test_random_streams_match_gui(self):
+        """Compara os dois caminhos em sequências aleatórias de teclas."""
+        rng = random.Random(7)
+        for _ in range(200):
+            self._run_both([rng.choice(KEYS) for _ in range(30)])
+
+    def test_replay_report(self):
+        """Testa o relatório da reprodução de teclas."""
+        report = replay(iter("1 2 * 3 = / 0 = +".split()))
+        self.assertEqual(report.keystrokes, 9)
+        self.assertEqual(report.ignored, 1)  # "+" sobre a mensagem de erro
+        self.assertEqual(report.display, "Não é possível dividir por zero.")
+        self.assertGreater(report.keystrokes_per_second, 0)
+
+    def test_invalid_tokens(self):
+        """Verifica se tokens que não são teclas são apontados e não viram dígitos no controlador."""
+        self.assertEqual(unknown_keys(["1", "12", "+", "٣", "="]), ["12", "٣"])
+        self._run_both(["4", "12", "٣", "+", "1", "="])
+        headless = HeadlessController(Calculator())
+        for token in ("٣", "12", "7"):
+            headless.process_input(token)
+        self.assertEqual(headless.display_text, "7")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import json
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+from model.result_cache import ResultCache, expression_key, operation_key
+from model.backends import DecimalCalculator
+from model.exceptions import DivisionByZeroError
+from batch_eval import evaluate_file
+from server import CalculatorService
+
+class TestResultCache(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o cache persistente de resultados.
+
+    Verifica a normalização das chaves, os acertos e falhas, a gravação em
+    lote, o compartilhamento do arquivo entre instâncias (como entre
+    processos), a remoção LRU e o uso pelo modo em lote e pelo serviço.
+    """
+
+    def setUp(self):
+        """Cria um diretório temporário para o arquivo do cache."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "cache.db")
+
+    def open(self, **kwargs):
+        cache = ResultCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_keys_are_normalized(self):
+        """Verifica se as chaves ignoram espaços e a grafia dos números, mas não a ordem."""
+        self.assertEqual(expression_key("2+3"), expression_key(" 2 + 3.0 "))
+        self.assertEqual(expression_key("2+3"), expression_key("2.+3"))
+        self.assertNotEqual(expression_key("2+3"), expression_key("3+2"))
+        self.assertEqual(operation_key('+', 2, 3.0), operation_key('+', 2.0, 3.0))
+        self.assertNotEqual(operation_key('sqrt', 4.0), operation_key('+', 4.0, 0.0))
+
+    def test_exact_backend_keys_are_normalized(self):
+        """Verifica se operandos Decimal e Fraction de mesmo valor têm a mesma chave, sem arredondamento."""
+        decimals = DecimalCalculator(precision=40)
+        self.assertEqual(operation_key('+', decimals.parse("2"), decimals.parse("3")),
+                         operation_key('+', decimals.parse("2.0"), decimals.parse("3.000")))
+        self.assertEqual(operation_key('*', decimals.parse("200"), decimals.parse("0")),
+                         operation_key('*', decimals.parse("2E+2"), decimals.parse("0.00")))
+        long_value = "1." + "0" * 37 + "1"                       # 39 dígitos, mais que o contexto padrão
+        self.assertNotEqual(operation_key('sqrt', decimals.parse(long_value)), operation_key('sqrt', decimals.parse("1")))
+        self.assertEqual(operation_key('+', Fraction("2.0"), Fraction(1, 2)), operation_key('+', Fraction(2), Fraction("0.5")))
+
+        cache = self.open(calculator=decimals)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return decimals.apply('sqrt', decimals.parse("2"))
+        for text in ("2", "2.0", "2.00"):
+            cache.get_or_compute(operation_key('sqrt', decimals.parse(text)), compute)
+        self.assertEqual(len(calls), 1)
+
+    def test_hits_misses_and_errors(self):
+        """Testa acertos, faltas e o armazenamento dos erros de cálculo no cache."""
+        cache = self.open()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 5.0
+        self.assertEqual(cache.get_or_compute(expression_key("2+3"), compute), 5.0)
+        self.assertEqual(cache.get_or_compute(expression_key("2 + 3"), compute), 5.0)
+        self.assertEqual(len(calls), 1)
+
+        def divide():
+            raise DivisionByZeroError("Não é possível dividir por zero.")
+        for _ in range(2):
+            with self.assertRaises(DivisionByZeroError):
+                cache.get_or_compute(operation_key('/', 1.0, 0.0), divide)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_writes_are_batched_and_shared(self):
+        """Verifica se as escritas são feitas em lote e vistas por outra conexão."""
+        writer = self.open(batch_size=3)
+        reader = self.open()
+        writer.put("a", 1.0)
+        writer.put("b", 2.0)
+        self.assertIsNone(reader.get("a"))          # Ainda no buffer do outro "processo"
+        writer.put("c", 3.0)                        # Completa o lote
+        self.assertEqual(reader.get("a"), 1.0)
+        self.assertEqual(writer.stats()["writes"], 3)
+        writer.put("d", 4.0)
+        writer.close()
+        self.assertEqual(self.open().get("d"), 4.0)  # Persistido entre execuções
+
+    def test_lru_eviction(self):
+        """Verifica se o cache descarta a entrada usada há mais tempo ao passar do limite."""
+        cache = self.open(max_entries=3, batch_size=1)
+        for key in "abc":
+            cache.put(key, 1.0)
+        cache.get("a")                              # "a" passa a ser a mais recente
+        cache.put("d", 1.0)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        other = self.open()                         # Outro processo só vê o arquivo
+        self.assertIsNone(other.get("b"))
+        self.assertEqual(other.get("a"), 1.0)
+
+    def test_backends_do_not_share_entries(self):
+        """Verifica se tipos numéricos diferentes não compartilham entradas."""
+        float_cache = self.open(batch_size=1)
+        decimal_cache = self.open(calculator=DecimalCalculator(precision=5), batch_size=1)
+        float_cache.put(expression_key("1/3"), 1 / 3)
+        self.assertIsNone(decimal_cache.get(expression_key("1/3")))
+        decimal_cache.put(expression_key("1/3"), decimal_cache._parse("0.33333"))
+        self.assertEqual(str(decimal_cache.get(expression_key("1/3"))), "0.33333")
+        self.assertEqual(float_cache.get(expression_key("1/3")), 1 / 3)
+
+    def test_batch_eval_and_service(self):
+        """Verifica se o avaliador em lote reaproveita os resultados do cache."""
+        source = os.path.join(self.tmp.name, "in.csv")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("a,op,b\n1,+,2\n10,/,0\n1,+,2\n")
+        for name in ("first.csv", "second.csv"):
+            evaluate_file(source, os.path.join(self.tmp.name, name), workers=0, cache_path=self.path)
+        with open(os.path.join(self.tmp.name, "second.csv"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a,op,b,result,error\n1,+,2,3.0,\n10,/,0,,DivisionByZeroError\n1,+,2,3.0,\n")
+        cache = self.open()
+        self.assertEqual(cache.get(operation_key('+', 1.0, 2.0)), 3.0)
+
+        service = CalculatorService(result_cache=cache)
+        session = service.sessions.open()
+        for _ in range(2):
+            response = json.loads(service.handle_line(session, b"12*(3+4)/sqrt(16)"))
+            self.assertEqual(response["result"], 21)
+        response = json.loads(service.handle_line(session, b'{"op": "/", "a": 1, "b": 0}'))
+        self.assertEqual(response["error"], "DivisionByZeroError")
+        self.assertEqual(cache.stats()["hits"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import math
+import unittest
+from fractions import Fraction
+import numpy as np
+from model.calculator import Calculator
+from model.backends import DecimalCalculator, FractionCalculator
+from model.batch import BatchCalculator, evaluate, evaluate_opcodes
+from model.exceptions import DivisionByZeroError, DomainError, ResultOverflowError, OPERATION_ERRORS
+from model.opcodes import OPERATORS, OPCODES, UNARY_OPERATORS
+from model.operations import apply
+from controller.headless import HeadlessController
+from controller.macro import Macro
+
+SCIENTIFIC = OPERATORS[OPCODES['^']:]
+
+# Valores que cobrem os limites dos domínios: zeros, negativos, inteiros, frações, extremos e infinitos
+SPECIAL = [0.0, -0.0, 1.0, -1.0, 2.0, -2.0, 3.0, -3.0, 27.0, -27.0, 0.5, -0.5, 1 / 3, 16.0, 170.0,
+           171.0, -170.5, 171.7, 710.0, -710.0, 1e300, -1e300, 1e-300, math.inf, -math.inf]
+
+
+def scalar(operator, a, b):
+    """Resultado e código de erro do caminho escalar (NaN e o código, em caso de erro)."""
+    try:
+        return apply(operator, a, None if operator in UNARY_OPERATORS else b), 0
+    except OPERATION_ERRORS as e:
+        return math.nan, e.code
+
+
+class TestScientific(unittest.TestCase):
+    """
+    Conjunto de testes unitários para as operações científicas.
+
+    Verifica os resultados e os erros de domínio no caminho escalar, a
+    equivalência do caminho vetorizado, os tipos numéricos, o controlador
+    (teclas da GUI) e as macros.
+    """
+
+    def test_scalar_results(self):
+        """Testa os resultados das operações científicas no caminho escalar."""
+        calc = Calculator()
+        calc.current_value = 2.0
+        self.assertEqual(calc.power(10), 1024.0)
+        self.assertEqual(calc.root(10), 2.0)                    # Raiz exata de 1024
+        self.assertEqual(calc.factorial(), 2.0)
+        self.assertEqual(apply('root', 27.0, 3.0), 3.0)        # Sem o erro de 27 ** (1 / 3)
+        self.assertEqual(apply('root', -8.0, 3.0), -2.0)
+        self.assertEqual(apply('log', 1000.0), 3.0)
+        self.assertEqual(apply('ln', 1.0), 0.0)
+        self.assertEqual(apply('exp', 0.0), 1.0)
+        self.assertAlmostEqual(apply('sin', math.pi / 2), 1.0)
+        self.assertAlmostEqual(apply('cos', math.pi), -1.0)
+        self.assertAlmostEqual(apply('tan', math.pi / 4), 1.0)
+        self.assertEqual(apply('!', 20.0), 2432902008176640000.0)
+        self.assertEqual(apply('!', 170.0), float(math.factorial(170)))
+        self.assertAlmostEqual(apply('!', 0.5), math.sqrt(math.pi) / 2)  # gamma(1.5)
+
+    def test_domain_errors(self):
+        """Verifica se os valores fora do domínio lançam a exceção correta."""
+        cases = [
+            ('^', 0.0, -1.0, DivisionByZeroError), ('^', -2.0, 0.5, DomainError),
+            ('^', 10.0, 400.0, ResultOverflowError),
+            ('root', 4.0, 0.0, DivisionByZeroError), ('root', -4.0, 2.0, DomainError),
+            ('log', 0.0, None, DomainError), ('ln', -1.0, None, DomainError),
+            ('exp', 1000.0, None, ResultOverflowError), ('sin', math.inf, None, DomainError),
+            ('!', -3.0, None, DomainError), ('!', 171.0, None, ResultOverflowError),
+        ]
+        for operator, a, b, error in cases:
+            with self.subTest(operator=operator, a=a, b=b):
+                with self.assertRaises(error):
+                    apply(operator, a, b)
+        self.assertEqual(len({error.code for error in OPERATION_ERRORS}), len(OPERATION_ERRORS))
+
+    def test_array_matches_scalar(self):
+        """Verifica se o caminho vetorizado coincide com o escalar, inclusive nos códigos de erro."""
+        a, b = (column.ravel() for column in np.meshgrid(SPECIAL, SPECIAL))
+        rng = np.random.default_rng(3)
+        a = np.concatenate([a, rng.normal(0, 20, 1000), rng.integers(-10, 180, 300)])
+        b = np.concatenate([b, rng.normal(0, 5, 1000), rng.integers(-4, 5, 300)])
+        for operator in SCIENTIFIC:
+            out, errors = evaluate(operator, a, b)
+            expected = [scalar(operator, float(x), float(y)) for x, y in zip(a, b)]
+            with self.subTest(operator=operator):
+                self.assertEqual(errors.tolist(), [code for _, code in expected])
+                # Funções transcendentes podem diferir no último bit entre NumPy e math
+                np.testing.assert_allclose(out, [value for value, _ in expected], rtol=1e-14, atol=0)
+
+        opcodes = rng.integers(0, len(OPERATORS), a.size).astype(np.uint8)
+        out, errors = np.empty_like(a), np.zeros(a.size, dtype=np.uint8)
+        with np.errstate(invalid='ignore'):   # inf * 0 nas operações básicas
+            evaluate_opcodes(a, b, opcodes, out, errors)
+        expected = [scalar(OPERATORS[code], float(x), float(y)) for x, y, code in zip(a, b, opcodes)]
+        self.assertEqual(errors.tolist(), [code for _, code in expected])
+
+    def test_batch_calculator_apply(self):
+        """Testa a BatchCalculator, que não altera os valores quando alguma linha falha."""
+        batch = BatchCalculator([1, 8, 27, 5])
+        np.testing.assert_array_equal(batch.apply('root', 3), [1.0, 2.0, 3.0, 5 ** (1 / 3)])
+        batch = BatchCalculator([10, -1])
+        with self.assertRaisesRegex(DomainError, "logaritmo"):
+            batch.apply('log')
+        np.testing.assert_array_equal(batch.current_values, [10.0, -1.0])  # Nenhum valor alterado
+
+    def test_backends(self):
+        """Testa as operações científicas com os tipos Fraction e Decimal."""
+        fractions = FractionCalculator()
+        self.assertEqual(fractions.apply('^', Fraction(2, 3), Fraction(3)), Fraction(8, 27))
+        self.assertEqual(fractions.apply('!', Fraction(5)), 120)
+        decimals = DecimalCalculator(precision=10)
+        self.assertEqual(str(decimals.apply('log', decimals.parse("100"))), "2.0")
+        with self.assertRaises(DomainError):
+            decimals.apply('ln', decimals.parse("0"))
+
+    def test_fraction_limits(self):
+        """Verifica se as potências exatas grandes demais passam a estourar em vez de travar."""
+        huge = FractionCalculator().apply('^', Fraction(10), Fraction(400))   # Exata, fora do intervalo do float
+        self.assertEqual(huge, 10 ** 400)
+        self.assertEqual(FractionCalculator().apply('^', huge, Fraction(2)), 10 ** 800)  # Ainda exata
+        for operator in SCIENTIFIC[1:]:
+            with self.subTest(operator=operator):
+                with self.assertRaises(ResultOverflowError):
+                    FractionCalculator().apply(operator, huge, Fraction(2))
+        self.assertEqual(FractionCalculator().apply('^', Fraction(1, 2), Fraction(10 ** 9)), 0)  # Em float
+        cases = [
+            ("1 0 ^ 4 0 0 = log", "Resultado grande demais para ser representado."),
+            ("1 0 ^ 5 0 0 0 =", "Resultado grande demais para ser representado."),
+            ("2 ^ 1 0 0 0 0 0 0 0 0 0 =", "Resultado grande demais para ser representado."),
+            ("2 ^ 1 0 0 =", str(2 ** 100)),
+        ]
+        for keys, expected in cases:
+            controller = HeadlessController(FractionCalculator())
+            for key in keys.split():
+                controller.process_input(key)
+            with self.subTest(keys=keys):
+                self.assertEqual(controller.display_text, expected)
+
+    def test_controller_keys(self):
+        """Testa as teclas científicas pelo controlador."""
+        cases = [
+            ("2 ^ 1 0 =", "1024.0"), ("2 7 root 3 =", "3.0"), ("1 0 0 log", "2.0"), ("5 !", "120.0"),
+            ("2 + 3 ^ 2 =", "25.0"), ("1 ln", "0.0"), ("0 cos", "1.0"),
+            ("0 log", "Não é possível calcular o logaritmo de um número menor ou igual a zero."),
+            ("1 7 1 !", "Resultado grande demais para ser representado."),
+        ]
+        for keys, expected in cases:
+            controller = HeadlessController(Calculator())
+            for key in keys.split():
+                controller.process_input(key)
+            with self.subTest(keys=keys):
+                self.assertEqual(controller.display_text, expected)
+
+    def test_macro(self):
+        """Verifica se as macros com operações científicas coincidem com as teclas digitadas."""
+        keys = "9 ^ 2 - 1 = ln".split()
+        macro = Macro(keys)
+        xs = [9.0, 1.0, 0.5, 2.0]
+        values, errors = macro.apply(np.array(xs))
+        for i, x in enumerate(xs):
+            controller = HeadlessController(Calculator())
+            for key in list(str(x)) + keys[1:]:
+                controller.process_input(key)
+            with self.subTest(x=x):
+                if errors[i]:
+                    self.assertEqual(errors[i], DomainError.code)   # ln de 1 - 1 = 0 e de 0.25 - 1 < 0
+                    with self.assertRaises(DomainError):
+                        macro(x)
+                else:
+                    self.assertEqual(macro(x), controller._display_value())
+                    self.assertAlmostEqual(values[i], macro(x), places=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import unittest
+from server import CalculatorService
+
+class TestCalculatorService(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o serviço de rede da calculadora.
+
+    Verifica os formatos de requisição, as respostas de erro e o
+    atendimento de requisições em pipeline por uma conexão TCP.
+    """
+
+    def setUp(self):
+        """Configura um novo serviço com uma sessão aberta antes de cada teste."""
+        self.service = CalculatorService()
+        self.session = self.service.sessions.open()
+
+    def request(self, line):
+        """Envia uma linha ao serviço e decodifica a resposta JSON."""
+        return json.loads(self.service.handle_line(self.session, line.encode()))
+
+    def test_single_operations(self):
+        """Testa operações únicas da Calculator."""
+        self.assertEqual(self.request('{"op": "*", "a": 7, "b": 3}')["result"], 21)
+        self.assertEqual(self.request('{"op": "sqrt", "a": 16}')["result"], 4)
+        self.assertEqual(self.request('{"op": "%", "a": 10, "b": 200}')["result"], 20)
+
+    def test_keys_use_connection_session(self):
+        """Testa se as teclas mantêm o estado da sessão entre requisições."""
+        self.request('{"keys": "1 2 +"}')
+        response = self.request('{"keys": ["3", "="]}')
+        self.assertEqual(response["display"], "15.0")
+
+    def test_expressions_and_ids(self):
+        """Testa expressões em JSON e em texto simples, com o id devolvido."""
+        response = self.request('{"expr": "12*(3+4)/sqrt(16)", "id": 42}')
+        self.assertEqual((response["result"], response["id"]), (21, 42))
+        self.assertEqual(self.request("50+10%")["result"], 55)
+
+    def test_errors(self):
+        """Verifica se os erros viram respostas, sem derrubar a conexão."""
+        self.assertEqual(self.request('{"op": "/", "a": 1, "b": 0}')["error"], "DivisionByZeroError")
+        self.assertEqual(self.request("sqrt(0-4)")["error"], "NegativeNumberSqrtError")
+        self.assertEqual(self.request("2 x 3")["error"], "InvalidExpressionError")
+        for line in ('{bad', '{"x": 1}', '{"op": "+", "a": 1}', '{"keys": ["12", "+"]}',
+                     '{"op": "+", "a": 1e999, "b": 1}', '{"op": "+", "a": NaN, "b": 1}',
+                     '{"op": "+", "a": 1' + '0' * 400 + ', "b": 1}'):
+            response = self.request(line)
+            self.assertFalse(response["ok"])
+            self.assertEqual(response["error"], "InvalidRequest")
+
+    def test_deep_nesting(self):
+        """Verifica se entradas aninhadas demais viram respostas de erro, e não RecursionError."""
+        expression = "(" * 200 + "1" + ")" * 200
+        for line in (expression, json.dumps({"expr": expression})):
+            self.assertEqual(self.request(line), {"ok": False, "error": "InvalidExpressionError",
+                                                  "message": "Expressão aninhada demais (máximo de 100 níveis)."})
+        self.assertEqual(self.request('{"expr": ' + '[' * 100_000)["error"], "InvalidRequest")
+
+    def test_non_finite_results(self):
+        """Verifica se resultados infinitos são enviados como texto, em JSON padrão."""
+        line = self.service.handle_line(self.session, b'{"op": "*", "a": 1e308, "b": 10}')
+        self.assertNotIn(b"Infinity", line)
+        self.assertEqual(json.loads(line)["result"], "inf")
+
+    def test_pipelined_connection(self):
+        """Testa se requisições em pipeline são respondidas na ordem de envio."""
+        async def scenario():
+            server = await asyncio.start_server(
+                lambda r, w: self.service.handle_connection(r, w, max_pipeline=4), "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"".join(f'{{"op": "+", "a": {i}, "b": 1, "id": {i}}}\n'.encode() for i in range(50)))
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(50)]
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return responses
+
+        responses = asyncio.run(scenario())
+        self.assertEqual([r["id"] for r in responses], list(range(50)))
+        self.assertEqual([r["result"] for r in responses], [i + 1 for i in range(50)])
+
+if __name__ == "__main__":
+    unittest.main()
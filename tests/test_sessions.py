@@ -0,0 +1,65 @@
+import random
+import unittest
+from model.calculator import Calculator
+from controller.headless import HeadlessController, KEYS
+from controller.sessions import SessionManager
+
+class TestSessionManager(unittest.TestCase):
+    """
+    Conjunto de testes unitários para o SessionManager.
+
+    Verifica se sessões intercaladas se comportam como controladores
+    independentes e se o encerramento e a expiração funcionam.
+    """
+
+    def setUp(self):
+        """Configura um novo SessionManager antes de cada teste."""
+        self.manager = SessionManager()
+
+    def test_interleaved_sessions_match_controllers(self):
+        """Compara sessões intercaladas com um HeadlessController por sessão."""
+        rng = random.Random(3)
+        sessions = {self.manager.open(): HeadlessController(Calculator()) for _ in range(20)}
+        for _ in range(5000):
+            session, controller = rng.choice(list(sessions.items()))
+            key = rng.choice(KEYS)
+            outcomes = []
+            for process in (lambda: self.manager.process_input(session, key), lambda: controller.process_input(key)):
+                try:
+                    process()
+                    outcomes.append(None)
+                except ValueError:
+                    outcomes.append(ValueError)
+            self.assertEqual(outcomes[0], outcomes[1])
+            self.assertEqual(self.manager.display_text(session), controller.display_text)
+            self.assertEqual(self.manager.current_value(session), controller.calculator.current_value)
+
+    def test_close_invalidates_and_reuses_slot(self):
+        """Verifica se a sessão encerrada é rejeitada e sua posição reutilizada em estado limpo."""
+        session = self.manager.open()
+        for key in "1 2 +".split():
+            self.manager.process_input(session, key)
+        self.manager.close(session)
+        with self.assertRaises(KeyError):
+            self.manager.process_input(session, "1")
+
+        reused = self.manager.open()
+        self.assertNotEqual(reused, session)
+        self.assertEqual(self.manager.display_text(reused), "0")
+        self.manager.process_input(reused, "=")
+        self.assertEqual(self.manager.current_value(reused), 0.0)
+        self.assertEqual(len(self.manager), 1)
+
+    def test_evict_idle(self):
+        """Verifica se apenas as sessões inativas são encerradas."""
+        idle = self.manager.open()
+        active = self.manager.open()
+        self.manager._last_seen[idle & 0xFFFFFFFF] -= 120
+        self.assertEqual(self.manager.evict_idle(60), 1)
+        with self.assertRaises(KeyError):
+            self.manager.display_text(idle)
+        self.assertEqual(self.manager.display_text(active), "0")
+        self.assertEqual(self.manager.evict_idle(60), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+from fractions import Fraction
+from model.backends import FractionCalculator
+from model.worksheet import Worksheet
+from model.exceptions import DivisionByZeroError, NegativeNumberSqrtError, CircularReferenceError
+
+class TestWorksheet(unittest.TestCase):
+    """
+    Conjunto de testes unitários para a planilha incremental (Worksheet).
+
+    Verifica as fórmulas, o recálculo apenas das células afetadas, a
+    interrupção da propagação quando o valor não muda, os erros e os ciclos.
+    """
+
+    def setUp(self):
+        """Monta uma planilha de preço: subtotal = preço * quantidade, total = subtotal + 10% do subtotal."""
+        self.sheet = Worksheet()
+        self.sheet.set_value("preco", 20)
+        self.sheet.set_value("quantidade", 3)
+        self.sheet.set_value("imposto", 10)
+        self.sheet.set_formula("subtotal", "*", "preco", "quantidade")
+        self.sheet.set_formula("valor_imposto", "%", "imposto", "subtotal")
+        self.sheet.set_formula("total", "+", "subtotal", "valor_imposto")
+
+    def test_formulas(self):
+        """Testa o cálculo das fórmulas, com referências e constantes."""
+        self.assertEqual(self.sheet.value("subtotal"), 60)
+        self.assertEqual(self.sheet.value("valor_imposto"), 6)
+        self.assertEqual(self.sheet.value("total"), 66)
+        self.sheet.set_formula("raiz", "sqrt", 16)
+        self.sheet.set_formula("soma", "+", 1, "raiz", 2.5)
+        self.assertEqual(self.sheet.value("soma"), 7.5)
+
+    def test_recomputes_only_affected_cells(self):
+        """Verifica se só as células que dependem da alteração são recalculadas."""
+        self.sheet.set_value("outro", 1)
+        self.sheet.set_formula("independente", "+", "outro", 1)
+        self.sheet.recalculate()
+
+        self.sheet.set_value("quantidade", 4)
+        self.assertEqual(self.sheet.value("total"), 88)
+        self.assertEqual(self.sheet.last_recomputed, 3)
+
+        self.sheet.set_value("outro", 2)
+        self.assertEqual(self.sheet.value("independente"), 3)
+        self.assertEqual(self.sheet.last_recomputed, 1)
+
+    def test_unchanged_results_stop_propagation(self):
+        """Verifica se um resultado inalterado interrompe a propagação."""
+        self.sheet.recalculate()
+        self.sheet.set_value("quantidade", 3)  # Mesmo valor: nada a recalcular
+        self.assertEqual(self.sheet.recalculate(), 0)
+
+        # preco e quantidade trocados mantêm o subtotal: as células abaixo não são recalculadas
+        self.sheet.set_value("preco", 3)
+        self.sheet.set_value("quantidade", 20)
+        self.assertEqual(self.sheet.recalculate(), 1)
+        self.assertEqual(self.sheet.value("total"), 66)
+
+    def test_topological_order_after_redefinition(self):
+        """Verifica se a ordem de cálculo acompanha as fórmulas redefinidas."""
+        self.sheet.set_value("desconto", 5)
+        self.sheet.set_formula("subtotal_liquido", "-", "total", "desconto")
+        # preco passa a depender de uma célula nova, mais abaixo na ordem
+        self.sheet.set_value("base", 10)
+        self.sheet.set_formula("base_dobrada", "*", "base", 2)
+        self.sheet.set_formula("preco", "+", "base_dobrada", 0)
+        self.assertEqual(self.sheet.value("subtotal_liquido"), 61)
+        self.sheet.set_value("base", 5)
+        self.assertEqual(self.sheet.value("subtotal_liquido"), 28)
+
+    def test_errors_propagate_and_recover(self):
+        """Verifica se os erros se propagam às dependentes e somem quando a causa é corrigida."""
+        self.sheet.set_value("divisor", 0)
+        self.sheet.set_formula("unitario", "/", "total", "divisor")
+        self.sheet.set_formula("final", "+", "unitario", 1)
+        with self.assertRaises(DivisionByZeroError):
+            self.sheet.value("final")
+        self.assertIsInstance(self.sheet.error("unitario"), DivisionByZeroError)
+
+        self.sheet.set_value("divisor", 2)
+        self.assertEqual(self.sheet.value("final"), 34)
+        self.assertIsNone(self.sheet.error("final"))
+
+        self.sheet.set_formula("raiz", "sqrt", -1)
+        with self.assertRaises(NegativeNumberSqrtError):
+            self.sheet.value("raiz")
+
+    def test_cycles(self):
+        """Verifica se as referências circulares são recusadas sem corromper a planilha."""
+        with self.assertRaises(CircularReferenceError):
+            self.sheet.set_formula("preco", "*", "total", 2)
+        with self.assertRaises(CircularReferenceError):
+            self.sheet.set_formula("total", "+", "total", 1)
+        # A planilha continua consistente após a recusa
+        self.sheet.set_value("preco", 10)
+        self.assertEqual(self.sheet.value("total"), 33)
+
+    def test_invalid_formulas(self):
+        """Verifica se as fórmulas inválidas são recusadas."""
+        with self.assertRaises(KeyError):
+            self.sheet.set_formula("x", "+", "inexistente", 1)
+        with self.assertRaises(ValueError):
+            self.sheet.set_formula("x", "**", 1, 2)
+        with self.assertRaises(ValueError):
+            self.sheet.set_formula("x", "sqrt", 1, 2)
+        with self.assertRaises(ValueError):
+            self.sheet.set_formula("x", "+", 1)
+        self.assertNotIn("x", self.sheet)
+
+    def test_formula_cell_becomes_value(self):
+        """Verifica se uma célula de fórmula pode virar um valor fixo."""
+        self.sheet.set_value("subtotal", 100)
+        self.assertEqual(self.sheet.value("total"), 110)
+        self.sheet.set_value("preco", 1)
+        self.assertEqual(self.sheet.value("total"), 110)
+
+    def test_exact_backend(self):
+        """Testa a planilha com o tipo numérico exato de frações."""
+        sheet = Worksheet(FractionCalculator())
+        sheet.set_value("a", Fraction(1, 10))
+        sheet.set_value("b", Fraction(2, 10))
+        sheet.set_formula("soma", "+", "a", "b")
+        self.assertEqual(sheet.value("soma"), Fraction(3, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()